@@ -23,7 +23,7 @@ def verify_all_tools() -> int:
     failed: list[str] = []
 
     for tool_id, config in TOOLS_REGISTRY.items():
-        flag = config["flags"][0]
+        flag = config.flags[0]
         args = ["--warn-only"] if tool_id == "security-scan" else ["--help"]
         cmd = [sys.executable, "-m", "tools.toolbelt", flag, *args]
         result = subprocess.run(cmd, cwd=str(ROOT), env=env, capture_output=True, text=True)
@@ -5,8 +5,10 @@ Pack Messaging - Wolf-to-wolf communication system.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -134,7 +136,8 @@ class MessageQueue:
         self,
         wolf_id: str,
         unheard_only: bool = False,
-        limit: int = 50
+        limit: Optional[int] = 50,
+        older_than: Optional[timedelta] = None
     ) -> List[Howl]:
         """
         🐺 Listen for incoming howls.
@@ -142,42 +145,117 @@ class MessageQueue:
         Args:
             wolf_id: Wolf listening
             unheard_only: Only unheard howls
-            limit: Max howls to return
+            limit: Max howls to return (None for no limit)
+            older_than: Only howls at least this old
             
         Returns:
             List of howls
         """
         inbox = self.territory / wolf_id / "incoming"
-        if not inbox.exists():
+        return self._scan_inbox(inbox, unheard_only, limit, older_than)
+    
+    def listen_all(
+        self,
+        unheard_only: bool = False,
+        limit: Optional[int] = 50,
+        older_than: Optional[timedelta] = None,
+        max_workers: int = 8
+    ) -> Dict[str, List[Howl]]:
+        """
+        🐺 Listen for incoming howls across the whole pack in one pass.
+        
+        Inboxes are read concurrently, since the scan is file I/O bound.
+        
+        Args:
+            unheard_only: Only unheard howls
+            limit: Max howls to return per wolf (None for no limit)
+            older_than: Only howls at least this old
+            max_workers: Inboxes scanned in parallel (1 for sequential)
+            
+        Returns:
+            Dict of wolf ID -> list of howls (wolves without howls omitted)
+        """
+        pack_howls: Dict[str, List[Howl]] = {}
+        try:
+            dens = [entry for entry in os.scandir(self.territory) if entry.is_dir()]
+        except OSError:
+            return pack_howls
+        
+        def scan(den: os.DirEntry) -> List[Howl]:
+            inbox = Path(den.path, "incoming")
+            return self._scan_inbox(inbox, unheard_only, limit, older_than)
+        
+        if max_workers > 1 and len(dens) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(dens))) as executor:
+                results = list(executor.map(scan, dens))
+        else:
+            results = [scan(den) for den in dens]
+        
+        for den, howls in zip(dens, results):
+            if howls:
+                pack_howls[den.name] = howls
+        
+        return pack_howls
+    
+    def _scan_inbox(
+        self,
+        inbox: Path,
+        unheard_only: bool,
+        limit: Optional[int],
+        older_than: Optional[timedelta]
+    ) -> List[Howl]:
+        """Load howls from one inbox, newest first."""
+        try:
+            names = [
+                entry.name for entry in os.scandir(inbox)
+                if entry.name.endswith(".json")
+            ]
+        except OSError:
             return []
         
+        cutoff = datetime.now() - older_than if older_than is not None else None
         howls = []
-        for howl_file in sorted(inbox.glob("*.json"), reverse=True):
-            if len(howls) >= limit:
+        for name in sorted(names, reverse=True):
+            if limit is not None and len(howls) >= limit:
                 break
             
-            try:
-                data = json.loads(howl_file.read_text())
-                if unheard_only and data.get("heard"):
+            # Howl IDs embed their send time, so too-recent howls are
+            # skipped without reading or parsing the file
+            if cutoff is not None:
+                sent = _howl_id_time(name)
+                if sent is not None and sent >= cutoff:
                     continue
-                
-                msg = Howl(
-                    id=data["id"],
-                    sender=data["sender"],
-                    recipient=data["recipient"],
-                    content=data["content"],
-                    howl_type=HowlType(data.get("howl_type", "w2w")),
-                    urgency=HowlUrgency(data.get("urgency", 3)),
-                    timestamp=datetime.fromisoformat(data["timestamp"]),
-                    metadata=data.get("metadata", {}),
-                    heard=data.get("heard", False)
-                )
-                howls.append(msg)
-            except Exception:
-                pass
+            
+            msg = self._read_howl(inbox / name, unheard_only)
+            if msg is None:
+                continue
+            if cutoff is not None and msg.timestamp >= cutoff:
+                continue
+            howls.append(msg)
         
         return howls
     
+    def _read_howl(self, howl_file: Path, unheard_only: bool = False) -> Optional[Howl]:
+        """Load a howl file, or None if unreadable or filtered out."""
+        try:
+            data = json.loads(howl_file.read_text())
+            if unheard_only and data.get("heard"):
+                return None
+            
+            return Howl(
+                id=data["id"],
+                sender=data["sender"],
+                recipient=data["recipient"],
+                content=data["content"],
+                howl_type=HowlType(data.get("howl_type", "w2w")),
+                urgency=HowlUrgency(data.get("urgency", 3)),
+                timestamp=datetime.fromisoformat(data["timestamp"]),
+                metadata=data.get("metadata", {}),
+                heard=data.get("heard", False)
+            )
+        except Exception:
+            return None
+    
     def mark_heard(self, howl_id: str, wolf_id: str) -> bool:
         """Mark a howl as heard."""
         howl_file = self.territory / wolf_id / "incoming" / f"{howl_id}.json"
@@ -197,6 +275,20 @@ class MessageQueue:
         return len(self.listen(wolf_id, unheard_only=True))
 
 
+def _howl_id_time(file_name: str) -> Optional[datetime]:
+    """
+    Send time encoded in a howl file name (``howl_YYYYmmddHHMMSS_N.json``).
+    
+    Truncated to the second, so it never exceeds the howl's real timestamp.
+    """
+    if not file_name.startswith("howl_"):
+        return None
+    try:
+        return datetime.strptime(file_name[5:19], "%Y%m%d%H%M%S")
+    except ValueError:
+        return None
+
+
 # Convenience functions
 _default_queue: Optional[MessageQueue] = None
 
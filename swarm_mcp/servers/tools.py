@@ -60,10 +60,10 @@ def list_available_tools() -> Dict[str, Any]:
     tools_list = []
     for key, config in TOOLS_REGISTRY.items():
         tools_list.append({
-            "name": config["name"],
+            "name": config.name,
             "id": key,
-            "description": config["description"],
-            "flags": config["flags"]
+            "description": config.description,
+            "flags": config.flags
         })
     return {"count": len(tools_list), "tools": tools_list}
 
@@ -108,7 +108,7 @@ def main():
 
     for mcp_name, tool_id in high_value_mappings.items():
         if tool_id in TOOLS_REGISTRY:
-            desc = TOOLS_REGISTRY[tool_id]["description"]
+            desc = TOOLS_REGISTRY[tool_id].description
             mcp_tools[mcp_name] = {
                 "description": f"Execute {desc}",
                 "inputSchema": {
@@ -162,7 +162,7 @@ def main():
                     
                     if tid in TOOLS_REGISTRY:
                         # Use the first flag
-                        flag = TOOLS_REGISTRY[tid]["flags"][0]
+                        flag = TOOLS_REGISTRY[tid].flags[0]
                         result = execute_toolbelt(flag, extra_args)
                     else:
                         result = {"success": False, "error": f"Tool '{tid}' not found"}
@@ -170,7 +170,7 @@ def main():
                 elif tool_name in high_value_mappings:
                     tid = high_value_mappings[tool_name]
                     extra_args = arguments.get("args", "").split() if arguments.get("args") else []
-                    flag = TOOLS_REGISTRY[tid]["flags"][0]
+                    flag = TOOLS_REGISTRY[tid].flags[0]
                     result = execute_toolbelt(flag, extra_args)
                 
                 else:
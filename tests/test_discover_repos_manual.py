@@ -0,0 +1,77 @@
+import subprocess
+
+import pytest
+from tools.migration.discover_repos_manual import clone_repo, remove_origin_remote
+
+
+def git(*args, cwd=None):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    work = tmp_path / "work"
+    git("init", "-q", "-b", "main", str(work))
+    (work / "README.md").write_text("hello\n")
+    git("add", "README.md", cwd=work)
+    git("commit", "-qm", "init", cwd=work)
+    git("branch", "feature", cwd=work)
+    bare = tmp_path / "upstream.git"
+    git("clone", "-q", "--bare", str(work), str(bare))
+    return bare
+
+
+def make_clone(upstream, path):
+    git("clone", "-q", str(upstream), str(path))
+    # A second tracking branch, a local-only branch with its own config,
+    # and an unrelated remote that must all survive
+    git("checkout", "-q", "-b", "feature", "--track", "origin/feature", cwd=path)
+    git("branch", "local-only", cwd=path)
+    git("config", "branch.local-only.description", "keep me", cwd=path)
+    git("remote", "add", "upstream", "https://example.com/other.git", cwd=path)
+    git("pack-refs", "--all", cwd=path)  # Exercise packed-refs cleanup too
+    git("fetch", "-q", "origin", cwd=path)
+    return path
+
+
+def test_remove_origin_remote_matches_git(tmp_path, upstream):
+    expected = make_clone(upstream, tmp_path / "expected")
+    actual = make_clone(upstream, tmp_path / "actual")
+
+    git("remote", "remove", "origin", cwd=expected)
+    remove_origin_remote(actual)
+
+    config = lambda repo: sorted(git("config", "--local", "--list", cwd=repo).splitlines())
+    refs = lambda repo: git("for-each-ref", "--format=%(refname)", cwd=repo).splitlines()
+    assert config(actual) == config(expected)
+    assert refs(actual) == refs(expected)
+    assert not any(line.startswith(("remote.origin.", "branch.main.remote", "branch.main.merge"))
+                   for line in config(actual))
+    assert "branch.local-only.description=keep me" in config(actual)
+    assert "remote.upstream.url=https://example.com/other.git" in config(actual)
+
+
+def test_blobless_clone_keeps_origin_for_blobs_but_not_pushes(tmp_path, upstream, monkeypatch):
+    git("config", "uploadpack.allowFilter", "true", cwd=upstream)
+    # A second README version, so the first one's blob is not checked out
+    work = tmp_path / "update"
+    git("clone", "-q", str(upstream), str(work))
+    (work / "README.md").write_text("hello again\n")
+    git("commit", "-qam", "update", cwd=work)
+    git("push", "-q", "origin", "main", cwd=work)
+    # Point the GitHub URL clone_repo builds at the local bare repo
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", f"url.file://{tmp_path}/.insteadOf")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "https://github.com/acct/")
+    target = tmp_path / "clones"
+    target.mkdir()
+
+    assert clone_repo("upstream", "acct", target, blobless=True, verbose=False)
+    clone = target / "upstream"
+
+    assert "+hello\n" in git("log", "-p", cwd=clone)
+    with pytest.raises(subprocess.CalledProcessError):
+        git("push", "origin", "main", cwd=clone)
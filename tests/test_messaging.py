@@ -0,0 +1,59 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from swarm_mcp.core.messaging import MessageQueue
+
+@pytest.fixture
+def queue(tmp_path):
+    return MessageQueue(territory=str(tmp_path / "pack_messages"))
+
+def test_listen_all_groups_howls_by_wolf(queue):
+    queue.send("alpha", "scout-1", "first")
+    queue.send("alpha", "scout-1", "second")
+    queue.send("alpha", "scout-2", "third")
+
+    pack = queue.listen_all()
+
+    assert set(pack) == {"scout-1", "scout-2"}
+    assert [h.content for h in pack["scout-1"]] == [h.content for h in queue.listen("scout-1")]
+    assert [h.content for h in pack["scout-2"]] == ["third"]
+
+def test_listen_all_unheard_only_skips_heard(queue):
+    heard = queue.send("alpha", "scout-1", "old news")
+    queue.send("alpha", "scout-2", "fresh")
+    queue.mark_heard(heard.id, "scout-1")
+
+    pack = queue.listen_all(unheard_only=True)
+
+    assert "scout-1" not in pack
+    assert [h.content for h in pack["scout-2"]] == ["fresh"]
+
+def test_listen_older_than_filters_recent_howls(queue):
+    queue.send("alpha", "scout-1", "just now")
+    stale_time = datetime.now() - timedelta(hours=1)
+    stale_id = f"howl_{stale_time.strftime('%Y%m%d%H%M%S')}_1"
+    inbox = queue.territory / "scout-1" / "incoming"
+    (inbox / f"{stale_id}.json").write_text(json.dumps({
+        "id": stale_id,
+        "sender": "alpha",
+        "recipient": "scout-1",
+        "content": "an hour ago",
+        "timestamp": stale_time.isoformat(),
+        "heard": False,
+    }))
+
+    old = queue.listen("scout-1", unheard_only=True, older_than=timedelta(minutes=15))
+
+    assert [h.content for h in old] == ["an hour ago"]
+    assert queue.listen_all(older_than=timedelta(hours=2)) == {}
+
+def test_listen_all_sequential_matches_parallel(queue):
+    for wolf in ("scout-1", "scout-2", "scout-3"):
+        queue.send("alpha", wolf, f"hello {wolf}")
+
+    parallel = queue.listen_all(max_workers=4)
+    sequential = queue.listen_all(max_workers=1)
+
+    assert {w: [h.id for h in hs] for w, hs in parallel.items()} == \
+        {w: [h.id for h in hs] for w, hs in sequential.items()}
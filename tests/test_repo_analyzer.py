@@ -0,0 +1,133 @@
+import subprocess
+from pathlib import Path
+
+from tools.migration import repo_analyzer
+from tools.migration.repo_analyzer import (
+    RepoAnalyzer,
+    RepoMetadata,
+    _IndicatorMatcher,
+    _lsh_candidate_pairs,
+    _minhash,
+    _near_duplicate_groups,
+)
+
+
+def test_requirements_parsing_handles_comments_extras_and_markers(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "requirements.txt").write_bytes(
+        b"# pinned for prod\n"
+        b"requests  # http client\n"
+        b"Django>=4.2,<5  # web\n"
+        b"uvicorn[standard]==0.29\r\n"
+        b"pywin32; sys_platform == 'win32'\n"
+        b"black ~= 24.1\n"
+        b"-r dev-requirements.txt\n"
+        b"-e git+https://github.com/example/pkg.git#egg=pkg\n"
+        b"https://example.com/wheel.whl\n"
+        b"\n"
+    )
+    metadata = RepoMetadata(name="repo", path=repo)
+
+    RepoAnalyzer(tmp_path, use_cache=False)._detect_dependencies(repo, metadata)
+
+    assert metadata.dependencies == {"requests", "django", "uvicorn", "pywin32", "black"}
+
+
+def make_repo(path, files):
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    commit_files(path, files)
+    return path
+
+
+def commit_files(path, files):
+    for name, text in files.items():
+        (path / name).write_text(text)
+    subprocess.run(["git", "add", "-A"], cwd=path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-qm", "update"],
+        cwd=path, check=True,
+    )
+
+
+def test_indicator_matcher_matches_names_suffixes_and_fragments():
+    matcher = _IndicatorMatcher([
+        ("manage.py", "django"), (".py", "python"), ("test_", "pytest"),
+        ("_test.py", "pytest"), (".test.js", "jest"), (".spec.js", "jest"),
+        ("Test.java", "junit"), ("jest", "jest"),
+    ])
+
+    assert matcher.match({"manage.py", "test_app.py"}, {".py"}) == {"django", "python", "pytest"}
+    assert matcher.match({"app.spec.js", "UserTest.java"}, {".js"}) == {"jest", "junit"}
+    assert matcher.match({"jest"}, set()) == {"jest"}
+    assert matcher.match({"latest.py", "Testing.java", "contest_py", "jest.config"}, {".js"}) == set()
+
+
+def test_analyze_all_reuses_cache_until_repo_changes(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repo_analyzer, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(repo_analyzer, "INDEX_CACHE_DIR", cache_dir / "repo_index")
+    monkeypatch.setattr(repo_analyzer, "META_CACHE_DB", cache_dir / "repo_meta.db")
+    repo = make_repo(tmp_path / "repos" / "app", {"main.py": "print('hi')\n"})
+    analyzed = []
+    real_analyze = RepoAnalyzer.analyze_repo
+    monkeypatch.setattr(
+        RepoAnalyzer, "analyze_repo",
+        lambda self, path: analyzed.append(path.name) or real_analyze(self, path),
+    )
+
+    first = RepoAnalyzer(tmp_path / "repos").analyze_all(jobs=1)["app"]
+    cached = RepoAnalyzer(tmp_path / "repos").analyze_all(jobs=1)["app"]
+    assert analyzed == ["app"]
+    assert cached.to_dict() == first.to_dict() and cached.minhash == first.minhash
+    assert (cache_dir / "repo_meta.db").exists() and list((cache_dir / "repo_index").glob("*.json"))
+
+    commit_files(repo, {"util.py": "x = 1\ny = 2\n"})
+    changed = RepoAnalyzer(tmp_path / "repos").analyze_all(jobs=1)["app"]
+    assert analyzed == ["app", "app"]
+    assert changed.file_count == first.file_count + 1
+    assert changed.total_lines == first.total_lines + 2
+
+
+def near_duplicate_repos(tokens_by_name):
+    repos = {}
+    for name, tokens in tokens_by_name.items():
+        repos[name] = RepoMetadata(name=name, path=Path(name), minhash=_minhash(tokens))
+    return repos
+
+
+def test_minhash_groups_near_duplicates_only():
+    base = {f"file:{i}" for i in range(100)}
+    tweaked = (base - {f"file:{i}" for i in range(5)}) | {f"file:new{i}" for i in range(5)}
+    distinct = {f"dep:{i}" for i in range(100)}
+    repos = near_duplicate_repos({"base": base, "tweaked": tweaked, "distinct": distinct})
+
+    assert _minhash(set()) == []
+    assert len(repos["base"].minhash) == 128
+    assert _minhash(set(base)) == repos["base"].minhash
+    candidates = _lsh_candidate_pairs(repos)
+    assert ("base", "tweaked") in candidates
+    assert _near_duplicate_groups(repos, candidates) == [["base", "tweaked"]]
+    agreement = sum(a == b for a, b in zip(repos["base"].minhash, repos["tweaked"].minhash)) / 128
+    assert 0.75 < agreement <= 1.0  # True Jaccard is 95/105 ~ 0.9
+
+
+def test_cached_status_is_reassessed(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repo_analyzer, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(repo_analyzer, "INDEX_CACHE_DIR", cache_dir / "repo_index")
+    monkeypatch.setattr(repo_analyzer, "META_CACHE_DB", cache_dir / "repo_meta.db")
+    repo = make_repo(tmp_path / "repos" / "app", {"README.md": "# app\n"})
+    RepoAnalyzer(tmp_path / "repos").analyze_all(jobs=1)
+
+    # Stored while the last commit was recent; it has aged out of "active" since
+    cache = repo_analyzer._MetadataCache()
+    stored = cache.get(repo)
+    stored.commit_count = 10
+    stored.last_commit = "2020-01-01T00:00:00+00:00"
+    stored.status = "active"
+    cache.put(stored)
+    cache.close()
+
+    assert RepoAnalyzer(tmp_path / "repos").analyze_all(jobs=1)["app"].status == "archived"
@@ -0,0 +1,59 @@
+import subprocess
+
+import pytest
+from tools.migration.repo_migration_helper import RepoMigrationHelper
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    repo = tmp_path / "upstream"
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "README.md").write_text("hello\n")
+    git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["add", "README.md"], check=True)
+    subprocess.run(git + ["commit", "-qm", "init"], check=True)
+    subprocess.run(git + ["tag", "v1"], check=True)
+    subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "second"], check=True)
+    return repo
+
+
+def test_clone_from_list_reports_failures_and_exceptions(tmp_path, upstream, capsys, monkeypatch):
+    helper = RepoMigrationHelper(review_dir=str(tmp_path / "review"))
+    repo_list = tmp_path / "repos.txt"
+    repo_list.write_text("upstream\nmissing\nexplodes\n")
+
+    real_clone = helper.clone_repo
+
+    def clone_repo(repo_name, clone_url=None, save=True):
+        if repo_name == "explodes":
+            raise RuntimeError("boom")
+        return real_clone(repo_name, f"file://{tmp_path}/{repo_name}", save)
+
+    monkeypatch.setattr(helper, "clone_repo", clone_repo)
+    helper.clone_from_list(str(repo_list), jobs=2)
+
+    out = capsys.readouterr().out
+    assert "1 succeeded, 2 failed" in out
+    assert "Error cloning explodes: boom" in out
+    assert list(helper.status["repos"]) == ["upstream"]
+
+
+def test_publish_script_restores_history_and_tags_of_shallow_clones(tmp_path, upstream, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    helper = RepoMigrationHelper(review_dir=str(tmp_path / "review"))
+    url = f"file://{upstream}"
+    assert helper.clone_repo("upstream", url)
+    clone = tmp_path / "review" / "upstream"
+    helper.status["repos"]["upstream"]["ready_for_publication"] = True
+
+    helper.generate_publish_script(str(tmp_path / "publish.sh"))
+
+    fetch = [line for line in (tmp_path / "publish.sh").read_text().splitlines()
+             if line.startswith("git fetch")]
+    assert fetch == [f"git fetch --unshallow --tags {url}"]
+    subprocess.run(fetch[0].split() + ["-q"], cwd=clone, check=True)
+    git = lambda *args: subprocess.run(["git", *args], cwd=clone, check=True,
+                                       capture_output=True, text=True).stdout.split()
+    assert git("tag") == ["v1"]
+    assert git("rev-parse", "--is-shallow-repository") == ["false"]
+    assert len(git("rev-list", "HEAD")) == 2
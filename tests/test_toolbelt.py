@@ -21,6 +21,8 @@ class TestToolbelt:
         # Check flags mapping
         assert registry.get_tool_for_flag("--monitor")["id"] == "monitor"
         assert registry.get_tool_for_flag("-m")["id"] == "monitor"
+        assert registry.get_tool_by_name("monitor") is registry.get_tool_for_flag("-m")
+        assert registry.get_tool_by_name("no-such-tool") is None
 
     def test_registry_paths_exist(self):
         """Test that all registered tool modules actually exist."""
@@ -28,7 +30,7 @@ class TestToolbelt:
         workspace_root = Path(__file__).parent.parent
         
         for tool_id, config in registry.tools.items():
-            module_path = config["module"].replace(".", "/") + ".py"
+            module_path = config.module.replace(".", "/") + ".py"
             full_path = workspace_root / module_path
             assert full_path.exists(), f"Tool {tool_id} module missing: {module_path}"
 
@@ -59,3 +61,24 @@ class TestToolbelt:
         """Test that tool listing runs without error."""
         with patch("sys.argv", ["tools/cli.py", "--list"]):
             assert main() == 0
+
+    def test_load_tool_resolves_and_caches_entry_point(self):
+        """load_tool imports the module once and returns its entry point."""
+        from tools.toolbelt.cli import onboarding_cli
+        from tools.toolbelt_registry import get_registry
+
+        registry = get_registry()
+        assert get_registry() is registry
+
+        entry_point = registry.load_tool("onboard-status")
+        assert entry_point is onboarding_cli.cmd_status
+        assert registry.load_tool("onboard-status") is entry_point
+
+    def test_duplicate_flags_are_rejected(self):
+        """Two tools claiming one flag is an error, not a silent overwrite."""
+        from tools.toolbelt_registry import TOOLS_REGISTRY, _index_flags
+
+        clash = dict(TOOLS_REGISTRY)
+        clash["monitor-copy"] = TOOLS_REGISTRY["monitor"]._replace(flags=["-m"])
+        with pytest.raises(ValueError, match="Duplicate flag -m"):
+            _index_flags(clash)
@@ -0,0 +1,207 @@
+import ast
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from tools.validation import unified_validator
+from tools.validation.unified_validator import UnifiedValidator
+
+
+@pytest.fixture(autouse=True)
+def parse_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "parse_cache"
+    monkeypatch.setattr(unified_validator, "PARSE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def src_tree(tmp_path):
+    tmp_path = tmp_path / "src"
+    tmp_path.mkdir()
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "old.py").write_text(
+        "import os\nfrom src.core.config_core import get_config\n"
+    )
+    (tmp_path / "pkg" / "new.py").write_text(
+        "def load():\n    from src.core.config_ssot import get_config\n"
+    )
+    (tmp_path / "broken.py").write_text("from src.core.config_core import (\n")
+    (tmp_path / "unrelated.py").write_text("def unrelated(:\n")
+    return tmp_path
+
+
+def test_ssot_config_flags_deprecated_and_valid_imports(src_tree):
+    results = UnifiedValidator().validate_ssot_config(dir_path=src_tree, jobs=1)
+
+    assert results["files_checked"] == 3  # unrelated.py is counted without parsing
+    assert results["status"] == "VIOLATIONS_FOUND"
+    assert [(v["file"], v["line"]) for v in results["violations"]] == \
+        [(str(src_tree / "pkg" / "old.py"), 2)]
+    assert [v["file"] for v in results["valid_imports"]] == [str(src_tree / "pkg" / "new.py")]
+    assert [w["file"] for w in results["warnings"]] == [str(src_tree / "broken.py")]
+
+
+def test_ssot_config_parallel_matches_serial(src_tree, monkeypatch):
+    monkeypatch.setattr(unified_validator, "PARALLEL_PARSE_MIN_FILES", 1)
+    validator = UnifiedValidator(use_cache=False)
+
+    serial = validator.validate_ssot_config(dir_path=src_tree, jobs=1)
+    parallel = validator.validate_ssot_config(dir_path=src_tree, jobs=2)
+
+    for key in ("files_checked", "violations", "valid_imports", "warnings", "status"):
+        assert parallel[key] == serial[key]
+
+
+def test_parse_cache_skips_unchanged_files(src_tree, parse_cache, monkeypatch):
+    parsed = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, "parse", lambda *args, **kwargs: parsed.append(1) or real_parse(*args, **kwargs))
+    validator = UnifiedValidator()
+    target = src_tree / "pkg" / "old.py"
+
+    first = validator.validate_imports(str(target))
+    again = validator.validate_imports(str(target))
+    assert again["imports"] == first["imports"]
+    assert len(parsed) == 1
+    assert len(list(parse_cache.glob("*.json"))) == 1
+
+    target.write_text("import sys\n")
+    assert [i["module"] for i in validator.validate_imports(str(target))["imports"]] == ["sys"]
+    assert len(parsed) == 2
+
+
+@pytest.mark.parametrize("entry", [b"not json", b'[["import", "os"]]', b'[["exec", "os", [], 1]]', b"{}"])
+def test_corrupt_parse_cache_entry_is_reparsed(src_tree, parse_cache, entry):
+    validator = UnifiedValidator()
+    target = src_tree / "pkg" / "old.py"
+    expected = validator.validate_imports(str(target))["imports"]
+    (cache_file,) = parse_cache.glob("*.json")
+    cache_file.write_bytes(entry)
+
+    assert validator.validate_imports(str(target))["imports"] == expected
+    results = validator.validate_ssot_config(file_path=target, jobs=1)
+    assert results["warnings"] == [] and len(results["violations"]) == 1
+
+
+def test_tracker_status_flags_todo_markers(tmp_path):
+    docs_org = tmp_path / "docs" / "organization"
+    docs_org.mkdir(parents=True)
+    (docs_org / "A_TRACKER.md").write_text("- ship it (FIXME)\n")
+    (docs_org / "B_TRACKER.md").write_text("all done\n")
+    (docs_org / "C_TRACKER.md").write_text("")
+    validator = UnifiedValidator()
+    validator.project_root = tmp_path
+
+    results = validator.validate_tracker_status()
+
+    assert results["trackers_found"] == 3
+    assert [issue["file"] for issue in results["issues"]] == ["A_TRACKER.md"]
+    assert results["status"] == "ISSUES_FOUND"
+
+
+@pytest.mark.parametrize("queue", [
+    '[{"id": 1, "tags": ["a"]}, 2, [3], null]',
+    '{"messages": [{"id": 1, "body": {"messages": [1, 2]}}, {"id": 2}]}',
+    '{"messages": {"a": 1, "b": {"c": 2}}}',
+    '{"messages": {"item": [1, 2], "other": {"item": 3}}}',
+    '{"other": []}',
+])
+def test_streamed_queue_size_matches_full_parse(tmp_path, queue):
+    pytest.importorskip("ijson")
+    queue_file = tmp_path / "queue.json"
+    queue_file.write_text(queue)
+    data = json.loads(queue)
+    expected = len(data) if isinstance(data, list) else len(data.get("messages", []))
+
+    assert unified_validator._stream_queue_size(queue_file) == expected
+
+
+def test_incremental_ssot_reuses_unchanged_files(src_tree, monkeypatch):
+    validator = UnifiedValidator()
+    first = validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+
+    scanned = []
+    real_scan = unified_validator._scan_ssot_file
+    monkeypatch.setattr(
+        unified_validator, "_scan_ssot_file",
+        lambda path, use_cache=True: scanned.append(path) or real_scan(path, use_cache),
+    )
+    again = validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    assert scanned == []
+    assert again["violations"] == first["violations"]
+    assert again["files_checked"] == first["files_checked"]
+
+    old = src_tree / "pkg" / "old.py"
+    old.write_text("import os\n\n\nfrom src.core.config_core import get_config\n")
+    changed = validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    assert scanned == [str(old)]
+    assert [v["line"] for v in changed["violations"]] == [4]
+
+
+def test_incremental_ssot_index_drops_errors_and_deleted_files(src_tree, parse_cache, monkeypatch):
+    validator = UnifiedValidator()
+    flaky = src_tree / "pkg" / "flaky.py"
+    flaky.write_text("from src.core.config_core import get_config\n")
+    real_scan = unified_validator._scan_ssot_file
+    monkeypatch.setattr(
+        unified_validator, "_scan_ssot_file",
+        lambda path, use_cache=True: (
+            {"checked": 0, "violations": [], "valid_imports": [],
+             "warnings": [{"file": path, "message": "Permission denied"}]}
+            if path == str(flaky) else real_scan(path, use_cache)
+        ),
+    )
+    first = validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    assert [w["message"] for w in first["warnings"] if w["file"] == str(flaky)] == ["Permission denied"]
+
+    monkeypatch.setattr(unified_validator, "_scan_ssot_file", real_scan)
+    (src_tree / "pkg" / "new.py").unlink()
+    again = validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    assert sorted(v["file"] for v in again["violations"]) == sorted([str(src_tree / "pkg" / "old.py"), str(flaky)])
+    assert [w["file"] for w in again["warnings"]] == [str(src_tree / "broken.py")]
+
+    index = json.loads((parse_cache / unified_validator.SSOT_INDEX_NAME).read_text())["files"]
+    assert str(src_tree / "pkg" / "new.py") not in index
+    assert str(src_tree / "broken.py") in index and str(flaky) in index
+
+
+def test_incremental_ssot_partial_run_keeps_other_entries(src_tree, parse_cache, monkeypatch):
+    validator = UnifiedValidator()
+    validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    index_file = parse_cache / unified_validator.SSOT_INDEX_NAME
+    full = json.loads(index_file.read_text())["files"]
+
+    monkeypatch.chdir(src_tree)
+    single = validator.validate_ssot_config(file_path=Path("pkg/old.py"), jobs=1, incremental=True)
+    assert json.loads(index_file.read_text())["files"].keys() == full.keys()
+    assert [v["file"] for v in single["violations"]] == ["pkg/old.py"]
+
+    scanned = []
+    real_scan = unified_validator._scan_ssot_file
+    monkeypatch.setattr(
+        unified_validator, "_scan_ssot_file",
+        lambda path, use_cache=True: scanned.append(path) or real_scan(path, use_cache),
+    )
+    validator.validate_ssot_config(dir_path=Path("pkg"), jobs=1, incremental=True)
+    validator.validate_ssot_config(dir_path=src_tree, jobs=1, incremental=True)
+    assert scanned == []
+
+    (src_tree / "pkg" / "new.py").unlink()
+    validator.validate_ssot_config(dir_path=Path("pkg"), jobs=1, incremental=True)
+    assert json.loads(index_file.read_text())["files"].keys() == full.keys() - {str(src_tree / "pkg" / "new.py")}
+
+
+def test_parallel_ssot_from_worker_thread_does_not_fork(src_tree, monkeypatch):
+    monkeypatch.setattr(unified_validator, "PARALLEL_PARSE_MIN_FILES", 1)
+    validator = UnifiedValidator(use_cache=False)
+    serial = validator.validate_ssot_config(dir_path=src_tree, jobs=1)
+
+    assert unified_validator._pool_context().get_start_method() != "fork"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        busy = executor.submit(time.sleep, 0.2)  # Another thread alive during the pool start
+        parallel = executor.submit(validator.validate_ssot_config, dir_path=src_tree, jobs=2).result()
+        busy.result()
+    assert parallel["violations"] == serial["violations"]
+    assert parallel["warnings"] == serial["warnings"]
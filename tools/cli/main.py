@@ -6,7 +6,7 @@ import sys
 
 from tools.cli.dispatchers.unified_dispatcher import main as unified_main
 from tools.toolbelt.__main__ import main as toolbelt_main
-from tools.toolbelt_registry import ToolRegistry
+from tools.toolbelt_registry import get_registry
 
 def main() -> int:
     """Route between toolbelt flags and unified dispatcher commands."""
@@ -27,7 +27,7 @@ def _should_use_toolbelt(argv: list[str]) -> bool:
     first_arg = argv[1]
     if not first_arg.startswith("-"):
         return False
-    registry = ToolRegistry()
+    registry = get_registry()
     return first_arg in registry.get_all_flags() or first_arg in {"--list", "--help", "-h"}
 
 
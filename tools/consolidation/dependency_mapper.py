@@ -203,8 +203,9 @@ def load_registry_dependencies(registry_path: str) -> Set[str]:
         # Parse Python registry
         try:
             content = path.read_text()
-            # Extract module paths - handle both single and multi-line formats
-            module_pattern = r'"module"\s*:\s*"([^"]+)"'
+            # Extract module paths - handle dict entries ("module": "...")
+            # and ToolSpec entries (module="...")
+            module_pattern = r'(?:"module"\s*:|\bmodule\s*=)\s*"([^"]+)"'
             modules = re.findall(module_pattern, content)
             deps.update(modules)
         except Exception:
@@ -220,6 +220,36 @@ class AnalysisTool(IToolAdapter):
         metadata_large = extract_metadata(str(large_file), "tools")
         assert metadata_large.v2_compliant is False
 
+    def test_extract_metadata_relative_path(self, tmp_path):
+        """Test path is relative to base_dir, or its parent for sibling dirs."""
+        base_dir = tmp_path / "tools"
+        (base_dir / "sub").mkdir(parents=True)
+        (tmp_path / "tools_v2").mkdir()
+        inner = base_dir / "sub" / "inner_tool.py"
+        sibling = tmp_path / "tools_v2" / "sibling_tool.py"
+        inner.write_text("# inner")
+        sibling.write_text("# sibling")
+
+        assert extract_metadata(str(inner), str(base_dir)).path == str(Path("sub") / "inner_tool.py")
+        assert extract_metadata(str(sibling), str(base_dir)).path == str(Path("tools_v2") / "sibling_tool.py")
+
+    def test_extract_metadata_relative_base_follows_cwd(self, tmp_path, monkeypatch):
+        """Test a relative base_dir resolves against the current cwd, even if created late."""
+        for project in ("first", "second"):
+            (tmp_path / project).mkdir()
+        early = tmp_path / "first" / "early_tool.py"
+        early.write_text("# tool")
+        monkeypatch.chdir(tmp_path / "first")
+        assert extract_metadata(str(early), "tools").path == str(early)  # No tools/ yet
+
+        for project in ("first", "second"):
+            (tmp_path / project / "tools").mkdir()
+            (tmp_path / project / "tools" / f"{project}_tool.py").write_text("# tool")
+        assert extract_metadata(str(tmp_path / "first" / "tools" / "first_tool.py"), "tools").path == "first_tool.py"
+
+        monkeypatch.chdir(tmp_path / "second")
+        assert extract_metadata(str(tmp_path / "second" / "tools" / "second_tool.py"), "tools").path == "second_tool.py"
+
 
 class TestToolInventory:
     """Test ToolInventory class."""
@@ -283,6 +313,7 @@ class TestToolInventory:
         data = json.loads(output_file.read_text())
         assert "tools" in data
         assert "test_tool" in data["tools"]
+        assert data == inventory.to_dict()
 
     def test_tool_inventory_load_from_json(self, tmp_path):
         """Test loading inventory from JSON file."""
@@ -11,10 +11,11 @@ Date: 2025-12-29
 """
 import ast
 import json
+import os
 import re
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -40,6 +41,13 @@ class ToolMetadata:
         return asdict(self)
 
 
+def _encode_tool(obj):
+    """json.dump default hook: shallow-encode ToolMetadata (fields are plain types)."""
+    if isinstance(obj, ToolMetadata):
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ToolInventory:
     """Comprehensive tool inventory system."""
 
@@ -74,8 +82,14 @@ class ToolInventory:
 
     def save_to_json(self, output_path: str):
         """Save inventory to JSON file."""
+        # ToolMetadata objects are encoded lazily by _encode_tool, skipping asdict copies
+        payload = {
+            "tools": self.tools,
+            "categories": self.categories,
+            "duplicates": self.duplicates,
+        }
         with open(output_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+            json.dump(payload, f, indent=2, default=_encode_tool)
 
     @classmethod
     def load_from_json(cls, json_path: str) -> "ToolInventory":
@@ -125,13 +139,19 @@ def discover_tools(directory: str, recursive: bool = True) -> List[Path]:
     return sorted(tools)
 
 
-def extract_metadata(tool_path: str, base_dir: str) -> ToolMetadata:
+def extract_metadata(
+    tool_path: str,
+    base_dir: str,
+    base_paths: Optional[Tuple[str, str]] = None,
+) -> ToolMetadata:
     """
     Extract metadata from a tool file.
 
     Args:
         tool_path: Path to the tool file
         base_dir: Base directory for relative path calculation
+        base_paths: _resolve_base_paths(base_dir), resolved once by callers
+            handling a batch of files (resolved here if omitted)
 
     Returns:
         ToolMetadata object
@@ -219,18 +239,21 @@ def extract_metadata(tool_path: str, base_dir: str) -> ToolMetadata:
     if "TODO" in content or "FIXME" in content:
         status = "needs_attention"
 
-    # Calculate relative path
-    try:
-        base_path = Path(base_dir)
-        if base_path.exists() and file_path.is_relative_to(base_path):
-            rel_path = str(file_path.relative_to(base_path))
-        elif base_path.exists() and file_path.is_relative_to(base_path.parent):
-            rel_path = str(file_path.relative_to(base_path.parent))
-        else:
-            rel_path = str(file_path)
-    except (ValueError, AttributeError):
-        # Fallback to absolute path if relative calculation fails
-        rel_path = str(file_path)
+    # Calculate relative path (string ops only once the base dir is resolved)
+    rel_path = str(file_path)
+    if base_paths is None:
+        base_paths = _resolve_base_paths(base_dir)
+    if base_paths is not None:
+        abs_file = os.path.abspath(file_path)
+        for root in base_paths:
+            try:
+                candidate = os.path.relpath(abs_file, root)
+            except ValueError:
+                # Different drives on Windows - keep the original path
+                break
+            if candidate != os.pardir and not candidate.startswith(os.pardir + os.sep):
+                rel_path = candidate
+                break
 
     return ToolMetadata(
         name=name,
@@ -246,6 +269,14 @@ def extract_metadata(tool_path: str, base_dir: str) -> ToolMetadata:
     )
 
 
+def _resolve_base_paths(base_dir: str) -> Optional[Tuple[str, str]]:
+    """Return (base, base parent) as absolute paths, or None if base_dir is missing."""
+    base_abs = os.path.abspath(base_dir)
+    if not os.path.exists(base_abs):
+        return None
+    return base_abs, os.path.dirname(base_abs)
+
+
 def _extract_dependencies(content: str) -> List[str]:
     """Extract import dependencies from file content."""
     dependencies = []
@@ -336,10 +367,11 @@ def generate_inventory(
     tools_files = discover_tools(tools_dir, recursive=True)
     tools_v2_files = discover_tools(tools_v2_dir, recursive=True) if Path(tools_v2_dir).exists() else []
 
-    # Extract metadata from tools/
+    # Extract metadata from tools/ (base paths depend on the cwd, so resolve per run)
+    base_paths = _resolve_base_paths(tools_dir)
     for tool_file in tools_files:
         try:
-            metadata = extract_metadata(str(tool_file), tools_dir)
+            metadata = extract_metadata(str(tool_file), tools_dir, base_paths)
             # Use just the name as tool_id for simpler lookup
             tool_id = metadata.name
             # Check for duplicates before adding
@@ -359,9 +391,10 @@ def generate_inventory(
             print(f"Warning: Failed to extract metadata from {tool_file}: {e}")
 
     # Extract metadata from tools_v2/
+    base_paths = _resolve_base_paths(tools_v2_dir)
     for tool_file in tools_v2_files:
         try:
-            metadata = extract_metadata(str(tool_file), tools_v2_dir)
+            metadata = extract_metadata(str(tool_file), tools_v2_dir, base_paths)
             # Use just the name as tool_id
             tool_id = metadata.name
             # Check for duplicates
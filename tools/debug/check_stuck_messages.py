@@ -24,51 +24,46 @@ project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 try:
-    from swarm_mcp.core.messaging import MessageQueue, Howl
+    from swarm_mcp.core.messaging import Howl, get_queue
 except ImportError:
-    print("❌ Failed to import MessageQueue from swarm_mcp.core.messaging", file=sys.stderr)
+    print("❌ Failed to import message queue from swarm_mcp.core.messaging", file=sys.stderr)
     sys.exit(1)
 
 def check_stuck_messages(agent_id: str = None, threshold_minutes: int = 15):
     """Check for messages that haven't been heard for a while."""
-    queue = MessageQueue()
+    queue = get_queue()
     
-    # Identify inboxes
-    territory = queue.territory
-    agents = []
+    now = datetime.now()
+    threshold = timedelta(minutes=threshold_minutes)
+    
+    # Gather unheard messages past the threshold: one inbox, or every inbox in a single pass
     if agent_id:
-        agents = [agent_id]
+        pack = {agent_id: queue.listen(agent_id, unheard_only=True, limit=100, older_than=threshold)}
     else:
-        # Scan territory for agents
-        if territory.exists():
-            agents = [d.name for d in territory.iterdir() if d.is_dir()]
-            
-    if not agents:
-        print("⚠️ No agents found with inboxes.")
-        return
+        pack = queue.listen_all(unheard_only=True, limit=100, older_than=threshold)
+        territory = queue.territory
+        if not pack and not any(d.is_dir() for d in territory.iterdir()):
+            print("⚠️ No agents found with inboxes.")
+            return
 
     stuck_count = 0
-    now = datetime.now()
-    threshold = timedelta(minutes=threshold_minutes)
     
     print(f"🔍 Checking for messages unheard for > {threshold_minutes} minutes")
     print("=" * 50)
 
-    for agent in agents:
-        unheard = queue.listen(agent, unheard_only=True, limit=100)
+    for agent, unheard in pack.items():
         for msg in unheard:
             # msg.timestamp is already a datetime object in new system
             age = now - msg.timestamp
             
-            if age > threshold:
-                stuck_count += 1
-                urgency_icon = "🚨" if msg.urgency.value <= 2 else "⚠️"
-                print(f"{urgency_icon} Stuck Message for {agent}:")
-                print(f"   ID: {msg.id}")
-                print(f"   From: {msg.sender}")
-                print(f"   Age: {age}")
-                print(f"   Content: {msg.content[:50]}...")
-                print("-" * 30)
+            stuck_count += 1
+            urgency_icon = "🚨" if msg.urgency.value <= 2 else "⚠️"
+            print(f"{urgency_icon} Stuck Message for {agent}:")
+            print(f"   ID: {msg.id}")
+            print(f"   From: {msg.sender}")
+            print(f"   Age: {age}")
+            print(f"   Content: {msg.content[:50]}...")
+            print("-" * 30)
 
     if stuck_count == 0:
         print("✅ No stuck messages found.")
@@ -13,10 +13,14 @@ Author: Agent-5 (Business Intelligence Specialist)
 Date: 2025-12-20
 """
 
+import mmap
 import os
+import shutil
+import subprocess
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Set, Union
 import re
 
 # Add project root to path if running from tools directory
@@ -25,13 +29,23 @@ if __name__ == "__main__":
     sys.path.insert(0, str(project_root))
 
 
+_TOKEN = "FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN"
+_TOKEN_BYTES = _TOKEN.encode()
+# [ \t] rather than \s: the pattern runs over the whole file and must not
+# cross a line break into the next entry
+_ENV_RE = re.compile(rf"{_TOKEN}[ \t]*=[ \t]*([^\r\n]+)", re.IGNORECASE)
+# Bytes pattern so config files can be matched without decoding them first
+_CONFIG_RE = re.compile(
+    rb'%s\s*[:=]\s*["\']?([^"\'\s]+)["\']?' % re.escape(_TOKEN_BYTES), re.IGNORECASE
+)
+
+
 def search_environment_variables() -> Dict[str, Optional[str]]:
     """Search for token in environment variables."""
     results = {}
-    token_name = "FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN"
     
     # Check current environment
-    token = os.getenv(token_name)
+    token = os.getenv(_TOKEN)
     if token:
         results["environment"] = f"Found in environment: {token[:10]}...{token[-4:] if len(token) > 14 else ''}"
     else:
@@ -40,112 +54,226 @@ def search_environment_variables() -> Dict[str, Optional[str]]:
     return results
 
 
-def search_env_files(search_path: Path) -> List[Dict[str, str]]:
-    """Search for token in .env files."""
-    results = []
-    token_pattern = re.compile(r'FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN\s*=\s*(.+)', re.IGNORECASE)
-    
-    # Common .env file locations
-    env_files = [
-        search_path / ".env",
-        search_path / ".env.local",
-        search_path / ".env.production",
-        search_path / "env.example",
-        search_path / ".envexample",
+# Config scan: text formats whose name mentions config/secrets/credentials,
+# plus files whose extension alone marks them as credential stores
+_CONFIG_SUFFIXES = frozenset({".json", ".yaml", ".yml", ".txt", ".py"})
+_CONFIG_NAME_HINTS = ("config", "secrets", "credentials")
+_SECRET_SUFFIXES = frozenset({".key", ".credentials", ".secrets"})
+
+# Directories that never hold credentials worth reporting; pruned during the walk
+_SKIP_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build",
+    ".tox", ".mypy_cache", ".pytest_cache",
+})
+
+
+def _find_candidate_files(search_path: Path) -> Optional[List[str]]:
+    """
+    List files mentioning the token using ripgrep or grep, if available.
+
+    Both tools scan in native code, so only the (few) matching files are
+    handed to the Python scanners. Returns None when neither tool is usable,
+    in which case the caller falls back to walking the tree.
+    """
+    if shutil.which("rg"):
+        cmd = ["rg", "-l", "-0", "-i", "--fixed-strings", "--hidden", "--no-ignore", "--no-messages"]
+        for name in sorted(_SKIP_DIRS):
+            cmd += ["-g", f"!{name}/"]
+    elif shutil.which("grep"):
+        cmd = ["grep", "-r", "-l", "-Z", "-i", "-F", "-s"]
+        cmd += [f"--exclude-dir={name}" for name in sorted(_SKIP_DIRS)]
+    else:
+        return None
+    cmd += [_TOKEN, str(search_path)]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=300)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    # Exit code 1 means "no matches"; anything else is an error
+    if result.returncode not in (0, 1):
+        return None
+    return [
+        os.fsdecode(path) for path in result.stdout.split(b"\0") if path
     ]
-    
-    # Also search for any .env* files
-    for env_file in search_path.rglob(".env*"):
-        if env_file.is_file() and env_file not in env_files:
-            env_files.append(env_file)
-    
-    for env_file in env_files:
-        if env_file.exists() and env_file.is_file():
-            try:
-                with open(env_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        match = token_pattern.search(line)
-                        if match:
-                            token_value = match.group(1).strip().strip('"').strip("'")
-                            # Mask token for display
-                            masked = f"{token_value[:10]}...{token_value[-4:]}" if len(token_value) > 14 else "***"
-                            results.append({
-                                "file": str(env_file.relative_to(search_path)),
-                                "line": line_num,
-                                "token_preview": masked,
-                                "full_path": str(env_file)
-                            })
-            except Exception as e:
-                pass  # Skip files we can't read
-    
+
+
+def _walk_files(search_path: Path) -> Iterator[os.DirEntry]:
+    """Yield every file under search_path using a single os.scandir pass."""
+    stack = [str(search_path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue  # Skip directories we can't list
+
+
+def _classify_file(name: str, at_root: bool) -> Set[str]:
+    """Return which scans ("env", "config", "code") apply to a file name."""
+    kinds = set()
+    if name.startswith(".env") or (at_root and name == "env.example"):
+        kinds.add("env")
+
+    name_lower = name.lower()
+    suffix = os.path.splitext(name_lower)[1]
+    if suffix in _SECRET_SUFFIXES or (
+        suffix in _CONFIG_SUFFIXES
+        and any(hint in name_lower for hint in _CONFIG_NAME_HINTS)
+    ):
+        kinds.add("config")
+
+    if suffix == ".py":
+        kinds.add("code")
+    return kinds
+
+
+# Files at least this large are memory-mapped instead of read into a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@contextmanager
+def _open_buffer(file_path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield a file's contents as bytes, or as a read-only mmap for large files."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _scan_env_file(env_file: Path) -> List[Dict[str, str]]:
+    """Search a single .env file for the token (hits lack file/full_path)."""
+    results = []
+    try:
+        data = env_file.read_text(encoding='utf-8', errors='ignore')
+        # One regex pass over the whole file; line numbers are derived on hits
+        line_num, last_pos = 1, 0
+        for match in _ENV_RE.finditer(data):
+            line_num += data.count("\n", last_pos, match.start())
+            last_pos = match.start()
+            token_value = match.group(1).strip().strip('"').strip("'")
+            # Mask token for display
+            masked = f"{token_value[:10]}...{token_value[-4:]}" if len(token_value) > 14 else "***"
+            results.append({
+                "line": line_num,
+                "token_preview": masked,
+            })
+    except Exception:
+        pass  # Skip files we can't read
     return results
 
 
+def _scan_config_file(config_file: Path) -> Optional[Dict[str, str]]:
+    """Search a single configuration file for the token (hit lacks file/full_path)."""
+    try:
+        with _open_buffer(config_file) as data:
+            # find is a C-level substring search; most files bail out here
+            if data.find(_TOKEN_BYTES) != -1:
+                # Try to extract token value
+                match = _CONFIG_RE.search(data)
+                if match:
+                    token_value = match.group(1).decode('utf-8', errors='ignore')
+                    masked = f"{token_value[:10]}...{token_value[-4:]}" if len(token_value) > 14 else "***"
+                    return {
+                        "token_preview": masked,
+                    }
+    except Exception:
+        pass
+    return None
+
+
+def _scan_code_file(py_file: Path) -> Optional[Dict[str, str]]:
+    """Search a single Python file for token references (hit lacks file/full_path)."""
+    try:
+        with _open_buffer(py_file) as data:
+            pos = data.find(_TOKEN_BYTES)
+            if pos != -1:
+                # Only report once per file; decode just the matching line
+                line_start = data.rfind(b"\n", 0, pos) + 1
+                line_end = data.find(b"\n", pos)
+                line = data[line_start:line_end if line_end != -1 else len(data)]
+                return {
+                    "line": data[:pos].count(b"\n") + 1,
+                    "code_snippet": line.decode('utf-8', errors='ignore').strip()[:100],
+                }
+    except Exception:
+        pass
+    return None
+
+
+def search_files(search_path: Path) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Search .env, configuration and code files in one pass.
+
+    Candidate files come from ripgrep/grep when available, otherwise from a
+    single directory walk. Each file is visited once and dispatched to every
+    scan that applies to it.
+
+    Returns:
+        Dict with "env", "config" and "code" result lists
+    """
+    results = {"env": [], "config": [], "code": []}
+    root = str(search_path)
+    seen_env = set()  # Resolved .env paths, so symlinked copies are scanned once
+
+    candidates = _find_candidate_files(search_path)
+    if candidates is None:
+        candidates = (entry.path for entry in _walk_files(search_path))
+
+    for path in candidates:
+        kinds = _classify_file(os.path.basename(path), os.path.dirname(path) == root)
+        if not kinds:
+            continue
+        file_path = Path(path)
+        hits = []  # (kind, hit) pairs for this file
+        if "env" in kinds:
+            resolved = os.path.realpath(path)
+            if resolved not in seen_env:
+                seen_env.add(resolved)
+                hits.extend(("env", hit) for hit in _scan_env_file(file_path))
+        if "config" in kinds:
+            hit = _scan_config_file(file_path)
+            if hit:
+                hits.append(("config", hit))
+        if "code" in kinds:
+            hit = _scan_code_file(file_path)
+            if hit:
+                hits.append(("code", hit))
+
+        if hits:
+            # Relative path computed once per file, shared by all of its hits
+            rel_path = str(file_path.relative_to(search_path))
+            for kind, hit in hits:
+                results[kind].append({"file": rel_path, **hit, "full_path": path})
+
+    return results
+
+
+def search_env_files(search_path: Path) -> List[Dict[str, str]]:
+    """Search for token in .env files."""
+    return search_files(search_path)["env"]
+
+
 def search_config_files(search_path: Path) -> List[Dict[str, str]]:
     """Search for token in configuration files."""
-    results = []
-    token_name = "FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN"
-    
-    # Common config file patterns
-    config_patterns = [
-        "**/*config*.json",
-        "**/*config*.yaml",
-        "**/*config*.yml",
-        "**/*.credentials*",
-        "**/*secrets*",
-        "**/*.key*",
-    ]
-    
-    for pattern in config_patterns:
-        for config_file in search_path.rglob(pattern):
-            if config_file.is_file() and config_file.suffix in ['.json', '.yaml', '.yml', '.txt', '.py']:
-                try:
-                    with open(config_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        if token_name in content:
-                            # Try to extract token value
-                            token_pattern = re.compile(
-                                rf'{re.escape(token_name)}\s*[:=]\s*["\']?([^"\'\s]+)["\']?',
-                                re.IGNORECASE
-                            )
-                            match = token_pattern.search(content)
-                            if match:
-                                token_value = match.group(1)
-                                masked = f"{token_value[:10]}...{token_value[-4:]}" if len(token_value) > 14 else "***"
-                                results.append({
-                                    "file": str(config_file.relative_to(search_path)),
-                                    "token_preview": masked,
-                                    "full_path": str(config_file)
-                                })
-                except Exception:
-                    pass
-    
-    return results
+    return search_files(search_path)["config"]
 
 
 def search_code_files(search_path: Path) -> List[Dict[str, str]]:
     """Search for token references in code files."""
-    results = []
-    token_name = "FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN"
-    
-    # Search Python files
-    for py_file in search_path.rglob("*.py"):
-        if py_file.is_file():
-            try:
-                with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        if token_name in line:
-                            results.append({
-                                "file": str(py_file.relative_to(search_path)),
-                                "line": line_num,
-                                "code_snippet": line.strip()[:100],
-                                "full_path": str(py_file)
-                            })
-                            break  # Only report once per file
-            except Exception:
-                pass
-    
-    return results
+    return search_files(search_path)["code"]
 
 
 def main():
@@ -157,7 +285,10 @@ def main():
         "--path",
         type=str,
         default=None,
-        help="Path to search (default: current directory or Agent_Cellphone_V2_Repository)"
+        help=(
+            "Path to search (default: current directory or Agent_Cellphone_V2_Repository). "
+            f"Skips these directories: {', '.join(sorted(_SKIP_DIRS))}"
+        )
     )
     parser.add_argument(
         "--show-token",
@@ -188,74 +319,86 @@ def main():
         print(f"❌ Path not found: {search_path}")
         return 1
     
-    print(f"🔍 Searching for FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN")
-    print(f"📁 Search path: {search_path}")
-    print("=" * 60)
+    # Output is buffered and written in bulk rather than line by line
+    lines: List[str] = []
+    add = lines.append
+    
+    add(f"🔍 Searching for FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN")
+    add(f"📁 Search path: {search_path}")
+    add("=" * 60)
+    # Show the header before the (possibly slow) scan
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
     
     # Search environment variables
-    print("\n1️⃣ Environment Variables:")
+    add("\n1️⃣ Environment Variables:")
     env_results = search_environment_variables()
     for key, value in env_results.items():
-        print(f"   {key}: {value}")
+        add(f"   {key}: {value}")
     
+    # Walk the tree once for .env, config and code files
+    file_results = search_files(search_path)
+
     # Search .env files
-    print("\n2️⃣ .env Files:")
-    env_files = search_env_files(search_path)
+    add("\n2️⃣ .env Files:")
+    env_files = file_results["env"]
     if env_files:
         for result in env_files:
-            print(f"   ✅ Found in: {result['file']} (line {result['line']})")
+            add(f"   ✅ Found in: {result['file']} (line {result['line']})")
             if args.show_token:
-                print(f"      Token: {result.get('token_preview', 'N/A')}")
+                add(f"      Token: {result.get('token_preview', 'N/A')}")
             else:
-                print(f"      Token preview: {result.get('token_preview', 'N/A')}")
+                add(f"      Token preview: {result.get('token_preview', 'N/A')}")
     else:
-        print("   ❌ Not found in .env files")
+        add("   ❌ Not found in .env files")
     
     # Search config files
-    print("\n3️⃣ Configuration Files:")
-    config_files = search_config_files(search_path)
+    add("\n3️⃣ Configuration Files:")
+    config_files = file_results["config"]
     if config_files:
         for result in config_files:
-            print(f"   ✅ Found in: {result['file']}")
+            add(f"   ✅ Found in: {result['file']}")
             if args.show_token:
-                print(f"      Token: {result.get('token_preview', 'N/A')}")
+                add(f"      Token: {result.get('token_preview', 'N/A')}")
             else:
-                print(f"      Token preview: {result.get('token_preview', 'N/A')}")
+                add(f"      Token preview: {result.get('token_preview', 'N/A')}")
     else:
-        print("   ❌ Not found in configuration files")
+        add("   ❌ Not found in configuration files")
     
     # Search code files (references)
-    print("\n4️⃣ Code File References:")
-    code_files = search_code_files(search_path)
+    add("\n4️⃣ Code File References:")
+    code_files = file_results["code"]
     if code_files:
-        print(f"   ✅ Found {len(code_files)} file(s) referencing the token:")
+        add(f"   ✅ Found {len(code_files)} file(s) referencing the token:")
         for result in code_files[:10]:  # Limit to first 10
-            print(f"      - {result['file']}:{result.get('line', 'N/A')}")
+            add(f"      - {result['file']}:{result.get('line', 'N/A')}")
             if 'code_snippet' in result:
-                print(f"        {result['code_snippet']}")
+                add(f"        {result['code_snippet']}")
         if len(code_files) > 10:
-            print(f"      ... and {len(code_files) - 10} more files")
+            add(f"      ... and {len(code_files) - 10} more files")
     else:
-        print("   ❌ No code files found referencing the token")
+        add("   ❌ No code files found referencing the token")
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY:")
+    add("\n" + "=" * 60)
+    add("📊 SUMMARY:")
     total_found = len(env_files) + len(config_files)
     if env_results.get("environment") and "Found" in env_results["environment"]:
         total_found += 1
     
     if total_found > 0:
-        print(f"   ✅ Token found in {total_found} location(s)")
+        add(f"   ✅ Token found in {total_found} location(s)")
         if not args.show_token:
-            print("   💡 Use --show-token to see token previews")
+            add("   💡 Use --show-token to see token previews")
     else:
-        print("   ❌ Token not found")
-        print("   💡 Set it in environment or .env file:")
-        print("      export FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN=your_token")
-        print("      or add to .env file:")
-        print("      FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN=your_token")
+        add("   ❌ Token not found")
+        add("   💡 Set it in environment or .env file:")
+        add("      export FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN=your_token")
+        add("      or add to .env file:")
+        add("      FG_PROFESSIONAL_DEVELOPMENT_ACCOUNT_GITHUB_TOKEN=your_token")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0 if total_found > 0 else 1
 
 
@@ -10,21 +10,16 @@ Used by: tools/devops/documentation_assistant.py
 
 from datetime import datetime
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def create_milestone_template(agent_id: str, achievement: str) -> str:
-    """Generate an agent milestone documentation template.
-
-    Args:
-        agent_id: The agent identifier (e.g., Agent-7)
-        achievement: Description of the achievement
-
-    Returns:
-        Formatted markdown template string
-    """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    date_only = datetime.now().strftime("%Y-%m-%d")
+# Priority emoji mapping
+_PRIORITY_EMOJI = {
+    "LOW": "🟢",
+    "MEDIUM": "🟡",
+    "HIGH": "🔴"
+}
 
-    return f"""# 🏆 Agent Milestone: {agent_id}
+_MILESTONE_TEMPLATE = """# 🏆 Agent Milestone: {agent_id}
 
 **Achievement:** {achievement}
 **Date:** {timestamp}
@@ -67,31 +62,31 @@ _Describe the context and significance of this achievement_
 """
 
 
-def create_enhancement_request_template(name: str, priority: str = "MEDIUM") -> str:
-    """Generate an enhancement request documentation template.
+def create_milestone_template(agent_id: str, achievement: str) -> str:
+    """Generate an agent milestone documentation template.
 
     Args:
-        name: Name of the proposed enhancement
-        priority: Priority level (LOW, MEDIUM, HIGH)
+        agent_id: The agent identifier (e.g., Agent-7)
+        achievement: Description of the achievement
 
     Returns:
         Formatted markdown template string
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    date_only = datetime.now().strftime("%Y-%m-%d")
+    timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    date_only = timestamp[:10]  # Same instant, no second clock read
 
-    # Priority emoji mapping
-    priority_emoji = {
-        "LOW": "🟢",
-        "MEDIUM": "🟡",
-        "HIGH": "🔴"
-    }
-    emoji = priority_emoji.get(priority.upper(), "🟡")
+    return _MILESTONE_TEMPLATE.format_map({
+        "agent_id": agent_id,
+        "achievement": achievement,
+        "timestamp": timestamp,
+        "date_only": date_only,
+    })
 
-    return f"""# Enhancement Request: {name}
+
+_ENHANCEMENT_REQUEST_TEMPLATE = """# Enhancement Request: {name}
 
 **Requested:** {timestamp}
-**Priority:** {emoji} {priority.upper()}
+**Priority:** {emoji} {priority}
 **Status:** 📋 Proposed
 
 ## Summary
@@ -103,7 +98,7 @@ _Brief description of the enhancement_
 | Field | Value |
 |-------|-------|
 | Name | {name} |
-| Priority | {priority.upper()} |
+| Priority | {priority} |
 | Requested Date | {date_only} |
 | Requested By | _Agent ID_ |
 | Target Version | _TBD_ |
@@ -158,3 +153,27 @@ _Describe the proposed solution in detail_
 ---
 🐝 WE. ARE. SWARM. ⚡🔥
 """
+
+
+def create_enhancement_request_template(name: str, priority: str = "MEDIUM") -> str:
+    """Generate an enhancement request documentation template.
+
+    Args:
+        name: Name of the proposed enhancement
+        priority: Priority level (LOW, MEDIUM, HIGH)
+
+    Returns:
+        Formatted markdown template string
+    """
+    timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    date_only = timestamp[:10]  # Same instant, no second clock read
+
+    priority = priority.upper()
+
+    return _ENHANCEMENT_REQUEST_TEMPLATE.format_map({
+        "name": name,
+        "timestamp": timestamp,
+        "emoji": _PRIORITY_EMOJI.get(priority, "🟡"),
+        "priority": priority,
+        "date_only": date_only,
+    })
@@ -10,20 +10,10 @@ Used by: tools/devops/documentation_assistant.py
 
 from datetime import datetime
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def create_mission_tracking_template(mission_name: str) -> str:
-    """Generate a mission tracking document template.
 
-    Args:
-        mission_name: The mission identifier (e.g., C-057)
-
-    Returns:
-        Formatted markdown template string
-    """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    date_only = datetime.now().strftime("%Y-%m-%d")
-
-    return f"""# Mission Tracking: {mission_name}
+_MISSION_TRACKING_TEMPLATE = """# Mission Tracking: {mission_name}
 
 **Created:** {timestamp}
 **Status:** 🟡 In Progress
@@ -69,8 +59,8 @@ _Add mission-specific notes here_
 """
 
 
-def create_completion_report_template(mission_name: str) -> str:
-    """Generate a mission completion report template.
+def create_mission_tracking_template(mission_name: str) -> str:
+    """Generate a mission tracking document template.
 
     Args:
         mission_name: The mission identifier (e.g., C-057)
@@ -78,10 +68,17 @@ def create_completion_report_template(mission_name: str) -> str:
     Returns:
         Formatted markdown template string
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    date_only = datetime.now().strftime("%Y-%m-%d")
+    timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    date_only = timestamp[:10]  # Same instant, no second clock read
 
-    return f"""# Mission Completion Report: {mission_name}
+    return _MISSION_TRACKING_TEMPLATE.format_map({
+        "mission_name": mission_name,
+        "timestamp": timestamp,
+        "date_only": date_only,
+    })
+
+
+_COMPLETION_REPORT_TEMPLATE = """# Mission Completion Report: {mission_name}
 
 **Completed:** {timestamp}
 **Status:** ✅ Complete
@@ -139,3 +136,22 @@ Mission {mission_name} has been successfully completed.
 ---
 🐝 WE. ARE. SWARM. ⚡🔥
 """
+
+
+def create_completion_report_template(mission_name: str) -> str:
+    """Generate a mission completion report template.
+
+    Args:
+        mission_name: The mission identifier (e.g., C-057)
+
+    Returns:
+        Formatted markdown template string
+    """
+    timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    date_only = timestamp[:10]  # Same instant, no second clock read
+
+    return _COMPLETION_REPORT_TEMPLATE.format_map({
+        "mission_name": mission_name,
+        "timestamp": timestamp,
+        "date_only": date_only,
+    })
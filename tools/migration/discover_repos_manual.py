@@ -15,12 +15,104 @@ Usage:
 """
 
 import argparse
+import re
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator
 
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
 
-def clone_repo(repo_name: str, old_account: str, target_dir: Path) -> bool:
+# Clones run in worker threads; serialize output so lines don't interleave
+_print_lock = threading.Lock()
+
+
+def _log(message: str = "") -> None:
+    """Print a line while holding the shared output lock."""
+    with _print_lock:
+        if TQDM_AVAILABLE:
+            tqdm.write(message)  # Keeps an active progress bar intact
+        else:
+            print(message)
+
+
+# Push URL given to a kept origin; git cannot reach it, so pushes fail
+_NO_PUSH_URL = "no-push://origin-is-read-only"
+
+_SECTION_RE = re.compile(r'^\s*\[\s*([^\s\]"]+)(?:\s+"([^"]*)")?\s*\]')
+_KEY_RE = re.compile(r"^\s*([A-Za-z0-9-]+)\s*(?:=\s*(.*?)\s*)?$")
+
+
+def remove_origin_remote(repo_path: Path) -> None:
+    """
+    Drop the ``origin`` remote of a fresh clone without spawning git.
+
+    Equivalent to ``git remote remove origin`` for a freshly cloned repo:
+    removes the ``[remote "origin"]`` section, the branch tracking keys that
+    point at it, and the ``refs/remotes/origin`` refs.
+
+    Args:
+        repo_path: Path to the repository working tree
+    """
+    git_dir = repo_path / ".git"
+    config_path = git_dir / "config"
+
+    sections = []  # [(header_line, name, subsection, [body_lines])]
+    for line in config_path.read_text(encoding="utf-8").splitlines(keepends=True):
+        match = _SECTION_RE.match(line)
+        if match:
+            sections.append((line, match.group(1).lower(), match.group(2), []))
+        elif sections:
+            sections[-1][3].append(line)
+        else:
+            sections.append(("", "", None, [line]))
+
+    kept = []
+    for header, name, subsection, body in sections:
+        if name == "remote" and subsection == "origin":
+            continue
+        if name == "branch":
+            entries = [(line, _KEY_RE.match(line)) for line in body]
+            tracks_origin = any(
+                m and m.group(1).lower() == "remote" and m.group(2) == "origin"
+                for _, m in entries
+            )
+            if tracks_origin:
+                body = [
+                    line for line, m in entries
+                    if not (m and m.group(1).lower() in ("remote", "merge"))
+                ]
+                if not any(line.strip() for line in body):
+                    continue  # git drops the section once it is empty
+        kept.append(header + "".join(body))
+    config_path.write_text("".join(kept), encoding="utf-8")
+
+    # Remote-tracking refs: loose refs directory plus packed-refs entries
+    shutil.rmtree(git_dir / "refs" / "remotes" / "origin", ignore_errors=True)
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.exists():
+        lines = packed_refs.read_text(encoding="utf-8").splitlines(keepends=True)
+        packed_refs.write_text(
+            "".join(line for line in lines if " refs/remotes/origin/" not in line),
+            encoding="utf-8",
+        )
+
+
+def clone_repo(
+    repo_name: str,
+    old_account: str,
+    target_dir: Path,
+    shallow: bool = False,
+    blobless: bool = False,
+    verbose: bool = True,
+) -> bool:
     """
     Clone a single repository.
 
@@ -28,6 +120,10 @@ def clone_repo(repo_name: str, old_account: str, target_dir: Path) -> bool:
         repo_name: Repository name
         old_account: Old GitHub account name
         target_dir: Target directory for clones
+        shallow: Only fetch the latest commit (--depth=1)
+        blobless: Partial clone that fetches file contents on demand (--filter=blob:none);
+            origin is kept for those fetches, with pushes to it disabled
+        verbose: Report progress as well as failures
 
     Returns:
         True if successful
@@ -35,51 +131,96 @@ def clone_repo(repo_name: str, old_account: str, target_dir: Path) -> bool:
     repo_path = target_dir / repo_name
 
     if repo_path.exists():
-        print(f"⚠️  {repo_name} already exists, skipping")
+        if verbose:
+            _log(f"⚠️  {repo_name} already exists, skipping")
         return True
 
     clone_url = f"https://github.com/{old_account}/{repo_name}.git"
-    print(f"📥 Cloning {repo_name}...")
+    if verbose:
+        _log(f"📥 Cloning {repo_name}...")
+
+    cmd = ["git", "clone"]
+    if shallow:
+        cmd.append("--depth=1")
+    if blobless:
+        cmd.append("--filter=blob:none")
+    cmd += [clone_url, str(repo_path)]
 
     try:
+        # stdout is unused; stderr is kept for the failure message
         result = subprocess.run(
-            ["git", "clone", clone_url, str(repo_path)],
-            capture_output=True,
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=300,  # 5 minute timeout
         )
 
         if result.returncode == 0:
-            # Remove old remote to prevent accidental pushes
-            subprocess.run(
-                ["git", "remote", "remove", "origin"],
-                cwd=repo_path,
-                capture_output=True,
-            )
-            print(f"✅ {repo_name} cloned successfully")
+            if blobless:
+                # A partial clone fetches missing blobs from origin on demand,
+                # so keep it for fetching and only make pushes to it fail
+                subprocess.run(
+                    ["git", "-C", str(repo_path), "remote", "set-url", "--push", "origin", _NO_PUSH_URL],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            else:
+                # Remove old remote to prevent accidental pushes
+                remove_origin_remote(repo_path)
+            if verbose:
+                _log(f"✅ {repo_name} cloned successfully")
             return True
         else:
-            print(f"❌ Failed to clone {repo_name}")
+            message = f"❌ Failed to clone {repo_name}"
             if result.stderr:
-                print(f"   Error: {result.stderr.strip()}")
+                message += f"\n   Error: {result.stderr.strip()}"
+            _log(message)
             return False
 
     except subprocess.TimeoutExpired:
-        print(f"⏱️  {repo_name} clone timed out")
+        _log(f"⏱️  {repo_name} clone timed out")
         return False
     except Exception as e:
-        print(f"❌ Error cloning {repo_name}: {e}")
+        _log(f"❌ Error cloning {repo_name}: {e}")
         return False
 
 
-def clone_from_list(repo_list_file: str, old_account: str, target_dir: Path):
+def _iter_repos(repo_list_path: Path) -> Iterator[str]:
+    """Yield repository names from a list file, skipping blanks and comments."""
+    with open(repo_list_path, "r") as f:
+        for line in f:
+            name = line.strip()
+            if name and name[0] != "#":
+                yield name
+
+
+def clone_from_list(
+    repo_list_file: str,
+    old_account: str,
+    target_dir: Path,
+    jobs: int = 8,
+    shallow: bool = False,
+    blobless: bool = False,
+    verbose: bool = False,
+):
     """
     Clone repositories from a list file.
 
+    Clones are network-bound, so they run concurrently in a thread pool.
+    Progress is shown as a tqdm bar (or roughly ten counter lines without
+    tqdm); per-repository messages are only printed when verbose, failures
+    always are.
+
     Args:
         repo_list_file: Path to file with repository names (one per line)
         old_account: Old GitHub account name
         target_dir: Target directory for clones
+        jobs: Number of clones to run in parallel
+        shallow: Only fetch the latest commit of each repository
+        blobless: Use partial clones that fetch file contents on demand
+        verbose: Print a line for every repository
     """
     repo_list_path = Path(repo_list_file).expanduser()
     if not repo_list_path.exists():
@@ -91,12 +232,7 @@ def clone_from_list(repo_list_file: str, old_account: str, target_dir: Path):
         print(f"   another-project")
         return
 
-    with open(repo_list_path, "r") as f:
-        repos = [
-            line.strip()
-            for line in f
-            if line.strip() and not line.startswith("#")
-        ]
+    repos = list(_iter_repos(repo_list_path))
 
     if not repos:
         print(f"❌ No repositories found in {repo_list_file}")
@@ -108,12 +244,27 @@ def clone_from_list(repo_list_file: str, old_account: str, target_dir: Path):
     successful = 0
     failed = 0
 
-    for repo_name in repos:
-        if clone_repo(repo_name, old_account, target_dir):
-            successful += 1
-        else:
-            failed += 1
-        print()  # Blank line between repos
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {
+            executor.submit(
+                clone_repo, repo_name, old_account, target_dir, shallow, blobless, verbose
+            ): repo_name
+            for repo_name in repos
+        }
+        bar = tqdm(total=len(repos), unit="repo") if TQDM_AVAILABLE else None
+        report_every = max(1, len(repos) // 10)
+        for done, future in enumerate(as_completed(futures), 1):
+            if future.result():
+                successful += 1
+            else:
+                failed += 1
+            if bar is not None:
+                bar.update(1)
+                bar.set_postfix_str(futures[future])
+            elif not verbose and (done % report_every == 0 or done == len(repos)):
+                _log(f"   {done}/{len(repos)} done")
+        if bar is not None:
+            bar.close()
 
     print(f"\n📊 Summary:")
     print(f"   ✅ Successful: {successful}")
@@ -162,6 +313,28 @@ def main():
         default="/home/dream/Development/projects/repositories/old-account",
         help="Target directory for cloned repositories",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of repositories to clone in parallel (default: 8)",
+    )
+    parser.add_argument(
+        "--shallow",
+        action="store_true",
+        help="Shallow clone (--depth=1): latest commit only, no history",
+    )
+    parser.add_argument(
+        "--blobless",
+        action="store_true",
+        help="Partial clone (--filter=blob:none): full history, file contents fetched from "
+             "origin on demand, so origin is kept (push-disabled) instead of removed",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also print a line for every repository (without tqdm, these replace the progress counter)",
+    )
     parser.add_argument(
         "--create-template",
         action="store_true",
@@ -218,7 +391,15 @@ Since GitHub API is blocked, follow these steps:
     if args.clone_list:
         target_dir = Path(args.target_dir).expanduser().resolve()
         target_dir.mkdir(parents=True, exist_ok=True)
-        clone_from_list(args.clone_list, args.old_account, target_dir)
+        clone_from_list(
+            args.clone_list,
+            args.old_account,
+            target_dir,
+            jobs=args.jobs,
+            shallow=args.shallow,
+            blobless=args.blobless,
+            verbose=args.verbose,
+        )
     else:
         parser.print_help()
         print("\n💡 Quick start:")
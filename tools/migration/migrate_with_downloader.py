@@ -11,12 +11,49 @@ Usage:
 """
 
 import argparse
+import os
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 
-def find_github_repo_downloader() -> Path:
+_DOWNLOADER_NAME = "github_repo_downloader.py"
+_SEARCH_MAX_DEPTH = 5
+_SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv", "site-packages"})
+
+
+def _find_file(base_path: Path, file_name: str, max_depth: int) -> Optional[Path]:
+    """
+    Breadth-first search for a file, at most ``max_depth`` levels down.
+
+    Dot-directories and dependency/cache trees are not descended into, and
+    the search stops at the first (shallowest) match.
+    """
+    level = [str(base_path)]
+    for _ in range(max_depth + 1):
+        next_level = []
+        for dir_path in level:
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name == file_name and entry.is_file():
+                            return Path(entry.path)
+                        if (
+                            entry.is_dir(follow_symlinks=False)
+                            and entry.name[0] != "."
+                            and entry.name not in _SKIP_DIRS
+                        ):
+                            next_level.append(entry.path)
+            except OSError:
+                continue
+        level = next_level
+    return None
+
+
+@lru_cache(maxsize=None)
+def find_github_repo_downloader() -> Optional[Path]:
     """Find github_repo_downloader.py in the project."""
     # Common locations to check
     search_paths = [
@@ -27,11 +64,9 @@ def find_github_repo_downloader() -> Path:
     ]
 
     for base_path in search_paths:
-        # Search recursively
-        for pattern in ["**/github_repo_downloader.py", "github_repo_downloader.py"]:
-            matches = list(base_path.rglob(pattern)) if base_path.exists() else []
-            if matches:
-                return matches[0]
+        match = _find_file(base_path, _DOWNLOADER_NAME, _SEARCH_MAX_DEPTH)
+        if match is not None:
+            return match
 
     return None
 
@@ -19,22 +19,408 @@ Usage:
 import argparse
 import hashlib
 import json
+import os
+import random
 import re
+import shutil
+import sqlite3
 import subprocess
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 try:
     import ast
 except ImportError:
     ast = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+try:
+    import tlsh
+    TLSH_AVAILABLE = True
+except ImportError:
+    TLSH_AVAILABLE = False
+
+
+class _IndicatorMatcher:
+    """
+    Match many framework/test indicators against a repository's names at once.
+
+    Indicators are split by kind: bare extensions (".py") are looked up in
+    the suffix set, exact file/directory names or stems ("manage.py",
+    "jest") in the name set, and name fragments (".test.js", "_test.py",
+    "Test.java", "test_") are folded into one prefix and one suffix regex
+    with a named group per fragment, so each name is scanned once for all
+    of them.
+    """
+
+    def __init__(self, indicators: List[Tuple[str, str]]):
+        """
+        Classify indicators and compile the fragment regexes.
+
+        Args:
+            indicators: (indicator, label) pairs; an indicator may map to several labels
+        """
+        self.exact: Dict[str, Set[str]] = defaultdict(set)
+        self.extensions: Dict[str, Set[str]] = defaultdict(set)
+        prefixes: Dict[str, Set[str]] = defaultdict(set)
+        endings: Dict[str, Set[str]] = defaultdict(set)
+        for indicator, label in indicators:
+            if indicator.startswith(".") and indicator.count(".") == 1:
+                self.extensions[indicator].add(label)
+            elif indicator[0] in "._" or indicator.startswith("Test."):
+                endings[indicator].add(label)
+            elif indicator.endswith("_"):
+                prefixes[indicator].add(label)
+            else:
+                self.exact[indicator].add(label)
+
+        self.group_labels: Dict[str, Set[str]] = {}
+        self.prefix_re = self._compile(prefixes, "^(?:{})", "p")
+        self.ending_re = self._compile(endings, "(?:{})$", "e")
+
+    def _compile(self, fragments: Dict[str, Set[str]], template: str, tag: str):
+        """Alternation with one named group per fragment (None if no fragments)."""
+        if not fragments:
+            return None
+        alternatives = []
+        # Longest first, so a fragment that ends another still wins its names
+        for i, fragment in enumerate(sorted(fragments, key=len, reverse=True)):
+            group = f"{tag}{i}"
+            self.group_labels[group] = fragments[fragment]
+            alternatives.append(f"(?P<{group}>{re.escape(fragment)})")
+        return re.compile(template.format("|".join(alternatives)))
+
+    def match(self, names: Set[str], suffixes: Set[str]) -> Set[str]:
+        """Labels of every indicator present in the given names/suffixes."""
+        labels: Set[str] = set()
+        for indicator, indicator_labels in self.exact.items():
+            if indicator in names:
+                labels |= indicator_labels
+        for indicator, indicator_labels in self.extensions.items():
+            if indicator in suffixes:
+                labels |= indicator_labels
+        for regex, find in ((self.prefix_re, "match"), (self.ending_re, "search")):
+            if regex is None:
+                continue
+            finder = getattr(regex, find)
+            for name in names:
+                m = finder(name)
+                if m is not None:
+                    labels |= self.group_labels[m.lastgroup]
+        return labels
+
+
+_LINE_COUNT_SUFFIXES = frozenset({".py", ".js", ".ts", ".rs", ".go", ".java", ".md", ".txt"})
+_LINE_COUNT_CHUNK = 1 << 20  # 1 MiB
+_PARALLEL_READ_MIN_FILES = 64  # Below this a thread pool costs more than it saves
+_READ_THREADS = 8
+_SMALL_FILE = 64 * 1024
+
+
+def _count_lines(path: str, size: int) -> int:
+    """
+    Count lines in a file by counting newline bytes.
+
+    Reads in binary (no decoding, no per-line objects): small files in one
+    read, larger ones through a single reused 1 MiB buffer. A final line
+    without a trailing newline is counted, as ``len(f.readlines())`` would.
+    """
+    if size < _SMALL_FILE:
+        with open(path, "rb") as f:
+            data = f.read()
+        return data.count(b"\n") + (1 if data and data[-1:] != b"\n" else 0)
+
+    buf = bytearray(_LINE_COUNT_CHUNK)
+    lines = 0
+    last_byte = 0x0A
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            lines += buf.count(b"\n", 0, n)  # Counts in place, no slice copy
+            last_byte = buf[n - 1]
+    return lines + (1 if last_byte != 0x0A else 0)
+
+
+def _count_lines_or_zero(entry: "FileEntry") -> int:
+    """_count_lines for a walked file, 0 if it cannot be read."""
+    try:
+        return _count_lines(entry.path, entry.size)
+    except OSError:
+        return 0
+
+
+# File extension -> language counted by _detect_language
+_EXT_TO_LANG = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".rs": "Rust",
+    ".go": "Go",
+    ".java": "Java",
+    ".cpp": "C++",
+    ".cc": "C++",
+    ".cxx": "C++",
+    ".c": "C",
+}
+
+# Package name of a requirements.txt line (optional extras, specifier,
+# marker or trailing comment after it); comment-only lines, options (-r, -e)
+# and URLs don't match
+_REQ_RE = re.compile(
+    rb"(?m)^[ \t]*([A-Za-z0-9][A-Za-z0-9_.\-]*)[ \t]*(?:\[[^\]\n]*\])?[ \t]*(?:[<>=!~;@].*)?"
+    rb"(?:[ \t]+#.*)?\r?$"
+)
+
+# MinHash: NUM_PERM universal hash permutations, LSH with BANDS x ROWS
+_MINHASH_NUM_PERM = 128
+_MINHASH_PRIME = (1 << 61) - 1
+_LSH_BANDS = 16
+_LSH_ROWS = 8  # (1/16) ** (1/8) ~ 0.7, the Jaccard threshold
+_NEAR_DUPLICATE_JACCARD = 0.7
+_rng = random.Random(0x5eed)  # Fixed seed: signatures must be comparable across runs
+_MINHASH_PERMS = [
+    (_rng.randrange(1, _MINHASH_PRIME), _rng.randrange(0, _MINHASH_PRIME))
+    for _ in range(_MINHASH_NUM_PERM)
+]
+del _rng
+
+
+def _minhash(tokens: Set[str]) -> List[int]:
+    """MinHash signature of a token set ([] for an empty set)."""
+    if not tokens:
+        return []
+    hashes = [
+        int.from_bytes(hashlib.sha1(token.encode()).digest()[:8], "little")
+        for token in tokens
+    ]
+    return [
+        min((a * h + b) % _MINHASH_PRIME for h in hashes)
+        for a, b in _MINHASH_PERMS
+    ]
+
+
+def _lsh_candidate_pairs(repos: Dict[str, "RepoMetadata"]) -> Set[Tuple[str, str]]:
+    """
+    Name pairs (sorted) of repositories sharing a MinHash LSH band bucket.
+
+    Only these pairs need comparing, so the work is linear in the number
+    of repos plus the (few) candidates.
+    """
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+    for name, meta in repos.items():
+        if len(meta.minhash) != _MINHASH_NUM_PERM:
+            continue
+        for band in range(_LSH_BANDS):
+            start = band * _LSH_ROWS
+            buckets[(band, tuple(meta.minhash[start:start + _LSH_ROWS]))].append(name)
+
+    pairs: Set[Tuple[str, str]] = set()
+    for names in buckets.values():
+        for i, name in enumerate(names):
+            for other in names[i + 1:]:
+                pairs.add((name, other) if name < other else (other, name))
+    return pairs
+
+
+def _clusters(pairs: Iterable[Tuple[str, str]]) -> List[List[str]]:
+    """Connected components (sorted name lists) of the given matching pairs."""
+    parent: Dict[str, str] = {}
+
+    def find(name: str) -> str:
+        while parent.get(name, name) != name:
+            name = parent[name]
+        return name
+
+    for name, other in pairs:
+        root_a, root_b = find(name), find(other)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters: Dict[str, Set[str]] = defaultdict(set)
+    for name in parent:
+        root = find(name)
+        clusters[root].update((name, root))
+    return [sorted(members) for members in clusters.values()]
+
+
+def _near_duplicate_groups(
+    repos: Dict[str, "RepoMetadata"], candidates: Set[Tuple[str, str]]
+) -> List[List[str]]:
+    """Cluster candidate pairs whose MinHash signatures estimate Jaccard >= 0.7."""
+    def similar(pair: Tuple[str, str]) -> bool:
+        a, b = repos[pair[0]].minhash, repos[pair[1]].minhash
+        matches = sum(1 for x, y in zip(a, b) if x == y)
+        return matches / _MINHASH_NUM_PERM >= _NEAR_DUPLICATE_JACCARD
+
+    return _clusters(pair for pair in candidates if similar(pair))
+
+
+_TLSH_SUFFIXES = frozenset({".py", ".js", ".ts", ".go", ".rs"})
+_TLSH_FILE_BYTES = 256 * 1024
+_TLSH_MAX_DISTANCE = 100  # Below this, two codebases are likely near-duplicates
+
+
+def _content_tlsh(files: List["FileEntry"]) -> str:
+    """
+    TLSH digest over the leading bytes of a repository's source files.
+
+    Files are fed in relative-path order so the digest is deterministic.
+    Returns "" when tlsh is unavailable or there is too little content.
+    """
+    if not TLSH_AVAILABLE:
+        return ""
+    hasher = tlsh.Tlsh()
+    fed = 0
+    for entry in sorted(files, key=lambda e: e.rel_path):
+        if entry.hidden or entry.suffix not in _TLSH_SUFFIXES:
+            continue
+        try:
+            with open(entry.path, "rb") as f:
+                data = f.read(_TLSH_FILE_BYTES)
+        except OSError:
+            continue
+        if data:
+            hasher.update(data)
+            fed += len(data)
+    if fed < 50:  # TLSH needs at least 50 bytes
+        return ""
+    try:
+        hasher.final()
+        digest = hasher.hexdigest()
+    except ValueError:
+        return ""
+    return "" if digest == "TNULL" else digest
+
+
+class FileEntry(NamedTuple):
+    """A regular file collected by the single repository walk."""
+
+    path: str  # Absolute path
+    rel_path: str  # Relative to the repository root, "/"-separated
+    name: str
+    suffix: str
+    size: int
+    hidden: bool  # Under a dot-directory, or a dotfile other than .gitignore
+
 
 @dataclass
+class FileIndex:
+    """Walk result for one repository, as stored in the index cache."""
+
+    files: List[FileEntry]
+    total_lines: int = 0  # Lines in non-hidden text files
+
+
+# Per-repository caches, keyed by repo path + the state of .git/HEAD and .git/index
+CACHE_DIR = Path.home() / ".cache" / "agenttools"
+INDEX_CACHE_DIR = CACHE_DIR / "repo_index"
+META_CACHE_DB = CACHE_DIR / "repo_meta.db"
+_INDEX_FORMAT = 2  # Bump when the walk changes what an index contains
+_META_FORMAT = 2  # Bump when analysis changes what RepoMetadata contains
+
+
+def _git_state(repo_path: Path) -> Optional[str]:
+    """
+    Cheap fingerprint of a repository's checkout, or None without .git/HEAD.
+
+    HEAD changes on checkout, the index on commit, merge and staging.
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = os.stat(git_dir / "HEAD")
+    except OSError:
+        return None
+    try:
+        index_mtime = os.stat(git_dir / "index").st_mtime_ns
+    except OSError:
+        index_mtime = 0  # No commits yet
+    return f"{head.st_mtime_ns}:{head.st_size}:{index_mtime}"
+
+
+def _index_cache_file(repo_path: Path) -> Optional[Path]:
+    """Cache file for a repository's current checkout, or None if HEAD is missing."""
+    state = _git_state(repo_path)
+    if state is None:
+        return None
+    key = hashlib.sha1(f"{repo_path}{state}{_INDEX_FORMAT}".encode()).hexdigest()
+    return INDEX_CACHE_DIR / f"{key}.json"
+
+
+class _MetadataCache:
+    """SQLite store of analyzed RepoMetadata, one row per repository path."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = db_path or META_CACHE_DB
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS repo_meta ("
+            "path TEXT PRIMARY KEY, state TEXT NOT NULL, data TEXT NOT NULL)"
+        )
+
+    def get(self, repo_path: Path) -> Optional["RepoMetadata"]:
+        """Cached metadata if the repository is unchanged since it was stored."""
+        state = _git_state(repo_path)
+        if state is None:
+            return None
+        row = self.conn.execute(
+            "SELECT data FROM repo_meta WHERE path = ? AND state = ?",
+            (str(repo_path), f"{state}:{_META_FORMAT}"),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return RepoMetadata.from_dict(json.loads(row[0]))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, metadata: "RepoMetadata"):
+        """Store metadata under the repository's current state."""
+        state = _git_state(metadata.path)
+        if state is None:
+            return
+        data = metadata.to_dict()
+        data["minhash"] = metadata.minhash
+        self.conn.execute(
+            "INSERT OR REPLACE INTO repo_meta (path, state, data) VALUES (?, ?, ?)",
+            (str(metadata.path), f"{state}:{_META_FORMAT}", json.dumps(data)),
+        )
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def purge_caches():
+    """Delete the file index and metadata caches."""
+    shutil.rmtree(INDEX_CACHE_DIR, ignore_errors=True)
+    try:
+        META_CACHE_DB.unlink()
+    except FileNotFoundError:
+        pass
+
+
+@dataclass(slots=True)
 class RepoMetadata:
     """Metadata for a single repository."""
 
@@ -67,6 +453,8 @@ class RepoMetadata:
     has_docs: bool = False
     has_ci: bool = False
     similarity_hash: str = ""
+    minhash: List[int] = field(default_factory=list)  # Not included in to_dict()
+    content_tlsh: str = ""  # Fuzzy hash of source contents (needs python-tlsh)
     project_type: str = "unknown"
     status: str = "unknown"  # active, archived, abandoned, duplicate
     notes: str = ""
@@ -78,8 +466,18 @@ class RepoMetadata:
         data["technologies"] = sorted(list(self.technologies))
         data["frameworks"] = sorted(list(self.frameworks))
         data["dependencies"] = sorted(list(self.dependencies))
+        del data["minhash"]
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RepoMetadata":
+        """Rebuild metadata from to_dict() output (plus an optional "minhash")."""
+        data = dict(data)
+        data["path"] = Path(data["path"])
+        for key in ("technologies", "frameworks", "dependencies"):
+            data[key] = set(data[key])
+        return cls(**data)
+
 
 class RepoAnalyzer:
     """Comprehensive repository analyzer."""
@@ -104,16 +502,41 @@ class RepoAnalyzer:
         "rails": ["Gemfile", "config.ru"],
     }
 
-    def __init__(self, repos_dir: Path):
-        """Initialize analyzer."""
+    # Directories never walked (.git and other dot-directories are pruned too)
+    IGNORE_DIRS = frozenset({
+        ".git", "node_modules", "__pycache__", ".venv", "venv",
+        "target", "dist", "build", ".next", ".cache",
+    })
+
+    # Test framework indicators
+    TEST_PATTERNS = {
+        "pytest": ["pytest", "test_", "_test.py"],
+        "jest": ["jest", ".test.js", ".spec.js"],
+        "mocha": ["mocha", ".test.js"],
+        "unittest": ["unittest", "test_"],
+        "junit": ["junit", "Test.java"],
+    }
+
+    def __init__(self, repos_dir: Path, use_cache: bool = True):
+        """
+        Initialize analyzer.
+
+        Args:
+            repos_dir: Directory containing repositories
+            use_cache: Reuse file indexes and metadata cached under CACHE_DIR
+        """
         self.repos_dir = Path(repos_dir).expanduser().resolve()
+        self.use_cache = use_cache
+        self._indicators = _IndicatorMatcher(
+            [(i, f"framework:{name}") for name, items in self.FRAMEWORKS.items() for i in items]
+            + [(p, f"test:{name}") for name, items in self.TEST_PATTERNS.items() for p in items]
+        )
         self.repos: Dict[str, RepoMetadata] = {}
         self.similarity_groups: Dict[str, List[str]] = defaultdict(list)
 
     def analyze_repo(self, repo_path: Path) -> RepoMetadata:
         """Analyze a single repository."""
         repo_name = repo_path.name
-        print(f"  Analyzing {repo_name}...", end="\r")
 
         metadata = RepoMetadata(name=repo_name, path=repo_path)
 
@@ -126,228 +549,288 @@ class RepoAnalyzer:
             metadata.status = "not-git"
             return metadata
 
+        # One walk of the tree (or its cached result) feeds every file-based pass below
+        index = self._file_index(repo_path)
+        files = index.files
+
         # Basic file analysis
-        self._analyze_files(repo_path, metadata)
+        self._analyze_files(repo_path, metadata, index)
 
         # Language detection
-        self._detect_language(repo_path, metadata)
+        self._detect_language(repo_path, metadata, files)
 
         # Technology stack
-        self._detect_technologies(repo_path, metadata)
+        self._detect_technologies(repo_path, metadata, files)
 
         # Dependencies
         self._detect_dependencies(repo_path, metadata)
 
         # Git information
-        self._analyze_git(repo_path, metadata)
+        self._analyze_git(repo_path, metadata, files)
 
         # Project type
         self._detect_project_type(repo_path, metadata)
 
         # Similarity hash
         metadata.similarity_hash = self._calculate_similarity_hash(repo_path, metadata)
+        metadata.minhash = _minhash(self._similarity_tokens(metadata, files))
+        metadata.content_tlsh = _content_tlsh(files)
 
         # Status assessment
         self._assess_status(repo_path, metadata)
 
         return metadata
 
-    def _analyze_files(self, repo_path: Path, metadata: RepoMetadata):
+    def _file_index(self, repo_path: Path) -> FileIndex:
+        """
+        Walk the repository and count its lines, or load the cached result.
+
+        Cache files are keyed by the repository path and the state of
+        .git/HEAD and .git/index, so a commit or checkout invalidates them.
+        Unstaged working-tree edits do not; rerun with caching disabled to
+        see them.
+        """
+        cache_file = _index_cache_file(repo_path) if self.use_cache else None
+        if cache_file is not None:
+            try:
+                data = json.loads(cache_file.read_text(encoding="utf-8"))
+                return FileIndex(
+                    files=[FileEntry(*item) for item in data["files"]],
+                    total_lines=data["total_lines"],
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+        files = self._walk_once(repo_path)
+        text_files = [
+            entry for entry in files
+            if not entry.hidden and entry.suffix in _LINE_COUNT_SUFFIXES
+        ]
+        if len(text_files) >= _PARALLEL_READ_MIN_FILES:
+            # Keep several reads in flight; on network filesystems each
+            # open/read is latency bound and the GIL is released meanwhile
+            with ThreadPoolExecutor(max_workers=_READ_THREADS) as executor:
+                total_lines = sum(executor.map(_count_lines_or_zero, text_files))
+        else:
+            total_lines = sum(map(_count_lines_or_zero, text_files))
+        index = FileIndex(files=files, total_lines=total_lines)
+
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp_file.write_text(
+                    json.dumps({"files": index.files, "total_lines": index.total_lines}),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass
+
+        return index
+
+    def _walk_once(self, repo_path: Path) -> List[FileEntry]:
+        """
+        Collect every file in the repository with a single directory walk.
+
+        Uses os.walk (scandir based, plain strings instead of Path objects)
+        and prunes IGNORE_DIRS and dot-directories other than .github from
+        ``dirnames`` so they are never listed. Symlinked directories are
+        not followed, and (st_dev, st_ino) pairs of visited directories
+        guard against cycles through bind mounts.
+
+        Args:
+            repo_path: Repository root
+
+        Returns:
+            One FileEntry per file (symlinks to files included)
+        """
+        files: List[FileEntry] = []
+        visited: Set[Tuple[int, int]] = set()
+        root = str(repo_path)
+        root_len = len(root) + 1
+
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+            try:
+                st = os.stat(dirpath)
+            except OSError:
+                dirnames[:] = []
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in visited:
+                dirnames[:] = []
+                continue
+            visited.add(key)
+
+            dirnames[:] = [
+                d for d in dirnames
+                if d not in self.IGNORE_DIRS and (d[0] != "." or d == ".github")
+            ]
+
+            rel_dir = dirpath[root_len:].replace(os.sep, "/")
+            if rel_dir:
+                hidden_dir = any(part[0] == "." for part in rel_dir.split("/"))
+                rel_dir += "/"
+            else:
+                hidden_dir = False
+
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    size = os.stat(path).st_size
+                except OSError:
+                    size = 0  # Broken symlink
+                files.append(FileEntry(
+                    path=path,
+                    rel_path=rel_dir + name,
+                    name=name,
+                    suffix=os.path.splitext(name)[1],
+                    size=size,
+                    hidden=hidden_dir or (name[0] == "." and name != ".gitignore"),
+                ))
+
+        return files
+
+    def _analyze_files(self, repo_path: Path, metadata: RepoMetadata, index: FileIndex):
         """Analyze files in repository."""
-        total_lines = 0
         file_count = 0
         languages = defaultdict(int)
 
-        for file_path in repo_path.rglob("*"):
-            if file_path.is_dir():
-                continue
+        for entry in index.files:
+            # CI config lives in dot paths, so check before skipping them
+            if entry.rel_path.startswith(".github/workflows/") or entry.rel_path in (
+                ".gitlab-ci.yml", ".travis.yml"
+            ):
+                metadata.has_ci = True
 
-            # Skip .git and common ignore patterns
-            if any(part.startswith(".") and part != ".gitignore" for part in file_path.parts):
+            # Skip dotfiles and dot-directories
+            if entry.hidden:
                 continue
 
             file_count += 1
+            name = entry.name
 
             # Check for important files
-            if file_path.name.lower() == "readme.md":
+            if name.lower() == "readme.md":
                 metadata.has_readme = True
-            elif file_path.name.lower() in ["license", "license.txt", "license.md"]:
+            elif name.lower() in ["license", "license.txt", "license.md"]:
                 metadata.has_license = True
-            elif file_path.name == "requirements.txt":
+            elif name == "requirements.txt":
                 metadata.has_requirements = True
-            elif file_path.name == "package.json":
+            elif name == "package.json":
                 metadata.has_package_json = True
-            elif file_path.name == "pyproject.toml":
+            elif name == "pyproject.toml":
                 metadata.has_pyproject = True
-            elif file_path.name == "Cargo.toml":
+            elif name == "Cargo.toml":
                 metadata.has_cargo = True
-            elif file_path.name == "go.mod":
+            elif name == "go.mod":
                 metadata.has_go_mod = True
-            elif file_path.name in ["Dockerfile", "docker-compose.yml"]:
+            elif name in ["Dockerfile", "docker-compose.yml"]:
                 metadata.technologies.add("docker")
-            elif file_path.name in [".github/workflows", ".gitlab-ci.yml", ".travis.yml"]:
-                metadata.has_ci = True
 
-            # Count lines
-            try:
-                if file_path.suffix:
-                    ext = file_path.suffix[1:]  # Remove dot
-                    if ext:
-                        languages[ext] += 1
-
-                # Count lines for text files
-                if file_path.suffix in [".py", ".js", ".ts", ".rs", ".go", ".java", ".md", ".txt"]:
-                    try:
-                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                            lines = len(f.readlines())
-                            total_lines += lines
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            if entry.suffix:
+                ext = entry.suffix[1:]  # Remove dot
+                if ext:
+                    languages[ext] += 1
 
         metadata.file_count = file_count
-        metadata.total_lines = total_lines
+        metadata.total_lines = index.total_lines
         metadata.languages = dict(languages)
 
-    def _detect_language(self, repo_path: Path, metadata: RepoMetadata):
+    def _detect_language(self, repo_path: Path, metadata: RepoMetadata, files: List[FileEntry]):
         """Detect primary programming language."""
-        lang_counts = defaultdict(int)
-
-        for file_path in repo_path.rglob("*"):
-            if file_path.is_file():
-                ext = file_path.suffix.lower()
-                if ext in [".py"]:
-                    lang_counts["Python"] += 1
-                elif ext in [".js", ".jsx"]:
-                    lang_counts["JavaScript"] += 1
-                elif ext in [".ts", ".tsx"]:
-                    lang_counts["TypeScript"] += 1
-                elif ext in [".rs"]:
-                    lang_counts["Rust"] += 1
-                elif ext in [".go"]:
-                    lang_counts["Go"] += 1
-                elif ext in [".java"]:
-                    lang_counts["Java"] += 1
-                elif ext in [".cpp", ".cc", ".cxx"]:
-                    lang_counts["C++"] += 1
-                elif ext in [".c"]:
-                    lang_counts["C"] += 1
+        lang_counts = Counter(
+            lang for lang in (_EXT_TO_LANG.get(entry.suffix.lower()) for entry in files) if lang
+        )
 
         if lang_counts:
             metadata.primary_language = max(lang_counts.items(), key=lambda x: x[1])[0]
             metadata.language = metadata.primary_language
 
-    def _detect_technologies(self, repo_path: Path, metadata: RepoMetadata):
+    def _detect_technologies(self, repo_path: Path, metadata: RepoMetadata, files: List[FileEntry]):
         """Detect technologies and frameworks."""
-        # Check for framework indicators
-        for framework, indicators in self.FRAMEWORKS.items():
-            for indicator in indicators:
-                if (repo_path / indicator).exists() or any(
-                    indicator in str(f) for f in repo_path.rglob("*")
-                ):
-                    metadata.frameworks.add(framework)
-                    break
-
-        # Check for test frameworks
-        test_patterns = {
-            "pytest": ["pytest", "test_", "_test.py"],
-            "jest": ["jest", ".test.js", ".spec.js"],
-            "mocha": ["mocha", ".test.js"],
-            "unittest": ["unittest", "test_"],
-            "junit": ["junit", "Test.java"],
-        }
-
-        for test_framework, patterns in test_patterns.items():
-            for pattern in patterns:
-                if any(pattern in str(f) for f in repo_path.rglob("*")):
-                    metadata.has_tests = True
-                    metadata.test_framework = test_framework
-                    break
+        # File and directory names, plus file stems ("jest" for jest.config.js)
+        names: Set[str] = set()
+        suffixes: Set[str] = set()
+        for entry in files:
+            names.update(entry.rel_path.split("/"))
+            names.add(entry.name.split(".", 1)[0])
+            suffixes.add(entry.suffix)
+
+        # Framework and test indicators in one pass over the names
+        found = self._indicators.match(names, suffixes)
+
+        for framework in self.FRAMEWORKS:
+            if f"framework:{framework}" in found:
+                metadata.frameworks.add(framework)
+
+        # Check for test frameworks (the last one listed that matches wins)
+        for test_framework in self.TEST_PATTERNS:
+            if f"test:{test_framework}" in found:
+                metadata.has_tests = True
+                metadata.test_framework = test_framework
 
     def _detect_dependencies(self, repo_path: Path, metadata: RepoMetadata):
         """Detect dependencies from package files."""
         # Python
         if (repo_path / "requirements.txt").exists():
             try:
-                with open(repo_path / "requirements.txt", "r") as f:
-                    for line in f:
-                        dep = line.strip().split("==")[0].split(">=")[0].split("<=")[0]
-                        if dep and not dep.startswith("#"):
-                            metadata.dependencies.add(dep.lower())
+                data = (repo_path / "requirements.txt").read_bytes()
+                metadata.dependencies.update(
+                    m.group(1).decode("ascii").lower() for m in _REQ_RE.finditer(data)
+                )
             except Exception:
                 pass
 
         # Node.js
         if (repo_path / "package.json").exists():
             try:
-                with open(repo_path / "package.json", "r") as f:
-                    pkg_data = json.load(f)
-                    deps = pkg_data.get("dependencies", {})
-                    dev_deps = pkg_data.get("devDependencies", {})
-                    for dep in list(deps.keys()) + list(dev_deps.keys()):
-                        metadata.dependencies.add(dep.lower())
+                data = (repo_path / "package.json").read_bytes()
+                pkg_data = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                metadata.dependencies.update(
+                    dep.lower() for dep in pkg_data.get("dependencies", {})
+                )
+                metadata.dependencies.update(
+                    dep.lower() for dep in pkg_data.get("devDependencies", {})
+                )
             except Exception:
                 pass
 
-    def _analyze_git(self, repo_path: Path, metadata: RepoMetadata):
+    def _analyze_git(self, repo_path: Path, metadata: RepoMetadata, files: List[FileEntry]):
         """Analyze git repository information."""
         try:
-            # Last commit
+            # Last commit date and commit count from one log of HEAD
             result = subprocess.run(
-                ["git", "log", "-1", "--format=%H|%ai", "--no-color"],
+                ["git", "log", "--format=%ai", "-z", "--no-color", "HEAD"],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split("|")
-                if len(parts) == 2:
-                    metadata.last_commit = parts[1]
+            if result.returncode == 0 and result.stdout:
+                metadata.commit_count = result.stdout.count("\0")
+                metadata.last_commit = result.stdout.split("\0", 1)[0].strip() or None
 
-            # Commit count
+            # Remote branch and tag counts from one ref listing
             result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
+                ["git", "for-each-ref", "--format=%(refname)", "refs/remotes", "refs/tags"],
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
             if result.returncode == 0:
-                try:
-                    metadata.commit_count = int(result.stdout.strip())
-                except ValueError:
-                    pass
-
-            # Branch count
-            result = subprocess.run(
-                ["git", "branch", "-r"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                metadata.branch_count = len([b for b in result.stdout.split("\n") if b.strip()])
-
-            # Tag count
-            result = subprocess.run(
-                ["git", "tag"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                metadata.tag_count = len([t for t in result.stdout.split("\n") if t.strip()])
+                refs = result.stdout.split()
+                metadata.branch_count = sum(1 for ref in refs if ref.startswith("refs/remotes/"))
+                metadata.tag_count = len(refs) - metadata.branch_count
 
         except Exception:
             pass
 
-        # Repository size
+        # Repository size: walked working tree plus git's object store
         try:
-            total_size = sum(f.stat().st_size for f in repo_path.rglob("*") if f.is_file())
+            total_size = sum(entry.size for entry in files)
+            total_size += self._git_objects_size(repo_path)
             metadata.size_mb = total_size / (1024 * 1024)
         except Exception:
             pass
@@ -355,6 +838,24 @@ class RepoAnalyzer:
         # Check if empty
         metadata.is_empty = metadata.commit_count == 0
 
+    def _git_objects_size(self, repo_path: Path) -> int:
+        """Bytes used by loose, packed and garbage objects (git count-objects -v)."""
+        result = subprocess.run(
+            ["git", "count-objects", "-v"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            return 0
+        size_kib = 0
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(":")
+            if key in ("size", "size-pack", "size-garbage"):
+                size_kib += int(value)
+        return size_kib * 1024
+
     def _detect_project_type(self, repo_path: Path, metadata: RepoMetadata):
         """Detect project type/category."""
         name_lower = metadata.name.lower()
@@ -396,6 +897,15 @@ class RepoAnalyzer:
         
         return hashlib.md5(hash_input.encode()).hexdigest()[:16]
 
+    def _similarity_tokens(self, metadata: RepoMetadata, files: List[FileEntry]) -> Set[str]:
+        """Dependency names and top-level file names, for MinHash similarity."""
+        tokens = {f"dep:{dep}" for dep in metadata.dependencies}
+        tokens.update(
+            f"file:{entry.name}" for entry in files
+            if not entry.hidden and "/" not in entry.rel_path
+        )
+        return tokens
+
     def _assess_status(self, repo_path: Path, metadata: RepoMetadata):
         """Assess repository status."""
         if metadata.is_empty:
@@ -419,8 +929,17 @@ class RepoAnalyzer:
         else:
             metadata.status = "unknown"
 
-    def analyze_all(self) -> Dict[str, RepoMetadata]:
-        """Analyze all repositories."""
+    def analyze_all(self, jobs: Optional[int] = None) -> Dict[str, RepoMetadata]:
+        """
+        Analyze all repositories.
+
+        Repositories share nothing, so they are analyzed in a process pool.
+        With caching enabled, repositories unchanged since a previous run
+        are loaded from the metadata cache instead of being analyzed.
+
+        Args:
+            jobs: Worker processes (default: CPU count, 1 for in-process)
+        """
         if not self.repos_dir.exists():
             print(f"❌ Directory not found: {self.repos_dir}")
             return {}
@@ -429,34 +948,105 @@ class RepoAnalyzer:
 
         print(f"📊 Analyzing {len(repos)} repositories...\n")
 
+        cache = _MetadataCache() if self.use_cache else None
+        results: Dict[Path, RepoMetadata] = {}
+        if cache is not None:
+            for repo_path in repos:
+                metadata = cache.get(repo_path)
+                if metadata is not None:
+                    # Status depends on today's date, not just the repo state
+                    self._assess_status(repo_path, metadata)
+                    results[repo_path] = metadata
+            if results:
+                print(f"  ♻️  {len(results)} unchanged repositories loaded from cache")
+        pending = [repo_path for repo_path in repos if repo_path not in results]
+
+        jobs = jobs or os.cpu_count() or 1
+        bar = tqdm(total=len(pending), desc="Analyzing", unit="repo") if TQDM_AVAILABLE else None
+        report_every = max(1, len(pending) // 10)
+        try:
+            for done, (repo_path, metadata) in enumerate(self._analyze_pending(pending, jobs), 1):
+                results[repo_path] = metadata
+                if cache is not None:
+                    cache.put(metadata)
+                if bar is not None:
+                    bar.update(1)
+                    bar.set_postfix_str(metadata.name)
+                elif done % report_every == 0 or done == len(pending):
+                    print(f"  {done}/{len(pending)} analyzed")
+        finally:
+            if bar is not None:
+                bar.close()
+            if cache is not None:
+                cache.close()
+
+        # Keep directory order regardless of completion order
         for repo_path in repos:
-            metadata = self.analyze_repo(repo_path)
+            metadata = results[repo_path]
             self.repos[metadata.name] = metadata
-            print(f"  ✅ {metadata.name} analyzed")
 
         return self.repos
 
+    def _analyze_pending(
+        self, pending: List[Path], jobs: int
+    ) -> Iterator[Tuple[Path, RepoMetadata]]:
+        """Yield (repo path, metadata) as analyses finish, in a process pool if jobs > 1."""
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                futures = {
+                    executor.submit(_analyze_repo_worker, repo_path, self.use_cache): repo_path
+                    for repo_path in pending
+                }
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+        else:
+            for repo_path in pending:
+                yield repo_path, self.analyze_repo(repo_path)
+
     def find_similar_repos(self) -> Dict[str, List[str]]:
         """Find similar/duplicate repositories."""
         similarity_groups = defaultdict(list)
 
+        # Name words per repo, inverted so only repos sharing a word are compared
+        name_words = {
+            name: frozenset(name.lower().replace("-", " ").replace("_", " ").split())
+            for name in self.repos
+        }
+        word_index: Dict[str, Set[str]] = defaultdict(set)
+        for name, words in name_words.items():
+            for word in words:
+                word_index[word].add(name)
+        order = {name: i for i, name in enumerate(self.repos)}
+        name_pairs: Set[Tuple[str, str]] = set()
+
         for name, metadata in self.repos.items():
             # Group by similarity hash
             similarity_groups[metadata.similarity_hash].append(name)
 
-            # Also check name similarity
-            for other_name, other_metadata in self.repos.items():
-                if name == other_name:
-                    continue
-
-                # Check if names are similar
-                name_words = set(name.lower().replace("-", " ").replace("_", " ").split())
-                other_words = set(other_name.lower().replace("-", " ").replace("_", " ").split())
-
-                if name_words & other_words:  # Has common words
-                    if metadata.similarity_hash == other_metadata.similarity_hash:
-                        # Same project characteristics
-                        similarity_groups[f"similar_{name}"].append(other_name)
+            # Also check name similarity (repos with common words)
+            candidates = set().union(*(word_index[w] for w in name_words[name]))
+            candidates.discard(name)
+            name_pairs.update((name, other) for other in candidates if name < other)
+            for other_name in sorted(candidates, key=order.__getitem__):
+                if metadata.similarity_hash == self.repos[other_name].similarity_hash:
+                    # Same project characteristics
+                    similarity_groups[f"similar_{name}"].append(other_name)
+
+        # Near duplicates: MinHash LSH candidates, clustered by estimated Jaccard
+        lsh_pairs = _lsh_candidate_pairs(self.repos)
+        for group in _near_duplicate_groups(self.repos, lsh_pairs):
+            similarity_groups[f"near_{group[0]}"] = group
+
+        # Copied code: TLSH distance over candidates from either index above
+        if TLSH_AVAILABLE:
+            content_pairs = [
+                (a, b) for a, b in name_pairs | lsh_pairs
+                if self.repos[a].content_tlsh and self.repos[b].content_tlsh
+                and tlsh.diff(self.repos[a].content_tlsh, self.repos[b].content_tlsh)
+                < _TLSH_MAX_DISTANCE
+            ]
+            for group in _clusters(content_pairs):
+                similarity_groups[f"content_{group[0]}"] = group
 
         # Filter to only groups with multiple repos
         return {k: v for k, v in similarity_groups.items() if len(v) > 1}
@@ -465,46 +1055,31 @@ class RepoAnalyzer:
         """Generate comprehensive analysis report."""
         similar = self.find_similar_repos()
 
+        metas = list(self.repos.values())
         report = {
             "analysis_date": datetime.now().isoformat(),
             "total_repos": len(self.repos),
             "repositories": {name: meta.to_dict() for name, meta in self.repos.items()},
             "similarity_groups": similar,
             "summary": {
-                "by_language": defaultdict(int),
-                "by_type": defaultdict(int),
-                "by_status": defaultdict(int),
-                "with_readme": 0,
-                "with_license": 0,
-                "with_tests": 0,
-                "total_lines": 0,
-                "total_size_mb": 0.0,
+                "by_language": dict(Counter(m.primary_language for m in metas)),
+                "by_type": dict(Counter(m.project_type for m in metas)),
+                "by_status": dict(Counter(m.status for m in metas)),
+                "with_readme": sum(m.has_readme for m in metas),
+                "with_license": sum(m.has_license for m in metas),
+                "with_tests": sum(m.has_tests for m in metas),
+                "total_lines": sum(m.total_lines for m in metas),
+                "total_size_mb": sum((m.size_mb for m in metas), 0.0),
             },
         }
 
-        # Calculate summary statistics
-        for metadata in self.repos.values():
-            report["summary"]["by_language"][metadata.primary_language] += 1
-            report["summary"]["by_type"][metadata.project_type] += 1
-            report["summary"]["by_status"][metadata.status] += 1
-            if metadata.has_readme:
-                report["summary"]["with_readme"] += 1
-            if metadata.has_license:
-                report["summary"]["with_license"] += 1
-            if metadata.has_tests:
-                report["summary"]["with_tests"] += 1
-            report["summary"]["total_lines"] += metadata.total_lines
-            report["summary"]["total_size_mb"] += metadata.size_mb
-
-        # Convert defaultdicts to dicts
-        report["summary"]["by_language"] = dict(report["summary"]["by_language"])
-        report["summary"]["by_type"] = dict(report["summary"]["by_type"])
-        report["summary"]["by_status"] = dict(report["summary"]["by_status"])
-
         # Save report
         output_path = Path(output_file)
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w") as f:
+                json.dump(report, f, indent=2)
 
         return report
 
@@ -549,6 +1124,11 @@ class RepoAnalyzer:
                 print(f"   ... and {len(similar) - 10} more groups")
 
 
+def _analyze_repo_worker(repo_path: Path, use_cache: bool = True) -> RepoMetadata:
+    """Analyze one repository in a worker process (module level so it pickles)."""
+    return RepoAnalyzer(repo_path.parent, use_cache=use_cache).analyze_repo(repo_path)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Professional repository analyzer")
@@ -568,11 +1148,31 @@ def main():
         action="store_true",
         help="Only print summary, don't save full report",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Repositories analyzed in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every repository instead of using cached indexes and metadata",
+    )
+    parser.add_argument(
+        "--purge-cache",
+        action="store_true",
+        help=f"Delete the caches under {CACHE_DIR} before analyzing",
+    )
 
     args = parser.parse_args()
 
-    analyzer = RepoAnalyzer(args.repos_dir)
-    repos = analyzer.analyze_all()
+    if args.purge_cache:
+        purge_caches()
+        print(f"🧹 Cleared analyzer caches in {CACHE_DIR}")
+
+    analyzer = RepoAnalyzer(args.repos_dir, use_cache=not args.no_cache)
+    repos = analyzer.analyze_all(jobs=args.jobs)
 
     if not repos:
         print("❌ No repositories found or analyzed")
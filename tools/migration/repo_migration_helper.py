@@ -19,74 +19,131 @@ Usage:
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Clones run in worker threads; serialize output so lines don't interleave
+_print_lock = threading.Lock()
+
+
+def _log(message: str = "") -> None:
+    """Print a line while holding the shared output lock."""
+    with _print_lock:
+        print(message)
+
 
 class RepoMigrationHelper:
     """Helps manage repository migration and review workflow."""
 
-    def __init__(self, review_dir: str = "/home/dream/Development/projects/repositories/old-account", old_account: str = "Victor-Dixon"):
+    # Completed clones between status file writes in clone_from_list
+    STATUS_FLUSH_EVERY = 10
+
+    def __init__(
+        self,
+        review_dir: str = "/home/dream/Development/projects/repositories/old-account",
+        old_account: str = "Victor-Dixon",
+        full_history: bool = False,
+        with_submodules: bool = False,
+        refresh: bool = False,
+    ):
         """
         Initialize migration helper.
 
         Args:
             review_dir: Directory to store repositories for review
             old_account: Old GitHub account name
+            full_history: Clone all branches, tags and history instead of
+                a shallow single-branch snapshot
+            with_submodules: Also clone submodules, several in parallel
+            refresh: Fetch updates into existing clones instead of skipping them
         """
         self.review_dir = Path(review_dir).expanduser().resolve()
         self.review_dir.mkdir(parents=True, exist_ok=True)
         self.status_file = self.review_dir / "migration_status.json"
         self.old_account = old_account
+        self.full_history = full_history
+        self.with_submodules = with_submodules
+        self.refresh = refresh
         self.status = self._load_status()
+        # Guards self.status and the status file when cloning in parallel
+        self._status_lock = threading.Lock()
 
     def _load_status(self) -> Dict:
         """Load migration status from file."""
         if self.status_file.exists():
             try:
-                with open(self.status_file, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
+                # Whole-file bytes read: no buffered text stream to set up
+                data = self.status_file.read_bytes()
+                return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            except json.JSONDecodeError:  # orjson's error subclasses it
                 return {"repos": {}}
         return {"repos": {}}
 
     def _save_status(self):
         """Save migration status to file."""
-        with open(self.status_file, "w") as f:
-            json.dump(self.status, f, indent=2)
-
-    def clone_repo(self, repo_name: str, clone_url: Optional[str] = None) -> bool:
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.status, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.status, indent=2).encode()
+        self.status_file.write_bytes(payload)
+
+    def clone_repo(
+        self, repo_name: str, clone_url: Optional[str] = None, save: bool = True
+    ) -> bool:
         """
         Clone a repository locally for review.
 
         Args:
             repo_name: Repository name
             clone_url: Optional full clone URL (if not provided, constructs from old_account)
+            save: Write the status file now (batch callers save once at the end)
 
         Returns:
             True if successful, False otherwise
         """
         if not clone_url:
             if not self.old_account:
-                print(f"Error: Need old_account or clone_url for {repo_name}")
+                _log(f"Error: Need old_account or clone_url for {repo_name}")
                 return False
             clone_url = f"https://github.com/{self.old_account}/{repo_name}.git"
 
         repo_path = self.review_dir / repo_name
 
         if repo_path.exists():
-            print(f"⚠️  {repo_name} already exists, skipping clone")
+            if self.refresh and (repo_path / ".git").is_dir():
+                return self._refresh_repo(repo_name, repo_path, clone_url, save)
+            _log(f"⚠️  {repo_name} already exists, skipping clone")
             return True
 
-        print(f"📥 Cloning {repo_name}...")
+        _log(f"📥 Cloning {repo_name}...")
         try:
+            cmd = ["git", "clone"]
+            if not self.full_history:
+                # Review only needs the current code; history is fetched
+                # again by the publish script before pushing
+                cmd += ["--depth=1", "--single-branch", "--no-tags"]
+            if self.with_submodules:
+                cmd += ["--recurse-submodules", f"--jobs={os.cpu_count() or 4}"]
+                if not self.full_history:
+                    cmd.append("--shallow-submodules")
+            # Only stderr is read (for the failure message)
             subprocess.run(
-                ["git", "clone", clone_url, str(repo_path)],
+                cmd + [clone_url, str(repo_path)],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
 
@@ -94,36 +151,87 @@ class RepoMigrationHelper:
             subprocess.run(
                 ["git", "remote", "remove", "origin"],
                 cwd=repo_path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
             )
 
-            # Initialize status
-            if "repos" not in self.status:
-                self.status["repos"] = {}
-
-            self.status["repos"][repo_name] = {
-                "cloned_at": datetime.now().isoformat(),
-                "status": "cloned",
-                "review_status": "pending",
-                "ready_for_publication": False,
-                "notes": "",
-                "path": str(repo_path),
-            }
-            self._save_status()
-
-            print(f"✅ {repo_name} cloned successfully")
+            with self._status_lock:
+                # Initialize status
+                if "repos" not in self.status:
+                    self.status["repos"] = {}
+
+                self.status["repos"][repo_name] = {
+                    "cloned_at": datetime.now().isoformat(),
+                    "status": "cloned",
+                    "review_status": "pending",
+                    "ready_for_publication": False,
+                    "notes": "",
+                    "path": str(repo_path),
+                    "clone_url": clone_url,
+                    "clone_mode": "full" if self.full_history else "shallow",
+                    "has_submodules": (repo_path / ".gitmodules").exists(),
+                }
+                if save:
+                    self._save_status()
+
+            _log(f"✅ {repo_name} cloned successfully")
             return True
 
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to clone {repo_name}: {e.stderr}")
+            _log(f"❌ Failed to clone {repo_name}: {e.stderr}")
+            return False
+
+    def _refresh_repo(
+        self, repo_name: str, repo_path: Path, clone_url: str, save: bool = True
+    ) -> bool:
+        """
+        Fetch the latest upstream commit into an existing clone.
+
+        The clone has no origin remote, so the fetch goes straight to the URL
+        and lands in FETCH_HEAD; the working tree (and any review edits) is
+        left alone.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        _log(f"🔄 Refreshing {repo_name}...")
+        cmd = ["git", "-C", str(repo_path), "fetch"]
+        try:
+            # Follow how this repo was cloned, not the current run's mode:
+            # --depth on a full clone would make it shallow
+            shallow = subprocess.run(
+                ["git", "-C", str(repo_path), "rev-parse", "--is-shallow-repository"],
+                check=True, capture_output=True, text=True,
+            ).stdout.strip() == "true"
+            if shallow:
+                cmd.append("--depth=1")
+            subprocess.run(cmd + [clone_url], check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            _log(f"❌ Failed to refresh {repo_name}: {e.stderr}")
             return False
 
-    def clone_from_list(self, repo_list_file: str):
+        with self._status_lock:
+            info = self.status.setdefault("repos", {}).get(repo_name)
+            if info is not None:
+                info["updated_at"] = datetime.now().isoformat()
+                if save:
+                    self._save_status()
+
+        _log(f"✅ {repo_name} refreshed (latest upstream in FETCH_HEAD)")
+        return True
+
+    def clone_from_list(self, repo_list_file: str, jobs: int = 8):
         """
         Clone multiple repositories from a list file.
 
+        Clones are network-bound, so they run concurrently in a thread pool.
+        The status file is written every STATUS_FLUSH_EVERY clones and once
+        at the end rather than after each clone.
+
         Args:
             repo_list_file: Path to file with repository names/URLs (one per line)
+            jobs: Number of clones to run in parallel
         """
         repo_list_path = Path(repo_list_file).expanduser()
         if not repo_list_path.exists():
@@ -135,14 +243,39 @@ class RepoMigrationHelper:
 
         print(f"📋 Found {len(repos)} repositories to clone\n")
 
-        for repo_line in repos:
-            # Handle both formats: "repo-name" or "https://github.com/account/repo.git"
-            if repo_line.startswith("http"):
-                # Extract repo name from URL
-                repo_name = repo_line.split("/")[-1].replace(".git", "")
-                self.clone_repo(repo_name, repo_line)
-            else:
-                self.clone_repo(repo_line)
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = {}
+            for repo_line in repos:
+                # Handle both formats: "repo-name" or "https://github.com/account/repo.git"
+                if repo_line.startswith("http"):
+                    # Extract repo name from URL
+                    repo_name = repo_line.split("/")[-1].replace(".git", "")
+                    future = executor.submit(self.clone_repo, repo_name, repo_line, False)
+                else:
+                    repo_name = repo_line
+                    future = executor.submit(self.clone_repo, repo_line, None, False)
+                futures[future] = repo_name
+
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    repo_name = futures[future]
+                    try:
+                        if not future.result():
+                            failed.append(repo_name)
+                    except Exception as e:
+                        _log(f"❌ Error cloning {repo_name}: {e}")
+                        failed.append(repo_name)
+                    if done % self.STATUS_FLUSH_EVERY == 0:
+                        with self._status_lock:
+                            self._save_status()
+            finally:
+                with self._status_lock:
+                    self._save_status()
+
+        _log(f"\n📊 {len(repos) - len(failed)} succeeded, {len(failed)} failed")
+        for repo_name in sorted(failed):
+            _log(f"   ❌ {repo_name}")
 
     def update_review_status(
         self, repo_name: str, status: str, notes: str = "", ready: bool = False
@@ -219,22 +352,33 @@ class RepoMigrationHelper:
             print("No repositories ready for publication.")
             return
 
-        script_path = Path(output_file)
-        with open(script_path, "w") as f:
-            f.write("#!/bin/bash\n")
-            f.write("# Auto-generated script to publish ready repositories\n")
-            f.write("# Review and update NEW_ACCOUNT before running\n\n")
-            f.write("NEW_ACCOUNT=\"your-new-github-account\"\n\n")
-
-            for repo_name, info in sorted(ready_repos.items()):
-                repo_path = info.get("path", "")
-                f.write(f"# Publishing {repo_name}\n")
-                f.write(f"cd {repo_path}\n")
-                f.write(f"gh repo create $NEW_ACCOUNT/{repo_name} --private --source=. --remote=new-origin\n")
-                f.write(f"git push new-origin --all\n")
-                f.write(f"git push new-origin --tags\n")
-                f.write(f"echo \"✅ {repo_name} published\"\n\n")
+        # Assemble the whole script and write it in one go
+        lines = [
+            "#!/bin/bash\n",
+            "# Auto-generated script to publish ready repositories\n",
+            "# Review and update NEW_ACCOUNT before running\n\n",
+            "NEW_ACCOUNT=\"your-new-github-account\"\n\n",
+        ]
+        for repo_name, info in sorted(ready_repos.items()):
+            repo_path = info.get("path", "")
+            lines.append(f"# Publishing {repo_name}\n")
+            lines.append(f"cd {repo_path}\n")
+            if info.get("clone_mode") == "shallow" and info.get("clone_url"):
+                # Restore full history and the tags the clone skipped before
+                # publishing; local branches (and any review commits on them)
+                # are left untouched
+                lines.append(f"git fetch --unshallow --tags {info['clone_url']}\n")
+            lines.append(f"gh repo create $NEW_ACCOUNT/{repo_name} --private --source=. --remote=new-origin\n")
+            if info.get("has_submodules"):
+                # Submodules keep the URLs in .gitmodules; new-origin only
+                # exists in the superproject, so they are not pushed here
+                lines.append("# Submodules still point at their original remotes; publish them separately\n")
+            lines.append(f"git push new-origin --all\n")
+            lines.append(f"git push new-origin --tags\n")
+            lines.append(f"echo \"✅ {repo_name} published\"\n\n")
 
+        script_path = Path(output_file)
+        script_path.write_text("".join(lines))
         script_path.chmod(0o755)
         print(f"✅ Generated publish script: {script_path}")
         print(f"   Review and update NEW_ACCOUNT before running")
@@ -263,6 +407,27 @@ def main():
         default="",
         help="Old GitHub account name (for constructing clone URLs)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of repositories to clone in parallel (default: 8)",
+    )
+    parser.add_argument(
+        "--full-history",
+        action="store_true",
+        help="Clone full history, all branches and tags (default: shallow single-branch)",
+    )
+    parser.add_argument(
+        "--with-submodules",
+        action="store_true",
+        help="Also clone submodules, in parallel (off by default: costs bandwidth)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Fetch updates into repositories that are already cloned instead of skipping them",
+    )
     parser.add_argument(
         "--status",
         action="store_true",
@@ -292,11 +457,15 @@ def main():
     args = parser.parse_args()
 
     helper = RepoMigrationHelper(
-        review_dir=args.review_dir, old_account=args.old_account
+        review_dir=args.review_dir,
+        old_account=args.old_account,
+        full_history=args.full_history,
+        with_submodules=args.with_submodules,
+        refresh=args.refresh,
     )
 
     if args.clone_list:
-        helper.clone_from_list(args.clone_list)
+        helper.clone_from_list(args.clone_list, jobs=args.jobs)
     elif args.clone:
         helper.clone_repo(args.clone)
     elif args.status:
@@ -12,13 +12,27 @@ Comprehensive security auditing tool that combines:
 Architecture: WE ARE SWARM
 """
 
+import asyncio
+import codecs
+import contextlib
+import hashlib
+import importlib.metadata
+import importlib.util
 import json
 import os
 import subprocess
 import sys
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import hyperscan
+    HS_AVAILABLE = True
+except ImportError:
+    HS_AVAILABLE = False
 
 # Patterns for sensitive files/tokens
 SENSITIVE_PATTERNS = {
@@ -40,41 +54,210 @@ SENSITIVE_PATTERNS = {
         (r"sk_live_[a-zA-Z0-9]{24}", "Stripe Secret Key"),
         (r"xox[baprs]-([0-9a-zA-Z]{10,48})", "Slack Token"),
         (r"PRIVATE_KEY_BLOCK_PLACEHOLDER_BEGIN", "Private Key"),
-        (r"AIza[0-9A-Za-z-_]{35}", "Google API Key"),
+        (r"AIza[0-9A-Za-z_-]{35}", "Google API Key"),
         (r"M[a-zA-Z0-9\-]{20,}\.[a-zA-Z0-9\-]{20,}\.[a-zA-Z0-9\-]{20,}", "Discord Token Pattern")
     ]
 }
 
-def run_command(cmd: List[str]) -> str:
-    """Run a shell command and return stdout."""
+# Audit output is reused while the lockfile is unchanged and the entry is fresh
+AUDIT_CACHE_DIR = Path(".cache") / "secscan"
+AUDIT_CACHE_TTL = 24 * 60 * 60
+
+def _compile_file_patterns(patterns: List[str]) -> re.Pattern:
+    """One regex for filename patterns: "*.ext" must end the path, others may appear anywhere."""
+    suffixes = [re.escape(p[1:]) for p in patterns if p.startswith("*")]
+    substrings = [re.escape(p) for p in patterns if not p.startswith("*")]
+    alternatives = substrings + ([f"(?:{'|'.join(suffixes)})$"] if suffixes else [])
+    return re.compile("|".join(alternatives))
+
+
+_SENSITIVE_FILE_RE = _compile_file_patterns(SENSITIVE_PATTERNS["files"])
+_WHITELIST_RE = (
+    re.compile("|".join(map(re.escape, SENSITIVE_PATTERNS["whitelist"])))
+    if SENSITIVE_PATTERNS.get("whitelist") else None
+)
+
+# All content patterns in one bytes alternation, compiled once; the named
+# group that matched maps back to the secret type
+_COMBINED_SECRET_RE = re.compile("|".join(
+    f"(?P<s{i}>{pattern})" for i, (pattern, _) in enumerate(SENSITIVE_PATTERNS["content"])
+).encode())
+_SECRET_NAMES = {
+    f"s{i}": name for i, (_, name) in enumerate(SENSITIVE_PATTERNS["content"])
+}
+
+def _compile_hyperscan_db() -> Optional["hyperscan.Database"]:
+    """Hyperscan database of the content patterns (pattern index as ID), or None."""
+    if not HS_AVAILABLE:
+        return None
+    patterns = SENSITIVE_PATTERNS["content"]
+    db = hyperscan.Database()
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
+        db.compile(
+            expressions=[pattern.encode() for pattern, _ in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns),
         )
-        return result.stdout.strip()
-    except Exception as e:
+    except hyperscan.error:
+        return None  # A pattern Hyperscan can't take; use the regex path
+    return db
+
+_HS_DB = _compile_hyperscan_db()
+
+def _secret_hits(blob: bytes) -> List[Tuple[int, str]]:
+    """
+    ``(start offset, secret type)`` of content pattern matches, in offset order.
+
+    Hyperscan, when installed, matches every pattern in one pass over the
+    blob; otherwise the combined regex is used.
+    """
+    if _HS_DB is None:
+        return [(m.start(), _SECRET_NAMES[m.lastgroup]) for m in _COMBINED_SECRET_RE.finditer(blob)]
+
+    starts = set()
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        starts.add((start, pattern_id))
+
+    _HS_DB.scan(blob, match_event_handler=on_match)
+    names = SENSITIVE_PATTERNS["content"]
+    return [(start, names[pattern_id][1]) for start, pattern_id in sorted(starts)]
+
+async def run_command_async(cmd: List[str]) -> str:
+    """Run a command without blocking the event loop and return stdout."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+        return stdout.decode("utf-8", "replace").strip()
+    except Exception:
         return ""
 
+def _iter_nul_records(cmd: List[str], chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """
+    Yield the NUL-separated records of a command's output as they arrive.
+
+    Records are split off the pipe chunk by chunk, so processing overlaps
+    with the command's output and the full listing is never held in memory.
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return
+    with proc:
+        pending = b""
+        while True:
+            chunk = proc.stdout.read1(chunk_size)
+            if not chunk:
+                break
+            *records, pending = (pending + chunk).split(b"\0")
+            yield from records
+        if pending:
+            yield pending
+
+def iter_tracked_files(chunk_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Yield tracked file paths as ``git ls-files -z`` produces them.
+
+    NUL separation keeps names containing newlines intact.
+    """
+    for path in _iter_nul_records(["git", "ls-files", "-z"], chunk_size):
+        yield os.fsdecode(path)
+
+def _git_batch(mode: str) -> subprocess.Popen:
+    """Start a persistent ``git cat-file`` process in ``--batch`` or ``--batch-check`` mode."""
+    return subprocess.Popen(
+        ["git", "cat-file", f"--{mode}"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=1 << 20,
+    )
+
+def _batch_header(proc: subprocess.Popen, object_id: bytes) -> Optional[int]:
+    """Ask a cat-file batch process for an object; returns its size, None if missing."""
+    proc.stdin.write(object_id + b"\n")
+    proc.stdin.flush()
+    header = proc.stdout.readline().split()
+    return int(header[2]) if len(header) == 3 else None  # "<object> missing"
+
+def _iter_blob_entries() -> Iterator[Tuple[bytes, bytes]]:
+    """Yield ``(path, object id)`` of every tracked regular file in the index."""
+    last_path = None
+    for record in _iter_nul_records(["git", "ls-files", "-s", "-z"]):
+        # "<mode> <object> <stage>\t<path>"; unmerged paths list one
+        # entry per stage, only the first is scanned
+        info, _, path = record.partition(b"\t")
+        mode, object_id, _ = info.split(b" ")
+        if path == last_path or mode not in (b"100644", b"100755"):
+            continue
+        last_path = path
+        yield path, object_id
+
+def _read_blobs(
+    entries: Iterable[Tuple[bytes, bytes]], max_size: Optional[int] = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield ``(path, contents)`` for ``(path, object id)`` entries.
+
+    One persistent ``git cat-file --batch`` process serves every blob, so no
+    git process is spawned per file. With ``max_size``, a ``--batch-check``
+    process looks up sizes first so larger blobs are never read at all.
+    """
+    try:
+        proc = _git_batch("batch")
+        checker = _git_batch("batch-check") if max_size else None
+    except OSError:
+        return
+    with proc, (checker or contextlib.nullcontext()):
+        for path, object_id in entries:
+            if checker is not None:
+                size = _batch_header(checker, object_id)
+                if size is None or size > max_size:
+                    continue
+            size = _batch_header(proc, object_id)
+            if size is None:
+                continue
+            contents = proc.stdout.read(size)
+            proc.stdout.read(1)  # Trailing newline after each object
+            yield os.fsdecode(path), contents
+
+def iter_tracked_blobs(max_size: Optional[int] = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield ``(path, contents)`` for every tracked regular file, as staged.
+
+    Object IDs come from ``git ls-files -s``; submodules and symlinks are
+    skipped. Blobs over ``max_size`` bytes are not read.
+    """
+    return _read_blobs(_iter_blob_entries(), max_size)
+
+def _looks_binary(blob: bytes, sniff: int = 8192) -> bool:
+    """Binary heuristic on the first ``sniff`` bytes: a NUL byte or invalid UTF-8."""
+    head = blob[:sniff]
+    if b"\0" in head:
+        return True
+    try:
+        # Incremental decoder: a character cut off at the sniff boundary is fine
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return True
+    return False
+
 def scan_sensitive_files() -> Dict[str, Any]:
     """Scan for tracked sensitive files in git."""
     print("  🔍 Scanning tracked files...")
-    tracked_files = run_command(["git", "ls-files"]).split("\n")
     found = []
     
-    for file_path in tracked_files:
-        if not file_path: continue
-        
-        # Check filename patterns
-        is_whitelisted = False
-        for w in SENSITIVE_PATTERNS.get("whitelist", []):
-            if w in file_path:
-                is_whitelisted = True
-                break
-        
-        if is_whitelisted:
+    for file_path in iter_tracked_files():
+        # One C-level search rules out almost every file; only hits go
+        # through the per-pattern loop to collect the reasons
+        if not _SENSITIVE_FILE_RE.search(file_path):
+            continue
+        if _WHITELIST_RE is not None and _WHITELIST_RE.search(file_path):
             continue
 
         for pattern in SENSITIVE_PATTERNS["files"]:
@@ -86,35 +269,146 @@ def scan_sensitive_files() -> Dict[str, Any]:
 
     return {"count": len(found), "files": found}
 
-def scan_content_secrets(limit: int = 100) -> Dict[str, Any]:
-    """Scan file content for secret patterns (basic grep)."""
+# Larger blobs are bundles, data or binaries rather than hand-written code
+DEFAULT_MAX_BLOB_SIZE = 1 << 20
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 500
+
+def _scan_blob(file_path: str, blob: bytes) -> List[Tuple[str, str]]:
+    """``(secret type, "path:line:content")`` hits in a blob, one per line and type."""
+    hits = []
+    line_no, line_pos = 1, 0
+    line_end = -1
+    for start, name in _secret_hits(blob):
+        if start > line_end:
+            line_no += blob.count(b"\n", line_pos, start)
+            line_pos = blob.rfind(b"\n", 0, start) + 1
+            line_end = blob.find(b"\n", start)
+            if line_end == -1:
+                line_end = len(blob)
+            content = blob[line_pos:line_end].decode("utf-8", "replace")
+            match_text = f"{file_path}:{line_no}:{content}"[:100]
+            seen = set()
+        if name not in seen:
+            seen.add(name)
+            hits.append((name, match_text))
+    return hits
+
+def _init_scan_worker() -> None:
+    """Process pool initializer: each worker builds its own Hyperscan database."""
+    global _HS_DB
+    _HS_DB = _compile_hyperscan_db()
+
+def _scan_chunk(
+    entries: List[Tuple[bytes, bytes]], indexes: Iterable[int], max_size: Optional[int]
+) -> List[Tuple[int, str, str]]:
+    """
+    Scan a chunk of blob entries through its own ``git cat-file`` pipe.
+
+    Returns ``(entry index, secret type, match text)`` hits; ``indexes``
+    gives each entry's position in the full listing.
+    """
+    index_of = dict(zip((path for path, _ in entries), indexes))
+    hits = []
+    for file_path, blob in _read_blobs(entries, max_size):
+        if _looks_binary(blob):
+            continue
+        index = index_of[os.fsencode(file_path)]
+        hits.extend((index, name, match_text) for name, match_text in _scan_blob(file_path, blob))
+    return hits
+
+def scan_content_secrets(
+    limit: int = 100,
+    max_blob_size: Optional[int] = DEFAULT_MAX_BLOB_SIZE,
+    jobs: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Scan tracked file content for secret patterns.
+
+    Blobs over ``max_blob_size`` bytes (None or 0 for no limit) and files
+    that look binary are skipped without matching. Matching is CPU-bound,
+    so larger repositories are split across ``jobs`` worker processes
+    (default: one per CPU).
+    """
     print("  🔍 Scanning file content for secrets...")
-    found = []
-    
-    # Use git grep if available for speed
-    for pattern, name in SENSITIVE_PATTERNS["content"]:
-        output = run_command(["git", "grep", "-n", "-E", pattern])
-        if output:
-            for line in output.split("\n")[:limit]:
-                if line:
-                    found.append({"match": line[:100], "type": name})
-    
+    jobs = jobs or os.cpu_count() or 1
+    entries = list(_iter_blob_entries())
+    if jobs > 1 and len(entries) >= PARALLEL_SCAN_MIN_FILES:
+        # Round-robin chunks spread large files across workers; hits carry
+        # their entry index so the merged order matches a serial scan
+        chunks = [entries[i::jobs] for i in range(jobs)]
+        offsets = [range(i, len(entries), jobs) for i in range(jobs)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_scan_worker) as executor:
+            results = executor.map(_scan_chunk, chunks, offsets, [max_blob_size] * jobs)
+            hits = sorted(
+                (hit for chunk_hits in results for hit in chunk_hits),
+                key=lambda hit: hit[0],
+            )
+    else:
+        hits = _scan_chunk(entries, range(len(entries)), max_blob_size)
+
+    by_type: Dict[str, List[Dict[str, str]]] = {
+        name: [] for _, name in SENSITIVE_PATTERNS["content"]
+    }
+    for _, name, match_text in hits:
+        if len(by_type[name]) < limit:
+            by_type[name].append({"match": match_text, "type": name})
+
+    found = [hit for hits in by_type.values() for hit in hits]
     return {"count": len(found), "matches": found}
 
-def audit_python_dependencies() -> Dict[str, Any]:
+def _python_environment_key() -> bytes:
+    """Identify the environment pip-audit audits: this interpreter and its installed distributions."""
+    installed = sorted(
+        f"{dist.metadata['Name']}=={dist.version}".lower()
+        for dist in importlib.metadata.distributions()
+    )
+    return "\n".join([sys.executable] + installed).encode()
+
+async def _cached_audit(tool: str, key: Optional[bytes], cmd: List[str], use_cache: bool = True) -> str:
+    """
+    Run an audit command, reusing its JSON output while what it audits is unchanged.
+
+    Output is stored in ``.cache/secscan/{sha256}.json``, keyed by the tool
+    name and ``key`` (the contents of whatever the tool audits), and reused
+    for up to 24 hours. With no key the command always runs.
+    """
+    cache_file = None
+    if key is not None:
+        digest = hashlib.sha256(tool.encode() + b"\0" + key)
+        cache_file = AUDIT_CACHE_DIR / f"{digest.hexdigest()}.json"
+        if use_cache:
+            try:
+                if time.time() - cache_file.stat().st_mtime < AUDIT_CACHE_TTL:
+                    return cache_file.read_text()
+            except OSError:
+                pass
+
+    output = await run_command_async(cmd)
+    if cache_file is not None and output:
+        try:
+            json.loads(output)  # Never cache a failed run
+            AUDIT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(output)
+        except (ValueError, OSError):
+            pass
+    return output
+
+async def audit_python_dependencies(use_cache: bool = True) -> Dict[str, Any]:
     """Audit python dependencies using pip-audit if available."""
     print("  🔍 Auditing Python dependencies...")
     
-    # Check if pip-audit is installed
-    try:
-        import pip_audit
-    except ImportError:
+    # Check if pip-audit is installed; find_spec locates it without
+    # importing the whole package into this process
+    if importlib.util.find_spec("pip_audit") is None:
         return {"status": "skipped", "reason": "pip-audit not installed (run `pip install pip-audit`)"}
 
     try:
-        # Run pip-audit
-        cmd = ["pip-audit", "-f", "json"]
-        output = run_command(cmd)
+        # Run pip-audit under this interpreter, the one find_spec checked,
+        # rather than whichever pip-audit is first on PATH
+        cmd = [sys.executable, "-m", "pip_audit", "-f", "json"]
+        # pip-audit audits the installed environment, so that is the cache key
+        output = await _cached_audit("pip-audit", _python_environment_key(), cmd, use_cache)
         if not output:
             return {"status": "clean", "count": 0}
             
@@ -135,14 +429,20 @@ def audit_python_dependencies() -> Dict[str, Any]:
     except Exception as e:
         return {"status": "error", "reason": str(e)}
 
-def audit_npm_dependencies() -> Dict[str, Any]:
+async def audit_npm_dependencies(use_cache: bool = True) -> Dict[str, Any]:
     """Audit npm dependencies."""
     print("  🔍 Auditing NPM dependencies...")
     
     if not Path("package.json").exists():
         return {"status": "skipped", "reason": "No package.json found"}
         
-    output = run_command(["npm", "audit", "--json"])
+    lockfile = Path("package-lock.json")
+    output = await _cached_audit(
+        "npm-audit",
+        lockfile.read_bytes() if lockfile.exists() else None,
+        ["npm", "audit", "--json"],
+        use_cache,
+    )
     try:
         data = json.loads(output)
         metadata = data.get("metadata", {}).get("vulnerabilities", {})
@@ -159,11 +459,21 @@ def audit_npm_dependencies() -> Dict[str, Any]:
     except Exception:
         return {"status": "error", "reason": "Failed to parse npm audit output"}
 
+async def _run_audits(use_cache: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run the Python and NPM audits concurrently; both mostly wait on the network."""
+    py_audit, npm_audit = await asyncio.gather(
+        audit_python_dependencies(use_cache), audit_npm_dependencies(use_cache)
+    )
+    return py_audit, npm_audit
+
 def main():
     """Main execution."""
     import argparse
     parser = argparse.ArgumentParser(description="Unified Security Scanner")
     parser.add_argument("--warn-only", action="store_true", help="Exit with 0 even if issues found")
+    parser.add_argument("--max-blob-size", type=int, default=DEFAULT_MAX_BLOB_SIZE, help="Skip files larger than this many bytes in the content scan (0 for no limit)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for the content scan (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="Rerun dependency audits even if cached results are fresh")
     args, _ = parser.parse_known_args()
     warn_only = args.warn_only or os.getenv("CI", "").lower() == "true"
 
@@ -181,7 +491,7 @@ def main():
     print("-" * 60)
 
     # 2. Content Scan
-    content_results = scan_content_secrets()
+    content_results = scan_content_secrets(max_blob_size=args.max_blob_size, jobs=args.jobs)
     if content_results["count"] > 0:
         print(f"  ❌ Found {content_results['count']} potential secrets in code:")
         for m in content_results["matches"]:
@@ -190,8 +500,10 @@ def main():
         print("  ✅ No obvious secrets patterns found in code.")
     print("-" * 60)
 
+    # 3-4. Dependency audits, run together
+    py_audit, npm_audit = asyncio.run(_run_audits(use_cache=not args.no_cache))
+
     # 3. Python Audit
-    py_audit = audit_python_dependencies()
     if py_audit["status"] == "found":
         print(f"  ❌ Found {py_audit['count']} Python vulnerabilities:")
         for v in py_audit["vulnerabilities"]:
@@ -203,7 +515,6 @@ def main():
     print("-" * 60)
 
     # 4. NPM Audit
-    npm_audit = audit_npm_dependencies()
     if npm_audit["status"] == "found":
         print(f"  ❌ Found {npm_audit['count']} NPM vulnerabilities:")
         print(f"     {json.dumps(npm_audit['details'], indent=2)}")
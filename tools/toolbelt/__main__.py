@@ -14,34 +14,40 @@ Usage:
 
 from __future__ import annotations
 
-import importlib
-import inspect
-import logging
+import os
 import sys
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
+
+if TYPE_CHECKING:
+    import logging
 
-try:
-    from tools.toolbelt_registry import ToolRegistry
-except ImportError:
-    sys.path.append("...")
     from tools.toolbelt_registry import ToolRegistry
 
-logging.basicConfig(level=logging.INFO, format="%(message)s")
-logger = logging.getLogger(__name__)
+# Imports below are deferred into the functions that need them: the
+# dispatcher runs once per command, and --help/--list never load logging.
+
+
+def _load_registry() -> ToolRegistry:
+    """Import the tool registry and return the shared instance."""
+    try:
+        from tools.toolbelt_registry import get_registry
+    except ImportError:
+        sys.path.append("...")
+        from tools.toolbelt_registry import get_registry
+    return get_registry()
+
 
+def _get_logger() -> logging.Logger:
+    """Configure logging on first use and return the dispatcher logger."""
+    import logging
 
-def _invoke_entry_point(entry_point, module_name: str, remaining: list[str]) -> NoReturn:
-    """Call tool entry point, passing argv when the function expects it."""
-    sys.argv = [module_name] + remaining
-    params = list(inspect.signature(entry_point).parameters.values())
-    if params and params[0].name in {"argv", "args"}:
-        sys.exit(entry_point(remaining))
-    sys.exit(entry_point())
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return logging.getLogger(__name__)
 
 
 def main() -> NoReturn:
     """Main entry point."""
-    registry = ToolRegistry()
+    registry = _load_registry()
 
     if len(sys.argv) < 2:
         print_help(registry)
@@ -58,6 +64,7 @@ def main() -> NoReturn:
         sys.exit(0)
 
     tool_config = registry.get_tool_for_flag(flag)
+    logger = _get_logger()
     if not tool_config:
         logger.error("Unknown flag: %s", flag)
         print("\nAvailable tools:")
@@ -68,15 +75,21 @@ def main() -> NoReturn:
     function_name = tool_config["main_function"]
     remaining = sys.argv[2:]
 
+    if tool_config.get("exec") and os.name == "posix" and sys.executable:
+        # Self-contained tool: replace this process with a fresh interpreter
+        # running the module, so nothing the dispatcher loaded carries over
+        logger.info("Executing %s (%s)...", tool_config["name"], module_name)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(sys.executable, [sys.executable, "-m", module_name] + remaining)
+
     try:
-        module = importlib.import_module(module_name)
-        if not hasattr(module, function_name):
+        if registry.load_tool(tool_config["id"]) is None:
             logger.error("Entry point '%s' not found in %s", function_name, module_name)
             sys.exit(1)
 
-        entry_point = getattr(module, function_name)
         logger.info("Executing %s (%s)...", tool_config["name"], module_name)
-        _invoke_entry_point(entry_point, module_name, remaining)
+        sys.exit(registry.dispatch(flag, remaining))
 
     except ImportError as exc:
         logger.error("Could not import module %s: %s", module_name, exc)
@@ -9,366 +9,419 @@ Architecture: WE ARE SWARM
 Status: Consolidated (Phase 4 Complete)
 """
 
-from typing import Any
+import functools
+import sys
+from typing import Any, Callable, NamedTuple
 
-TOOLS_REGISTRY: dict[str, dict[str, Any]] = {
+
+class ToolSpec(NamedTuple):
+    """Registry entry for one tool: where its entry point lives and how it is invoked."""
+
+    name: str
+    module: str
+    main_function: str
+    description: str
+    flags: tuple[str, ...]
+    args_passthrough: bool = True  # Forward remaining CLI args to the tool
+    exec: bool = False  # Run as `python -m module` in place of the dispatcher
+
+
+TOOLS_REGISTRY: dict[str, ToolSpec] = {
     # -------------------------------------------------------------------------
     # 🟢 UNIFIED TOOLS (The Big Three + Domain Unifieds)
     # -------------------------------------------------------------------------
-    "monitor": {
-        "name": "Unified Monitor",
-        "module": "tools.monitoring.unified_monitor",
-        "main_function": "main",
-        "description": "System-wide monitoring (Queue, Service, Disk, Agents, Workspace)",
-        "flags": ["--monitor", "-m"],
-        "args_passthrough": True,
-    },
-    "validator": {
-        "name": "Unified Validator",
-        "module": "tools.validation.unified_validator",
-        "main_function": "main",
-        "description": "System-wide validation (SSOT, Imports, Config, Tracker)",
-        "flags": ["--validate", "-V"],
-        "args_passthrough": True,
-    },
-    "analyzer": {
-        "name": "Unified Analyzer",
-        "module": "tools.analysis.unified_analyzer",
-        "main_function": "main",
-        "description": "System-wide analysis (Repository, Structure, Complexity, Overlap)",
-        "flags": ["--analyze", "-a"],
-        "args_passthrough": True,
-    },
-    "agent": {
-        "name": "Unified Agent Tools",
-        "module": "tools.agent.unified_agent",
-        "main_function": "main",
-        "description": "Agent operations (Status, Tasks, Orientation, Onboarding)",
-        "flags": ["--agent", "-A"],
-        "args_passthrough": True,
-    },
-    "onboard-soft": {
-        "name": "Agent Soft Onboarding",
-        "module": "tools.toolbelt.cli.onboarding_cli",
-        "main_function": "cmd_soft",
-        "description": "S2A v2.3 soft onboarding (rehydrate → gate → resume)",
-        "flags": ["--onboard-soft"],
-        "args_passthrough": True,
-    },
-    "onboard-hard": {
-        "name": "Agent Hard Onboarding",
-        "module": "tools.toolbelt.cli.onboarding_cli",
-        "main_function": "cmd_hard",
-        "description": "DESTRUCTIVE: hard reset agent workspace (requires --yes)",
-        "flags": ["--onboard-hard"],
-        "args_passthrough": True,
-    },
-    "onboard-status": {
-        "name": "Agent Onboarding Status",
-        "module": "tools.toolbelt.cli.onboarding_cli",
-        "main_function": "cmd_status",
-        "description": "Show onboarding/rehydration readiness for an agent",
-        "flags": ["--onboard-status"],
-        "args_passthrough": True,
-    },
-    "message": {
-        "name": "Agent Messaging (PyAutoGUI)",
-        "module": "tools.messaging_cli_wrapper",
-        "main_function": "main",
-        "description": "Send messages to agents via PyAutoGUI autonomous execution",
-        "flags": ["--message", "-msg"],
-        "args_passthrough": True,
-    },
-    "captain": {
-        "name": "Unified Captain Tools",
-        "module": "tools.captain.unified_captain",
-        "main_function": "main",
-        "description": "Captain operations (Inbox, Coordination, Mission Control)",
-        "flags": ["--captain", "-C"],
-        "args_passthrough": True,
-    },
-    "cleanup": {
-        "name": "Unified Cleanup",
-        "module": "tools.cleanup.unified_cleanup",
-        "main_function": "main",
-        "description": "System cleanup (Workspace, Archives, Logs)",
-        "flags": ["--cleanup", "--clean"],
-        "args_passthrough": True,
-    },
-    "discord": {
-        "name": "Unified Discord",
-        "module": "tools.discord.unified_discord",
-        "main_function": "main",
-        "description": "Discord operations (Bot, Webhooks, Verification)",
-        "flags": ["--discord"],
-        "args_passthrough": True,
-    },
-    "github": {
-        "name": "Unified GitHub",
-        "module": "tools.github.unified_github",
-        "main_function": "main",
-        "description": "GitHub operations (PRs, Issues, Repo Audit)",
-        "flags": ["--github", "--gh"],
-        "args_passthrough": True,
-    },
-    "verifier": {
-        "name": "Unified Verifier",
-        "module": "tools.verification.unified_verifier",
-        "main_function": "main",
-        "description": "Deep verification (CI/CD, Merge, Credentials, Test Health)",
-        "flags": ["--verify"],
-        "args_passthrough": True,
-    },
-    "wordpress": {
-        "name": "Unified WordPress",
-        "module": "tools.wordpress.unified_wordpress",
-        "main_function": "main",
-        "description": "WordPress operations (Deploy, Theme, Admin)",
-        "flags": ["--wordpress", "--wp"],
-        "args_passthrough": True,
-    },
+    "monitor": ToolSpec(
+        name="Unified Monitor",
+        module="tools.monitoring.unified_monitor",
+        main_function="main",
+        description="System-wide monitoring (Queue, Service, Disk, Agents, Workspace)",
+        flags=("--monitor", "-m"),
+    ),
+    "validator": ToolSpec(
+        name="Unified Validator",
+        module="tools.validation.unified_validator",
+        main_function="main",
+        description="System-wide validation (SSOT, Imports, Config, Tracker)",
+        flags=("--validate", "-V"),
+    ),
+    "analyzer": ToolSpec(
+        name="Unified Analyzer",
+        module="tools.analysis.unified_analyzer",
+        main_function="main",
+        description="System-wide analysis (Repository, Structure, Complexity, Overlap)",
+        flags=("--analyze", "-a"),
+    ),
+    "agent": ToolSpec(
+        name="Unified Agent Tools",
+        module="tools.agent.unified_agent",
+        main_function="main",
+        description="Agent operations (Status, Tasks, Orientation, Onboarding)",
+        flags=("--agent", "-A"),
+    ),
+    "onboard-soft": ToolSpec(
+        name="Agent Soft Onboarding",
+        module="tools.toolbelt.cli.onboarding_cli",
+        main_function="cmd_soft",
+        description="S2A v2.3 soft onboarding (rehydrate → gate → resume)",
+        flags=("--onboard-soft",),
+    ),
+    "onboard-hard": ToolSpec(
+        name="Agent Hard Onboarding",
+        module="tools.toolbelt.cli.onboarding_cli",
+        main_function="cmd_hard",
+        description="DESTRUCTIVE: hard reset agent workspace (requires --yes)",
+        flags=("--onboard-hard",),
+    ),
+    "onboard-status": ToolSpec(
+        name="Agent Onboarding Status",
+        module="tools.toolbelt.cli.onboarding_cli",
+        main_function="cmd_status",
+        description="Show onboarding/rehydration readiness for an agent",
+        flags=("--onboard-status",),
+    ),
+    "message": ToolSpec(
+        name="Agent Messaging (PyAutoGUI)",
+        module="tools.messaging_cli_wrapper",
+        main_function="main",
+        description="Send messages to agents via PyAutoGUI autonomous execution",
+        flags=("--message", "-msg"),
+    ),
+    "captain": ToolSpec(
+        name="Unified Captain Tools",
+        module="tools.captain.unified_captain",
+        main_function="main",
+        description="Captain operations (Inbox, Coordination, Mission Control)",
+        flags=("--captain", "-C"),
+    ),
+    "cleanup": ToolSpec(
+        name="Unified Cleanup",
+        module="tools.cleanup.unified_cleanup",
+        main_function="main",
+        description="System cleanup (Workspace, Archives, Logs)",
+        flags=("--cleanup", "--clean"),
+    ),
+    "discord": ToolSpec(
+        name="Unified Discord",
+        module="tools.discord.unified_discord",
+        main_function="main",
+        description="Discord operations (Bot, Webhooks, Verification)",
+        flags=("--discord",),
+    ),
+    "github": ToolSpec(
+        name="Unified GitHub",
+        module="tools.github.unified_github",
+        main_function="main",
+        description="GitHub operations (PRs, Issues, Repo Audit)",
+        flags=("--github", "--gh"),
+    ),
+    "verifier": ToolSpec(
+        name="Unified Verifier",
+        module="tools.verification.unified_verifier",
+        main_function="main",
+        description="Deep verification (CI/CD, Merge, Credentials, Test Health)",
+        flags=("--verify",),
+    ),
+    "wordpress": ToolSpec(
+        name="Unified WordPress",
+        module="tools.wordpress.unified_wordpress",
+        main_function="main",
+        description="WordPress operations (Deploy, Theme, Admin)",
+        flags=("--wordpress", "--wp"),
+    ),
 
     # -------------------------------------------------------------------------
     # 🟡 GOLD TOOLS (Critical/Security/Recovery)
     # -------------------------------------------------------------------------
-    "check-sensitive": {
-        "name": "Sensitive File Checker",
-        "module": "tools.security.check_sensitive_files",
-        "main_function": "main",
-        "description": "Scan for sensitive files and credentials",
-        "flags": ["--check-sensitive", "--sec-check"],
-        "args_passthrough": True,
-    },
-    "audit-imports": {
-        "name": "Import Auditor",
-        "module": "tools.validation.audit_imports",
-        "main_function": "main",
-        "description": "Audit Python imports and dependencies",
-        "flags": ["--audit-imports"],
-        "args_passthrough": True,
-    },
-    "diagnose-auth": {
-        "name": "GitHub Auth Diagnoser",
-        "module": "tools.debug.diagnose_github_cli_auth",
-        "main_function": "main",
-        "description": "Diagnose and fix GitHub CLI authentication",
-        "flags": ["--diagnose-auth"],
-        "args_passthrough": True,
-    },
-    "debug-queue": {
-        "name": "Queue Debugger",
-        "module": "tools.debug.debug_message_queue",
-        "main_function": "main",
-        "description": "Debug message queue contents and state",
-        "flags": ["--debug-queue"],
-        "args_passthrough": True,
-    },
-    "fix-queue": {
-        "name": "Queue Fixer",
-        "module": "tools.debug.fix_message_queue",
-        "main_function": "main",
-        "description": "Attempt to fix message queue issues",
-        "flags": ["--fix-queue"],
-        "args_passthrough": True,
-    },
-    "check-stuck": {
-        "name": "Stuck Message Checker",
-        "module": "tools.debug.check_stuck_messages",
-        "main_function": "main",
-        "description": "Identify stuck messages in the system",
-        "flags": ["--check-stuck"],
-        "args_passthrough": True,
-    },
-    "ci-debt": {
-        "name": "CI Technical Debt Summary",
-        "module": "tools.analysis.tech_debt_ci_summary",
-        "main_function": "main",
-        "description": "Summarize technical debt in CI pipelines",
-        "flags": ["--ci-debt"],
-        "args_passthrough": True,
-    },
-    "swarm-patterns": {
-        "name": "Swarm Pattern Analyzer",
-        "module": "tools.analysis.analyze_swarm_coordination_patterns",
-        "main_function": "main",
-        "description": "Analyze coordination patterns in the swarm",
-        "flags": ["--swarm-patterns"],
-        "args_passthrough": True,
-    },
-    "create-session": {
-        "name": "Session Creator",
-        "module": "tools.captain.create_work_session",
-        "main_function": "main",
-        "description": "Create a new work session structure",
-        "flags": ["--create-session", "--session"],
-        "args_passthrough": True,
-    },
-    "security-scan": {
-        "name": "Unified Security Scanner",
-        "module": "tools.security.unified_security_scanner",
-        "main_function": "main",
-        "description": "Comprehensive security scanner (Secrets, Deps, SAST)",
-        "flags": ["--security-scan", "--scan-security"],
-        "args_passthrough": True,
-    },
-    "debugger": {
-        "name": "Unified Debugger",
-        "module": "tools.debug.unified_debugger",
-        "main_function": "main",
-        "description": "System-wide debugging (Logs, Queue, Processes)",
-        "flags": ["--debugger", "--debug"],
-        "args_passthrough": True,
-    },
-    "environment": {
-        "name": "Unified Environment",
-        "module": "tools.devops.unified_environment",
-        "main_function": "main",
-        "description": "Environment verification and setup",
-        "flags": ["--environment", "--env"],
-        "args_passthrough": True,
-    },
+    "check-sensitive": ToolSpec(
+        name="Sensitive File Checker",
+        module="tools.security.check_sensitive_files",
+        main_function="main",
+        description="Scan for sensitive files and credentials",
+        flags=("--check-sensitive", "--sec-check"),
+    ),
+    "audit-imports": ToolSpec(
+        name="Import Auditor",
+        module="tools.validation.audit_imports",
+        main_function="main",
+        description="Audit Python imports and dependencies",
+        flags=("--audit-imports",),
+    ),
+    "diagnose-auth": ToolSpec(
+        name="GitHub Auth Diagnoser",
+        module="tools.debug.diagnose_github_cli_auth",
+        main_function="main",
+        description="Diagnose and fix GitHub CLI authentication",
+        flags=("--diagnose-auth",),
+    ),
+    "debug-queue": ToolSpec(
+        name="Queue Debugger",
+        module="tools.debug.debug_message_queue",
+        main_function="main",
+        description="Debug message queue contents and state",
+        flags=("--debug-queue",),
+    ),
+    "fix-queue": ToolSpec(
+        name="Queue Fixer",
+        module="tools.debug.fix_message_queue",
+        main_function="main",
+        description="Attempt to fix message queue issues",
+        flags=("--fix-queue",),
+    ),
+    "check-stuck": ToolSpec(
+        name="Stuck Message Checker",
+        module="tools.debug.check_stuck_messages",
+        main_function="main",
+        description="Identify stuck messages in the system",
+        flags=("--check-stuck",),
+    ),
+    "ci-debt": ToolSpec(
+        name="CI Technical Debt Summary",
+        module="tools.analysis.tech_debt_ci_summary",
+        main_function="main",
+        description="Summarize technical debt in CI pipelines",
+        flags=("--ci-debt",),
+    ),
+    "swarm-patterns": ToolSpec(
+        name="Swarm Pattern Analyzer",
+        module="tools.analysis.analyze_swarm_coordination_patterns",
+        main_function="main",
+        description="Analyze coordination patterns in the swarm",
+        flags=("--swarm-patterns",),
+    ),
+    "create-session": ToolSpec(
+        name="Session Creator",
+        module="tools.captain.create_work_session",
+        main_function="main",
+        description="Create a new work session structure",
+        flags=("--create-session", "--session"),
+    ),
+    "security-scan": ToolSpec(
+        name="Unified Security Scanner",
+        module="tools.security.unified_security_scanner",
+        main_function="main",
+        description="Comprehensive security scanner (Secrets, Deps, SAST)",
+        flags=("--security-scan", "--scan-security"),
+        exec=True,
+    ),
+    "debugger": ToolSpec(
+        name="Unified Debugger",
+        module="tools.debug.unified_debugger",
+        main_function="main",
+        description="System-wide debugging (Logs, Queue, Processes)",
+        flags=("--debugger", "--debug"),
+    ),
+    "environment": ToolSpec(
+        name="Unified Environment",
+        module="tools.devops.unified_environment",
+        main_function="main",
+        description="Environment verification and setup",
+        flags=("--environment", "--env"),
+    ),
 
     # -------------------------------------------------------------------------
     # 🔵 DIAMOND TOOLS (High Value Specialists)
     # -------------------------------------------------------------------------
-    "fix-types": {
-        "name": "Type Annotation Fixer",
-        "module": "tools.devops.type_annotation_fixer",
-        "main_function": "main",
-        "description": "Add and fix type annotations",
-        "flags": ["--fix-types"],
-        "args_passthrough": True,
-    },
-    "suggest-refactor": {
-        "name": "Refactoring Suggester",
-        "module": "tools.analysis.refactoring_suggestion_engine",
-        "main_function": "main",
-        "description": "Generate refactoring suggestions",
-        "flags": ["--suggest-refactor"],
-        "args_passthrough": True,
-    },
-    "analyze-consolidation": {
-        "name": "Consolidation Analyzer",
-        "module": "tools.analysis.consolidation_analyzer",
-        "main_function": "main",
-        "description": "Analyze opportunities for tool consolidation",
-        "flags": ["--analyze-consolidation"],
-        "args_passthrough": True,
-    },
-    "analyze-debt": {
-        "name": "Technical Debt Analyzer",
-        "module": "tools.analysis.technical_debt_analyzer",
-        "main_function": "main",
-        "description": "Deep scan for technical debt",
-        "flags": ["--analyze-debt"],
-        "args_passthrough": True,
-    },
-    "analyze-source": {
-        "name": "Source Analyzer",
-        "module": "tools.analysis.source_analyzer",
-        "main_function": "main",
-        "description": "Analyze source code statistics",
-        "flags": ["--analyze-source"],
-        "args_passthrough": True,
-    },
-    "analyze-tools": {
-        "name": "Tool Analyzer",
-        "module": "tools.analysis.comprehensive_tool_analyzer",
-        "main_function": "main",
-        "description": "Analyze the tool ecosystem itself",
-        "flags": ["--analyze-tools"],
-        "args_passthrough": True,
-    },
-    "auto-cleanup": {
-        "name": "Auto Workspace Cleaner",
-        "module": "tools.cleanup.workspace_auto_cleaner",
-        "main_function": "main",
-        "description": "Automated workspace maintenance",
-        "flags": ["--auto-cleanup"],
-        "args_passthrough": True,
-    },
-    "session-cleanup": {
-        "name": "Session Cleanup",
-        "module": "tools.cleanup.session_cleanup_automation",
-        "main_function": "main",
-        "description": "Cleanup old sessions",
-        "flags": ["--session-cleanup"],
-        "args_passthrough": True,
-    },
-    "generate-docs": {
-        "name": "Documentation Generator",
-        "module": "tools.devops.documentation_assistant",
-        "main_function": "main",
-        "description": "Assist in generating documentation",
-        "flags": ["--generate-docs"],
-        "args_passthrough": True,
-    },
-    "seo-extract": {
-        "name": "SEO Meta Extractor",
-        "module": "tools.analysis.seo_meta_tag_extractor",
-        "main_function": "main",
-        "description": "Extract SEO meta tags from files",
-        "flags": ["--seo-extract"],
-        "args_passthrough": True,
-    },
-    "schema-validate": {
-        "name": "Schema Validator",
-        "module": "tools.validation.schema_org_validator",
-        "main_function": "main",
-        "description": "Validate Schema.org JSON-LD",
-        "flags": ["--schema-validate"],
-        "args_passthrough": True,
-    },
-    "master-task": {
-        "name": "Master Task Claimer",
-        "module": "tools.captain.claim_and_fix_master_task",
-        "main_function": "main",
-        "description": "Workflow for claiming and fixing tasks",
-        "flags": ["--master-task"],
-        "args_passthrough": True,
-    },
-    "test-coordinator": {
-        "name": "Integration Test Coordinator",
-        "module": "tools.verification.integration_test_coordinator",
-        "main_function": "main",
-        "description": "Coordinate integration tests",
-        "flags": ["--test-coordinator"],
-        "args_passthrough": True,
-    },
-    "session-transition": {
-        "name": "Session Transition",
-        "module": "tools.captain.session_transition_automator",
-        "main_function": "main",
-        "description": "Automate session transitions",
-        "flags": ["--session-transition"],
-        "args_passthrough": True,
-    },
-    "task-cli": {
-        "name": "Task CLI",
-        "module": "tools.captain.task_cli",
-        "main_function": "main",
-        "description": "Task management CLI",
-        "flags": ["--task", "-t"],
-        "args_passthrough": True,
-    },
+    "fix-types": ToolSpec(
+        name="Type Annotation Fixer",
+        module="tools.devops.type_annotation_fixer",
+        main_function="main",
+        description="Add and fix type annotations",
+        flags=("--fix-types",),
+    ),
+    "suggest-refactor": ToolSpec(
+        name="Refactoring Suggester",
+        module="tools.analysis.refactoring_suggestion_engine",
+        main_function="main",
+        description="Generate refactoring suggestions",
+        flags=("--suggest-refactor",),
+    ),
+    "analyze-consolidation": ToolSpec(
+        name="Consolidation Analyzer",
+        module="tools.analysis.consolidation_analyzer",
+        main_function="main",
+        description="Analyze opportunities for tool consolidation",
+        flags=("--analyze-consolidation",),
+    ),
+    "analyze-debt": ToolSpec(
+        name="Technical Debt Analyzer",
+        module="tools.analysis.technical_debt_analyzer",
+        main_function="main",
+        description="Deep scan for technical debt",
+        flags=("--analyze-debt",),
+    ),
+    "analyze-source": ToolSpec(
+        name="Source Analyzer",
+        module="tools.analysis.source_analyzer",
+        main_function="main",
+        description="Analyze source code statistics",
+        flags=("--analyze-source",),
+    ),
+    "analyze-tools": ToolSpec(
+        name="Tool Analyzer",
+        module="tools.analysis.comprehensive_tool_analyzer",
+        main_function="main",
+        description="Analyze the tool ecosystem itself",
+        flags=("--analyze-tools",),
+    ),
+    "auto-cleanup": ToolSpec(
+        name="Auto Workspace Cleaner",
+        module="tools.cleanup.workspace_auto_cleaner",
+        main_function="main",
+        description="Automated workspace maintenance",
+        flags=("--auto-cleanup",),
+    ),
+    "session-cleanup": ToolSpec(
+        name="Session Cleanup",
+        module="tools.cleanup.session_cleanup_automation",
+        main_function="main",
+        description="Cleanup old sessions",
+        flags=("--session-cleanup",),
+    ),
+    "generate-docs": ToolSpec(
+        name="Documentation Generator",
+        module="tools.devops.documentation_assistant",
+        main_function="main",
+        description="Assist in generating documentation",
+        flags=("--generate-docs",),
+    ),
+    "seo-extract": ToolSpec(
+        name="SEO Meta Extractor",
+        module="tools.analysis.seo_meta_tag_extractor",
+        main_function="main",
+        description="Extract SEO meta tags from files",
+        flags=("--seo-extract",),
+    ),
+    "schema-validate": ToolSpec(
+        name="Schema Validator",
+        module="tools.validation.schema_org_validator",
+        main_function="main",
+        description="Validate Schema.org JSON-LD",
+        flags=("--schema-validate",),
+    ),
+    "master-task": ToolSpec(
+        name="Master Task Claimer",
+        module="tools.captain.claim_and_fix_master_task",
+        main_function="main",
+        description="Workflow for claiming and fixing tasks",
+        flags=("--master-task",),
+    ),
+    "test-coordinator": ToolSpec(
+        name="Integration Test Coordinator",
+        module="tools.verification.integration_test_coordinator",
+        main_function="main",
+        description="Coordinate integration tests",
+        flags=("--test-coordinator",),
+    ),
+    "session-transition": ToolSpec(
+        name="Session Transition",
+        module="tools.captain.session_transition_automator",
+        main_function="main",
+        description="Automate session transitions",
+        flags=("--session-transition",),
+    ),
+    "task-cli": ToolSpec(
+        name="Task CLI",
+        module="tools.captain.task_cli",
+        main_function="main",
+        description="Task management CLI",
+        flags=("--task", "-t"),
+    ),
+}
+
+
+def _intern_specs(tools: dict[str, ToolSpec]) -> dict[str, ToolSpec]:
+    """Intern tool IDs, flags and module paths, the strings every lookup hashes and compares."""
+    return {
+        sys.intern(tool_id): spec._replace(
+            module=sys.intern(spec.module),
+            flags=tuple(sys.intern(flag) for flag in spec.flags),
+        )
+        for tool_id, spec in tools.items()
+    }
+
+
+TOOLS_REGISTRY = _intern_specs(TOOLS_REGISTRY)
+
+# Resolved entry points by tool ID, filled on first load
+_tool_cache: dict[str, Callable[..., Any]] = {}
+
+
+def _load_entry_point(tool_id: str) -> Callable[..., Any] | None:
+    """Import a tool's module and return its entry point (memoized), None if undefined."""
+    entry_point = _tool_cache.get(tool_id)
+    if entry_point is None:
+        import importlib
+
+        spec = TOOLS_REGISTRY[tool_id]
+        module = importlib.import_module(spec.module)
+        entry_point = getattr(module, spec.main_function, None)
+        if entry_point is not None:
+            _tool_cache[tool_id] = entry_point
+    return entry_point
+
+
+def _lazy_dispatch(tool_id: str, argv: list[str]) -> Any:
+    """Run a tool's entry point with argv, loading the tool on first use."""
+    import inspect
+
+    spec = TOOLS_REGISTRY[tool_id]
+    entry_point = _load_entry_point(tool_id)
+    if entry_point is None:
+        raise AttributeError(f"Entry point '{spec.main_function}' not found in {spec.module}")
+
+    # Tools parse sys.argv; those whose entry point takes argv get it directly
+    sys.argv = [spec.module] + argv
+    params = list(inspect.signature(entry_point).parameters.values())
+    if params and params[0].name in {"argv", "args"}:
+        return entry_point(argv)
+    return entry_point()
+
+
+def _index_flags(tools: dict[str, ToolSpec]) -> dict[str, str]:
+    """Map each flag to its tool ID, raising ValueError if two tools claim a flag."""
+    flag_to_id: dict[str, str] = {}
+    for tool_id, spec in tools.items():
+        for flag in spec.flags:
+            if flag in flag_to_id:
+                raise ValueError(f"Duplicate flag {flag}: {flag_to_id[flag]} vs {tool_id}")
+            flag_to_id[flag] = tool_id
+    return flag_to_id
+
+
+# Checked at import, so a flag collision fails fast instead of one tool
+# silently shadowing another
+_FLAG_TO_ID = _index_flags(TOOLS_REGISTRY)
+
+# Flag -> dispatcher: one lookup and one call runs the selected tool
+_FLAG_DISPATCH: dict[str, Callable[[list[str]], Any]] = {
+    flag: functools.partial(_lazy_dispatch, tool_id) for flag, tool_id in _FLAG_TO_ID.items()
 }
 
 
 class ToolRegistry:
-    """Tool registry for CLI Toolbelt."""
+    """
+    Tool registry for CLI Toolbelt.
+
+    Prefer get_registry(), which shares one instance (and its prebuilt flag
+    map) across callers, over constructing a new registry.
+    """
 
     def __init__(self):
         """Initialize tool registry."""
         self.tools = TOOLS_REGISTRY
-        self._flag_map = self._build_flag_map()
+        # Boundary dicts are built once; lookups and listings share them
+        self._tool_list = [
+            {"id": tool_id, **spec._asdict()} for tool_id, spec in self.tools.items()
+        ]
+        self._entries_by_id = {entry["id"]: entry for entry in self._tool_list}
+        self._flag_to_config = self._build_flag_map()
+        self._all_flags = tuple(self._flag_to_config)
 
-    def _build_flag_map(self) -> dict[str, str]:
-        """Build mapping from flags to tool IDs."""
-        flag_map = {}
-        for tool_id, config in self.tools.items():
-            for flag in config["flags"]:
-                flag_map[flag] = tool_id
-        return flag_map
+    def _build_flag_map(self) -> dict[str, dict[str, Any]]:
+        """Build mapping from flags to tool configurations (with 'id' included)."""
+        entries = self._entries_by_id
+        flag_to_id = _FLAG_TO_ID if self.tools is TOOLS_REGISTRY else _index_flags(self.tools)
+        return {flag: entries[tool_id] for flag, tool_id in flag_to_id.items()}
 
     def get_tool_for_flag(self, flag: str) -> dict[str, Any] | None:
         """
@@ -378,12 +431,10 @@ class ToolRegistry:
             flag: Tool flag (e.g., "--scan", "-s")
 
         Returns:
-            Tool configuration with 'id' included, or None if not found
+            Tool configuration with 'id' included, or None if not found.
+            The dict is shared by all lookups; treat it as read-only.
         """
-        tool_id = self._flag_map.get(flag)
-        if tool_id:
-            return {"id": tool_id, **self.tools[tool_id]}
-        return None
+        return self._flag_to_config.get(flag)
 
     def get_tool_by_name(self, name: str) -> dict[str, Any] | None:
         """
@@ -393,19 +444,65 @@ class ToolRegistry:
             name: Tool ID (e.g., "scan", "v2-check")
 
         Returns:
-            Tool configuration or None if not found
+            Tool configuration with 'id' included, or None if not found.
+            The dict is shared by all lookups; treat it as read-only.
+        """
+        return self._entries_by_id.get(name)
+
+    def load_tool(self, tool_id: str) -> Callable[..., Any] | None:
+        """
+        Import a tool's module and return its entry point, memoized per tool.
+
+        Args:
+            tool_id: Tool ID (e.g., "monitor", "security-scan")
+
+        Returns:
+            The entry point function, or None if the module does not define it
+
+        Raises:
+            ImportError: If the tool's module cannot be imported
+        """
+        return _load_entry_point(tool_id)
+
+    def dispatch(self, flag: str, argv: list[str]) -> Any:
         """
-        return self.tools.get(name)
+        Run the tool registered for a flag.
+
+        Args:
+            flag: Tool flag (e.g., "--monitor")
+            argv: Arguments for the tool (becomes sys.argv[1:])
+
+        Returns:
+            The entry point's return value
+
+        Raises:
+            KeyError: If the flag is not registered
+            ImportError: If the tool's module cannot be imported
+            AttributeError: If the module does not define the entry point
+        """
+        return _FLAG_DISPATCH[flag](argv)
 
     def list_tools(self) -> list[dict[str, Any]]:
         """
         List all available tools.
 
         Returns:
-            List of tool configurations
+            List of tool configurations (a new list; the dicts are shared
+            and should be treated as read-only)
         """
-        return [{"id": tool_id, **config} for tool_id, config in self.tools.items()]
+        return list(self._tool_list)
+
+    def get_all_flags(self) -> tuple[str, ...]:
+        """Get all registered flags (cached; use list(...) for a mutable copy)."""
+        return self._all_flags
+
+
+_registry_instance: ToolRegistry | None = None
+
 
-    def get_all_flags(self) -> list[str]:
-        """Get list of all registered flags."""
-        return list(self._flag_map.keys())
+def get_registry() -> ToolRegistry:
+    """Get singleton tool registry instance."""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ToolRegistry()
+    return _registry_instance
@@ -34,13 +34,26 @@ V2 Compliant: Yes (<400 lines)
 
 import argparse
 import ast
+import hashlib
+import itertools
 import json
 import logging
+import mmap
+import multiprocessing
+import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).resolve().parent.parent
@@ -52,35 +65,384 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Valid config_ssot imports
+VALID_SSOT_IMPORTS = [
+    "from src.core.config_ssot import",
+    "import src.core.config_ssot",
+    "from src.core import config_ssot",
+]
+
+# Deprecated config imports
+DEPRECATED_IMPORTS = [
+    "from src.core.config_core import",
+    "from src.core.unified_config import",
+    "from src.core.config_browser import",
+    "from src.core.config_thresholds import",
+    "from src.shared_utils.config import",
+]
+
+# Classifies an import string in one scan (deprecated alternatives are tried first)
+_IMPORT_CLASSIFIER_RE = re.compile(
+    "(?P<deprecated>{})|(?P<valid>{})".format(
+        "|".join(map(re.escape, DEPRECATED_IMPORTS)),
+        "|".join(map(re.escape, VALID_SSOT_IMPORTS)),
+    )
+)
+
+# Every module named in VALID_SSOT_IMPORTS and DEPRECATED_IMPORTS; files
+# without any of them cannot produce a result and are not parsed
+_TRACKED_IMPORT_RE = re.compile(
+    rb"config_ssot|config_core|unified_config|config_browser|config_thresholds"
+    rb"|shared_utils[\s\\]*\.[\s\\]*config"
+)
+
+# Queue files at least this large are counted by streaming them through ijson
+STREAM_QUEUE_MIN_BYTES = 1024 * 1024
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if IJSON_AVAILABLE else (json.JSONDecodeError,)
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+PARALLEL_PARSE_MIN_FILES = 200
+
+# Imports extracted per file, keyed by content hash so any edit invalidates
+# the entry; least recently used entries are evicted past the cap
+PARSE_CACHE_DIR = project_root / ".cache" / "unified_validator"
+PARSE_CACHE_MAX_ENTRIES = 10000
+_PARSE_CACHE_VERSION = b"imports-v2"  # Bump when the extracted format changes
+
+# Per-file SSOT results from earlier runs, reused while a file's mtime and
+# size are unchanged; stored with a digest of the rules that produced them
+SSOT_INDEX_NAME = "mtime_index.json"
+
+# (kind "import" or "from", module, ((name, asname), ...), line)
+ImportRecord = Tuple[str, str, Tuple[Tuple[str, Optional[str]], ...], int]
+
+# Imports are statements, and statements only nest in these node types
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_py(root: Path) -> Iterator[str]:
+    """
+    Yield the paths of all .py files under root, like ``root.rglob("*.py")``.
+    
+    Uses os.scandir, whose entries carry their file type, so no Path
+    objects or extra stat calls are made per entry. Symlinked directories
+    are not followed, and unreadable directories are skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _contains_any(path: Path, needles: Tuple[bytes, ...]) -> bool:
+    """
+    Check whether a file contains any of the byte strings.
+    
+    The file is memory-mapped and searched as raw bytes, so it is neither
+    decoded nor copied into a Python object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return any(mm.find(needle) != -1 for needle in needles)
+
+
+def _stream_queue_size(queue_file: Path) -> Optional[int]:
+    """
+    Count queue entries without loading the whole queue file.
+    
+    Counts what len() would on the parsed data: the items of a top-level
+    array, or the entries of a top-level object's "messages" value. The
+    whole file is still parsed, so invalid JSON raises.
+    
+    Returns:
+        The entry count, or None for a shape this does not handle (the
+        caller then parses the file normally)
+    """
+    count = 0
+    with open(queue_file, "rb") as f:
+        events = ijson.parse(f)
+        _, event, _ = next(events)
+        if event == "start_array":
+            item_prefix = "item"
+        elif event == "start_map":
+            item_prefix = "messages.item"
+        else:
+            return None
+        messages_is_object = False
+        for prefix, event, _ in events:
+            if prefix == item_prefix and not messages_is_object:
+                if event not in ("end_map", "end_array", "map_key"):
+                    count += 1  # The start of an item, or a scalar item
+            elif prefix == "messages" and item_prefix == "messages.item":
+                if event == "start_map":
+                    # Only keys count; a key named "item" would otherwise
+                    # have its value counted again under messages.item
+                    messages_is_object = True
+                elif event == "map_key":
+                    count += 1  # "messages" is an object: len() counts its keys
+                elif event not in ("start_array", "end_array", "start_map", "end_map"):
+                    return None  # A scalar "messages" value
+    return count
+
+
+def _import_string(node: ast.ImportFrom) -> str:
+    """Get import string from AST node."""
+    module = node.module or ""
+    names = ", ".join([alias.name for alias in node.names])
+    return f"from {module} import {names}"
+
+
+def _extract_imports(tree: ast.AST) -> List[ImportRecord]:
+    """
+    Import and ImportFrom statements of a parsed file, in ast.walk order.
+    
+    Walks breadth-first like ast.walk but never enters expressions, which
+    make up most of a tree and cannot contain imports.
+    """
+    imports = []
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        if isinstance(node, ast.Import):
+            kind, module = "import", ""
+        elif isinstance(node, ast.ImportFrom):
+            kind, module = "from", node.module or ""
+        else:
+            todo.extend(
+                child for child in ast.iter_child_nodes(node)
+                if isinstance(child, _STATEMENT_NODES)
+            )
+            continue
+        names = tuple((alias.name, alias.asname) for alias in node.names)
+        imports.append((kind, module, names, node.lineno))
+    return imports
+
+
+def _decode_records(raw: Any) -> List[ImportRecord]:
+    """
+    Rebuild import records from a cached JSON entry.
+    
+    Raises:
+        ValueError, TypeError: If the entry does not have the record shape
+    """
+    if not isinstance(raw, list):
+        raise TypeError("malformed parse cache entry")
+    imports = []
+    for kind, module, names, line in raw:
+        pairs = tuple((name, asname) for name, asname in names)
+        if (kind not in ("import", "from") or not isinstance(module, str)
+                or type(line) is not int
+                or not all(isinstance(name, str) and (asname is None or isinstance(asname, str))
+                           for name, asname in pairs)):
+            raise ValueError("malformed parse cache entry")
+        imports.append((kind, module, pairs, line))
+    return imports
+
+
+def _load_or_parse(path: Path, use_cache: bool = True,
+                   data: Optional[bytes] = None) -> List[ImportRecord]:
+    """
+    Get a file's imports, parsing it only if its content is not cached.
+    
+    Args:
+        path: Python file to read
+        use_cache: Read and write PARSE_CACHE_DIR
+        data: The file's bytes, if already read
+        
+    Returns:
+        Import records of the file
+        
+    Raises:
+        SyntaxError: If the file cannot be parsed (never cached)
+    """
+    if data is None:
+        data = path.read_bytes()
+    digest = hashlib.blake2b(_PARSE_CACHE_VERSION + data, digest_size=16).hexdigest()
+    cache_file = PARSE_CACHE_DIR / f"{digest}.json"
+    if use_cache:
+        try:
+            # JSON, not pickle: a cache entry committed to a checkout must
+            # never be able to run code
+            imports = _decode_records(json.loads(cache_file.read_bytes()))
+            os.utime(cache_file)  # A hit makes the entry most recently used
+            return imports
+        except (OSError, ValueError, TypeError):
+            pass  # Missing or corrupt: parse again and overwrite it
+    
+    # Bytes go straight to the tokenizer, which honours coding cookies and a
+    # BOM; a str would be re-encoded to UTF-8 first
+    tree = ast.parse(data, filename=str(path))
+    imports = _extract_imports(tree)
+    if use_cache:
+        try:
+            PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(imports), encoding="utf-8")
+            os.replace(tmp_file, cache_file)  # Concurrent workers never see partial entries
+        except OSError:
+            pass
+    return imports
+
+
+def _prune_parse_cache(max_entries: int = PARSE_CACHE_MAX_ENTRIES) -> None:
+    """Evict the least recently used parse cache entries beyond max_entries."""
+    try:
+        entries = [
+            entry for entry in os.scandir(PARSE_CACHE_DIR)
+            if entry.name.endswith(".json") and entry.name != SSOT_INDEX_NAME
+        ]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _ssot_rules_digest() -> str:
+    """Digest of everything an SSOT file result depends on besides the file."""
+    rules = b"\0".join([
+        _PARSE_CACHE_VERSION,
+        _TRACKED_IMPORT_RE.pattern,
+        _IMPORT_CLASSIFIER_RE.pattern.encode("utf-8"),
+    ])
+    return hashlib.blake2b(rules, digest_size=16).hexdigest()
+
+
+def _load_ssot_index() -> Dict[str, Any]:
+    """Load the SSOT mtime index, or an empty one if missing or stale."""
+    try:
+        index = json.loads((PARSE_CACHE_DIR / SSOT_INDEX_NAME).read_text(encoding="utf-8"))
+        if index.get("rules") == _ssot_rules_digest():
+            return index["files"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+
+def _save_ssot_index(files: Dict[str, Any]) -> None:
+    """Atomically write the SSOT mtime index."""
+    index_file = PARSE_CACHE_DIR / SSOT_INDEX_NAME
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(
+            json.dumps({"rules": _ssot_rules_digest(), "files": files}), encoding="utf-8"
+        )
+        os.replace(tmp_file, index_file)
+    except OSError:
+        pass
+
+
+_SYNTAX_WARNING = "Syntax error - could not parse"
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for the parse pool.
+
+    validate_all() runs validators in threads, and forking a process that
+    has other threads running can deadlock the child, so fork is avoided.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _scan_ssot_file(file_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Check one file's config imports (module-level so worker processes can run it).
+    
+    Returns:
+        Dict with "checked" (0 or 1) and this file's "violations",
+        "valid_imports" and "warnings" entries
+    """
+    results = {"checked": 0, "violations": [], "valid_imports": [], "warnings": []}
+    try:
+        path = Path(file_path)
+        data = path.read_bytes()
+        if not _TRACKED_IMPORT_RE.search(data):
+            results["checked"] = 1
+            return results
+        imports = _load_or_parse(path, use_cache, data)
+        results["checked"] = 1
+        
+        for kind, module, names, line in imports:
+            if kind != "from":
+                continue
+            import_str = f"from {module} import {', '.join(name for name, _ in names)}"
+            match = _IMPORT_CLASSIFIER_RE.search(import_str)
+            if match is None:
+                continue
+            if match.lastgroup == "deprecated":
+                results["violations"].append({
+                    "file": file_path,
+                    "line": line,
+                    "message": f"Deprecated import: {import_str}",
+                    "severity": "high"
+                })
+            else:
+                results["valid_imports"].append({
+                    "file": file_path,
+                    "line": line,
+                    "import": import_str
+                })
+    except SyntaxError:
+        results["warnings"].append({
+            "file": file_path,
+            "message": _SYNTAX_WARNING
+        })
+    except Exception as e:
+        results["warnings"].append({
+            "file": file_path,
+            "message": str(e)
+        })
+    return results
+
 
 class UnifiedValidator:
     """Unified validation system consolidating all validation capabilities."""
     
-    # Valid config_ssot imports
-    VALID_SSOT_IMPORTS = [
-        "from src.core.config_ssot import",
-        "import src.core.config_ssot",
-        "from src.core import config_ssot",
-    ]
-    
-    # Deprecated config imports
-    DEPRECATED_IMPORTS = [
-        "from src.core.config_core import",
-        "from src.core.unified_config import",
-        "from src.core.config_browser import",
-        "from src.core.config_thresholds import",
-        "from src.shared_utils.config import",
-    ]
+    VALID_SSOT_IMPORTS = VALID_SSOT_IMPORTS
+    DEPRECATED_IMPORTS = DEPRECATED_IMPORTS
     
-    def __init__(self):
-        """Initialize unified validator."""
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize unified validator.
+        
+        Args:
+            use_cache: Reuse imports parsed by earlier runs (see PARSE_CACHE_DIR)
+        """
         self.project_root = project_root
+        self.use_cache = use_cache
         self.violations: List[Dict] = []
         self.warnings: List[Dict] = []
         
     def validate_ssot_config(self, file_path: Optional[Path] = None, 
-                             dir_path: Optional[Path] = None) -> Dict[str, Any]:
-        """Validate SSOT config usage."""
+                             dir_path: Optional[Path] = None,
+                             jobs: Optional[int] = None,
+                             incremental: bool = False) -> Dict[str, Any]:
+        """
+        Validate SSOT config usage.
+        
+        Parsing is CPU-bound, so larger trees are split across ``jobs``
+        worker processes (default: one per CPU). With ``incremental`` (and
+        the cache enabled), files whose mtime and size match the previous
+        run reuse its results without being read.
+        """
         results = {
             "category": "ssot_config",
             "files_checked": 0,
@@ -90,58 +452,90 @@ class UnifiedValidator:
             "timestamp": datetime.now().isoformat()
         }
         
-        files_to_check = []
+        paths: List[str] = []
         if file_path:
-            files_to_check = [file_path]
+            paths = [str(file_path)]
+            scope = file_path
         elif dir_path:
-            files_to_check = list(dir_path.rglob("*.py"))
+            paths = list(_iter_py(dir_path))
+            scope = dir_path
         else:
             # Default: check src directory
             src_dir = self.project_root / "src"
             if src_dir.exists():
-                files_to_check = list(src_dir.rglob("*.py"))
-        
-        for py_file in files_to_check:
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                tree = ast.parse(content, filename=str(py_file))
-                results["files_checked"] += 1
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ImportFrom):
-                        import_str = self._get_import_string(node)
-                        if any(dep in import_str for dep in self.DEPRECATED_IMPORTS):
-                            results["violations"].append({
-                                "file": str(py_file),
-                                "line": node.lineno,
-                                "message": f"Deprecated import: {import_str}",
-                                "severity": "high"
-                            })
-                        elif any(valid in import_str for valid in self.VALID_SSOT_IMPORTS):
-                            results["valid_imports"].append({
-                                "file": str(py_file),
-                                "line": node.lineno,
-                                "import": import_str
-                            })
-            except SyntaxError:
-                results["warnings"].append({
-                    "file": str(py_file),
-                    "message": "Syntax error - could not parse"
-                })
-            except Exception as e:
-                results["warnings"].append({
-                    "file": str(py_file),
-                    "message": str(e)
-                })
+                paths = list(_iter_py(src_dir))
+            scope = src_dir
+        
+        incremental = incremental and self.use_cache
+        index = _load_ssot_index() if incremental else {}
+        file_results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        # Index keys are absolute, so runs from other directories share entries
+        keys = [os.path.abspath(path) for path in paths]
+        stamps: Dict[str, List[int]] = {}
+        if incremental:
+            for i, (path, key) in enumerate(zip(paths, keys)):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                stamps[key] = [st.st_mtime_ns, st.st_size]
+                entry = index.get(key)
+                if entry and entry[0] == stamps[key]:
+                    # Report the path as given this time, not as stored
+                    file_results[i] = {
+                        name: [dict(item, file=path) for item in value]
+                        if isinstance(value, list) else value
+                        for name, value in entry[1].items()
+                    }
+        
+        stale = [i for i, file_result in enumerate(file_results) if file_result is None]
+        stale_paths = [paths[i] for i in stale]
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(stale_paths) >= PARALLEL_PARSE_MIN_FILES:
+            # map() keeps input order, so the merged results match a serial scan
+            chunksize = max(1, len(stale_paths) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) as executor:
+                scanned = list(executor.map(
+                    _scan_ssot_file, stale_paths, itertools.repeat(self.use_cache),
+                    chunksize=chunksize
+                ))
+        else:
+            scanned = [_scan_ssot_file(path, self.use_cache) for path in stale_paths]
+        for i, file_result in zip(stale, scanned):
+            file_results[i] = file_result
+        
+        if incremental:
+            # Entries outside this run's scope are kept; inside it, files not
+            # seen this time (deleted) drop out. Results with read errors are
+            # not kept either: those may pass on the next run
+            root = os.path.abspath(scope)
+            index = {
+                key: entry for key, entry in index.items()
+                if key != root and not key.startswith(os.path.join(root, ""))
+            }
+            index.update(
+                (key, [stamps[key], file_result])
+                for key, file_result in zip(keys, file_results)
+                if key in stamps and all(
+                    warning["message"] == _SYNTAX_WARNING for warning in file_result["warnings"]
+                )
+            )
+            _save_ssot_index(index)
+        if self.use_cache:
+            _prune_parse_cache()
+        
+        for file_result in file_results:
+            results["files_checked"] += file_result["checked"]
+            results["violations"].extend(file_result["violations"])
+            results["valid_imports"].extend(file_result["valid_imports"])
+            results["warnings"].extend(file_result["warnings"])
         
         results["status"] = "VALID" if not results["violations"] else "VIOLATIONS_FOUND"
         return results
     
     def _get_import_string(self, node: ast.ImportFrom) -> str:
         """Get import string from AST node."""
-        module = node.module or ""
-        names = ", ".join([alias.name for alias in node.names])
-        return f"from {module} import {names}"
+        return _import_string(node)
     
     def validate_imports(self, file_path: str) -> Dict[str, Any]:
         """Validate imports in a Python file."""
@@ -153,27 +547,25 @@ class UnifiedValidator:
             return {"error": f"File not found: {file_path}"}
         
         try:
-            content = path.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=str(path))
+            records = _load_or_parse(path, self.use_cache)
             
             imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
+            for kind, module, names, line in records:
+                for name, asname in names:
+                    if kind == "import":
                         imports.append({
                             "type": "import",
-                            "module": alias.name,
-                            "alias": alias.asname,
-                            "line": node.lineno
+                            "module": name,
+                            "alias": asname,
+                            "line": line
                         })
-                elif isinstance(node, ast.ImportFrom):
-                    for alias in node.names:
+                    else:
                         imports.append({
                             "type": "from",
-                            "module": node.module or "",
-                            "name": alias.name,
-                            "alias": alias.asname,
-                            "line": node.lineno
+                            "module": module,
+                            "name": name,
+                            "alias": asname,
+                            "line": line
                         })
             
             return {
@@ -209,9 +601,8 @@ class UnifiedValidator:
         
         for tracker_file in tracker_files:
             try:
-                content = tracker_file.read_text(encoding="utf-8")
                 # Check for common issues
-                if "TODO" in content or "FIXME" in content:
+                if _contains_any(tracker_file, (b"TODO", b"FIXME")):
                     results["issues"].append({
                         "file": tracker_file.name,
                         "message": "Contains TODO/FIXME markers"
@@ -299,27 +690,29 @@ class UnifiedValidator:
             path = Path(file_path)
             if not path.is_absolute():
                 path = self.project_root / path
-            files_to_check = [path]
+            files_to_check = [str(path)]
         elif dir_path:
             path = Path(dir_path)
             if not path.is_absolute():
                 path = self.project_root / path
-            files_to_check = list(path.rglob("*.py"))
+            files_to_check = list(_iter_py(path))
         
-        for py_file in files_to_check:
+        for file_name in files_to_check:
+            py_file = Path(file_name)
             if not py_file.exists():
                 continue
             
             results["files_checked"] += 1
             try:
-                content = py_file.read_text(encoding="utf-8")
+                data = py_file.read_bytes()
                 
                 # Check for V2 compliance markers
-                is_v2 = "V2 Compliant" in content or "v2 compliant" in content.lower()
-                lines = len(content.splitlines())
+                is_v2 = b"V2 Compliant" in data or b"v2 compliant" in data.lower()
+                # Same as len(splitlines()) for \n and \r\n endings, without building the list
+                lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
                 
                 # Check for author if specified
-                if author and author not in content:
+                if author and author.encode("utf-8") not in data:
                     continue
                 
                 file_info = {
@@ -361,7 +754,7 @@ class UnifiedValidator:
             results["total_tools"] = len(list(tools_dir.glob("*.py")))
         
         if deprecated_dir.exists():
-            results["deprecated_tools"] = len(list(deprecated_dir.rglob("*.py")))
+            results["deprecated_tools"] = sum(1 for _ in _iter_py(deprecated_dir))
         
         # Find unified tools
         unified_pattern = tools_dir.glob("unified_*.py")
@@ -381,11 +774,16 @@ class UnifiedValidator:
         
         if queue_file.exists():
             try:
-                content = queue_file.read_text()
-                data = json.loads(content)
-                results["queue_size"] = len(data) if isinstance(data, list) else len(data.get("messages", []))
+                queue_size = None
+                if IJSON_AVAILABLE and queue_file.stat().st_size >= STREAM_QUEUE_MIN_BYTES:
+                    queue_size = _stream_queue_size(queue_file)
+                if queue_size is None:
+                    content = queue_file.read_text()
+                    data = json.loads(content)
+                    queue_size = len(data) if isinstance(data, list) else len(data.get("messages", []))
+                results["queue_size"] = queue_size
                 results["valid_json"] = True
-            except json.JSONDecodeError:
+            except _JSON_ERRORS:
                 results["valid_json"] = False
                 results["status"] = "INVALID_JSON"
             except Exception as e:
@@ -397,16 +795,27 @@ class UnifiedValidator:
         return results
     
     def validate_all(self) -> Dict[str, Any]:
-        """Run all validation categories."""
+        """
+        Run all validation categories.
+        
+        The validators read disjoint parts of the tree, so they run in
+        threads and their file I/O overlaps.
+        """
         results = {
             "timestamp": datetime.now().isoformat(),
             "validations": {}
         }
         
-        results["validations"]["ssot_config"] = self.validate_ssot_config()
-        results["validations"]["tracker"] = self.validate_tracker_status()
-        results["validations"]["consolidation"] = self.validate_consolidation()
-        results["validations"]["queue"] = self.validate_queue()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "ssot_config": executor.submit(self.validate_ssot_config),
+                "tracker": executor.submit(self.validate_tracker_status),
+                "consolidation": executor.submit(self.validate_consolidation),
+                "queue": executor.submit(self.validate_queue),
+            }
+            results["validations"] = {
+                category: future.result() for category, future in futures.items()
+            }
         
         # Summary
         all_valid = all(
@@ -470,17 +879,21 @@ def main():
     parser.add_argument("--all", action="store_true", help="Run all validations")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--jobs", "-j", type=int, help="Worker processes for ssot_config (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-scan every file, ignoring the parse cache and mtime index")
     
     args = parser.parse_args()
     
-    validator = UnifiedValidator()
+    validator = UnifiedValidator(use_cache=not args.no_cache)
     
     if args.all or args.category == "all":
         results = validator.validate_all()
     elif args.category == "ssot_config":
         file_path = Path(args.file) if args.file else None
         dir_path = Path(args.dir) if args.dir else None
-        results = validator.validate_ssot_config(file_path=file_path, dir_path=dir_path)
+        results = validator.validate_ssot_config(
+            file_path=file_path, dir_path=dir_path, jobs=args.jobs, incremental=True
+        )
     elif args.category == "imports":
         if not args.file:
             print("Error: --file required for imports validation")